@@ -0,0 +1,161 @@
+"""
+Modulul agregate contine totalurile salariale tinute la zi incremental.
+
+Registrul de angajati pastreaza un AgregatSalarii pentru toata compania si
+cate unul pentru fiecare departament; fiecare adaugare, modificare sau
+stergere actualizeaza doar agregatele afectate, deci rapoartele de totaluri
+nu mai parcurg toti angajatii.
+
+Suma neta nu este pastrata: depinde de regulile de salarizare in vigoare, care
+se pot schimba (salarizare.inregistreaza_regula), deci este calculata la cerere
+din salariile brute distincte ale grupului.
+"""
+
+import math
+from typing import Iterable
+import salarizare
+
+
+class AgregatSalarii:
+    """
+    Numar de angajati, suma bruta si salariul minim/maxim pentru un grup; suma neta se calculeaza la cerere.
+
+    Minimul si maximul sunt pastrate impreuna cu frecventa fiecarui salariu;
+    adaugarea este O(1), iar stergerea este O(1) cu exceptia cazului in care
+    dispare ultimul angajat cu salariul minim/maxim (atunci extremul este
+    recalculat din salariile distincte ale grupului).
+
+    Atribute:
+        numar (int): Numarul de angajati din grup.
+        total_brut (float): Suma salariilor brute.
+        minim (float | None): Cel mai mic salariu brut (None daca grupul e gol).
+        maxim (float | None): Cel mai mare salariu brut (None daca grupul e gol).
+
+    Proprietati:
+        total_net (float): Suma salariilor nete, calculata la fiecare citire cu
+                           regulile in vigoare (nu este pastrata in obiect).
+    """
+
+    __slots__ = ("numar", "total_brut", "minim", "maxim", "_frecvente")
+
+    def __init__(self, salarii: Iterable[float] = ()) -> None:
+        self.numar: int = 0
+        self.total_brut: float = 0.0
+        self.minim: float | None = None
+        self.maxim: float | None = None
+        self._frecvente: dict[float, int] = {}
+        for salar in salarii:
+            self.adauga(salar)
+
+    @classmethod
+    def din_frecvente(cls, frecvente: Iterable[tuple[float, int]]) -> "AgregatSalarii":
+        """
+        Construieste agregatul din perechi (salariu brut, numar de angajati).
+
+        Exemple:
+            AgregatSalarii.din_frecvente([(4050.0, 3), (6000.0, 1)]).numar -> 4
+
+        Args:
+            frecvente (Iterable[tuple[float, int]]): Salariile distincte si frecventa lor
+                                                     (ex: rezultatul unui GROUP BY salar).
+
+        Returns:
+            AgregatSalarii: Agregatul grupului.
+        """
+        agregat: AgregatSalarii = cls()
+        for salar, numar in frecvente:
+            salar = float(salar)
+            agregat._frecvente[salar] = agregat._frecvente.get(salar, 0) + numar
+            agregat.numar += numar
+            agregat.total_brut += salar * numar
+        if agregat._frecvente:
+            agregat.minim = min(agregat._frecvente)
+            agregat.maxim = max(agregat._frecvente)
+        return agregat
+
+    def adauga(self, salar: float) -> None:
+        """Adauga un salariu brut in grup."""
+        salar = float(salar)
+        self.numar += 1
+        self.total_brut += salar
+        self._frecvente[salar] = self._frecvente.get(salar, 0) + 1
+        if self.minim is None or salar < self.minim:
+            self.minim = salar
+        if self.maxim is None or salar > self.maxim:
+            self.maxim = salar
+
+    def adauga_lot(self, salarii: Iterable[float]) -> None:
+        """Adauga mai multe salarii brute in grup (minimul si maximul sunt actualizate o singura data)."""
+        noi: dict[float, int] = {}
+        for salar in salarii:
+            salar = float(salar)
+            noi[salar] = noi.get(salar, 0) + 1
+        if not noi:
+            return
+        for salar, numar in noi.items():
+            self._frecvente[salar] = self._frecvente.get(salar, 0) + numar
+            self.numar += numar
+            self.total_brut += salar * numar
+        minim: float = min(noi)
+        maxim: float = max(noi)
+        self.minim = minim if self.minim is None else min(self.minim, minim)
+        self.maxim = maxim if self.maxim is None else max(self.maxim, maxim)
+
+    def scoate(self, salar: float) -> None:
+        """Scoate un salariu brut din grup (salariul trebuie sa fi fost adaugat)."""
+        salar = float(salar)
+        self.numar -= 1
+        if not self.numar:
+            self.total_brut = 0.0
+            self.minim = self.maxim = None
+            self._frecvente.clear()
+            return
+        self.total_brut -= salar
+        ramase: int = self._frecvente[salar] - 1
+        if ramase:
+            self._frecvente[salar] = ramase
+            return
+        del self._frecvente[salar]
+        if salar == self.minim:
+            self.minim = min(self._frecvente)
+        if salar == self.maxim:
+            self.maxim = max(self._frecvente)
+
+    @property
+    def total_net(self) -> float:
+        """
+        Suma salariilor nete, calculata cu regulile in vigoare la momentul citirii.
+
+        Fiecare salariu brut distinct este calculat o singura data (din cache-ul
+        de fluturasi) si inmultit cu numarul de angajati care il au.
+        """
+        return math.fsum(salarizare.salariu_net(salar) * numar for salar, numar in self._frecvente.items())
+
+    def diferente(self, salarii: Iterable[float]) -> list[str]:
+        """
+        Compara agregatul cu o recalculare completa din salariile date.
+
+        Args:
+            salarii (Iterable[float]): Toate salariile brute ale grupului.
+
+        Returns:
+            list[str]: Descrierea fiecarei diferente (lista goala daca agregatul e corect).
+        """
+        control: list[float] = [float(salar) for salar in salarii]
+        asteptat: dict[str, float | None] = {
+            "numar": len(control),
+            "total_brut": math.fsum(control),
+            "total_net": math.fsum(salarizare.salariu_net(salar) for salar in control),
+            "minim": min(control, default=None),
+            "maxim": max(control, default=None),
+        }
+        diferente: list[str] = []
+        for camp, valoare in asteptat.items():
+            curent = getattr(self, camp)
+            if valoare is None or curent is None:
+                egale: bool = valoare is curent
+            else:
+                egale = math.isclose(curent, valoare, rel_tol=1e-9, abs_tol=0.01)
+            if not egale:
+                diferente.append(f"{camp}: agregat {curent} , recalculat {valoare}")
+        return diferente
@@ -0,0 +1,80 @@
+"""
+Modulul angajat defineste tipul Angajat, inregistrarea folosita in toata
+aplicatia pentru datele unui angajat.
+
+Clasa foloseste __slots__, deci fiecare angajat ocupa doar spatiul celor
+sapte campuri (fara dictionarul intern __dict__), iar accesul la campuri
+este mai rapid decat cautarea dupa cheie intr-un dictionar.
+
+Formatul JSON al fisierelor ramane o lista de dictionare; conversia se face
+cu Angajat.din_dict si Angajat.in_dict.
+"""
+
+
+class Angajat:
+    """
+    Datele unui angajat: cnp, nume, prenume, varsta, salar, departament, senioritate.
+
+    Exemple:
+        angajat = Angajat.din_dict({"cnp": "1111111111111", "nume": "Ion", ...})
+        angajat.salar = 5000.0
+        date = angajat.in_dict()
+    """
+
+    __slots__ = ("cnp", "nume", "prenume", "varsta", "salar", "departament", "senioritate")
+
+    def __init__(self, cnp: str, nume: str, prenume: str, varsta: int, salar: float, departament: str, senioritate: str) -> None:
+        self.cnp: str = cnp
+        self.nume: str = nume
+        self.prenume: str = prenume
+        self.varsta: int = varsta
+        self.salar: float = salar
+        self.departament: str = departament
+        self.senioritate: str = senioritate
+
+    @classmethod
+    def din_dict(cls, date: dict) -> "Angajat":
+        """
+        Construieste un angajat din dictionarul folosit in fisierele JSON.
+
+        Args:
+            date (dict): Dictionar cu cheile cnp, nume, prenume, varsta, salar,
+                         departament, senioritate.
+
+        Returns:
+            Angajat: Inregistrarea corespunzatoare.
+        """
+        return cls(date["cnp"], date["nume"], date["prenume"], date["varsta"], date["salar"], date["departament"], date["senioritate"])
+
+    def in_dict(self) -> dict:
+        """
+        Returneaza dictionarul folosit in fisierele JSON (aceeasi ordine a cheilor).
+
+        Returns:
+            dict: Datele angajatului ca dictionar.
+        """
+        return {
+            "cnp": self.cnp,
+            "nume": self.nume,
+            "prenume": self.prenume,
+            "varsta": self.varsta,
+            "salar": self.salar,
+            "departament": self.departament,
+            "senioritate": self.senioritate,
+        }
+
+    def copie(self) -> "Angajat":
+        """Returneaza o copie independenta a angajatului."""
+        return Angajat(self.cnp, self.nume, self.prenume, self.varsta, self.salar, self.departament, self.senioritate)
+
+    def __eq__(self, altul: object) -> bool:
+        if not isinstance(altul, Angajat):
+            return NotImplemented
+        return all(getattr(self, camp) == getattr(altul, camp) for camp in Angajat.__slots__)
+
+    def __hash__(self) -> int:
+        # CNP-ul identifica angajatul; nu se schimba CNP-ul unui angajat aflat intr-un set / cheie de dictionar
+        return hash(self.cnp)
+
+    def __repr__(self) -> str:
+        return f"Angajat({', '.join(f'{camp}={getattr(self, camp)!r}' for camp in Angajat.__slots__)})"
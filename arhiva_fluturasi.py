@@ -0,0 +1,370 @@
+"""
+Modulul arhiva_fluturasi implementeaza o arhiva unica pentru fluturasii de
+salariu (fluturasi.arh), in locul unui fisier JSON separat pentru fiecare CNP.
+
+Structura fisierului:
+- antet: semnatura si versiune
+- inregistrari: adaugate mereu la final; fiecare are un antet mic (lungimea
+  CNP-ului, lungimea datelor si o suma de control CRC32), CNP-ul si fluturasul
+  JSON comprimat cu zlib. O inregistrare fara date marcheaza stergerea
+  fluturasului acelui CNP.
+- index: CNP -> (pozitie, lungime) pentru ultima inregistrare a fiecarui CNP
+  si momentul exportului fiecarui fluturas, comprimat cu zlib
+- final: pozitia si lungimea indexului si o semnatura de sfarsit
+
+Un fluturas este citit direct de la pozitia lui din index, fara a decomprima
+restul arhivei. Inregistrarile noi sunt scrise peste indexul vechi, iar indexul
+si finalul sunt rescrise la inchiderea arhivei. Daca finalul lipseste (ex: o
+scriere intrerupta), indexul este reconstruit citind inregistrarile pana la
+prima inregistrare incompleta sau corupta. Fluturasii inlocuiti sau stersi
+raman in fisier pana la compactare (ArhivaFluturasi.compacteaza).
+
+Arhivele din versiunea 1 a formatului nu au momentele exportului in index;
+la citire se foloseste data modificarii arhivei, iar la prima salvare a
+indexului arhiva trece la versiunea 2. La fel, un index reconstruit (final
+lipsa) primeste data modificarii arhivei pentru fluturasii fara moment.
+"""
+
+import os
+import json
+import time
+import zlib
+import struct
+from array import array
+from typing import Iterator
+
+nume_arhiva: str = "fluturasi.arh"
+semnatura: bytes = b"FLAR"
+semnatura_final: bytes = b"FLIX"
+versiune_format: int = 2
+
+_antet = struct.Struct("<4sH")
+# lungime cnp, lungime date comprimate, crc32 (cnp + date)
+_antet_inregistrare = struct.Struct("<HII")
+# numar de intrari, lungimea textului cu CNP-uri
+_antet_index = struct.Struct("<II")
+# pozitia indexului, lungimea indexului, semnatura de sfarsit
+_final = struct.Struct("<QI4s")
+
+# dictionar prestabilit pentru zlib: numele campurilor apar in fiecare fluturas,
+# iar o singura inregistrare este prea mica pentru a le comprima eficient
+_dictionar: bytes = b'{"Nume":"","Prenume":"","CNP":"","Departament":"","Salariu brut":,"Cas (25%)":,"Cass (10%)":,"Impozit (10%)":,"Salariu net":}'
+
+
+def comprima(date: dict) -> bytes:
+    """Serializeaza un fluturas in JSON compact si il comprima cu dictionarul prestabilit."""
+    comprimator = zlib.compressobj(zdict=_dictionar)
+    text: bytes = json.dumps(date, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return comprimator.compress(text) + comprimator.flush()
+
+
+def decomprima(date: bytes) -> dict:
+    """Operatia inversa lui comprima."""
+    decomprimator = zlib.decompressobj(zdict=_dictionar)
+    return json.loads(decomprimator.decompress(date) + decomprimator.flush())
+
+
+class ArhivaFluturasi:
+    """
+    Arhiva cu acces direct, dupa CNP, la fluturasii de salariu.
+
+    Exemple:
+        with ArhivaFluturasi() as arhiva:
+            arhiva.scrie("1234567890123", date_fluturas)
+            arhiva.citeste("1234567890123")   -> dict sau None
+
+    Atribute:
+        cale (str): Fisierul arhivei (creat daca nu exista).
+    """
+
+    def __init__(self, cale: str = nume_arhiva) -> None:
+        self.cale: str = cale
+        self._index: dict[str, tuple[int, int]] = {}
+        # CNP -> momentul exportului (timestamp), pentru fluturasii din index
+        self._momente: dict[str, float] = {}
+        self._versiune: int = versiune_format
+        # pozitia la care se scrie urmatoarea inregistrare (inceputul indexului)
+        self._sfarsit: int = _antet.size
+        self._modificat: bool = False
+        self._la_sfarsit: bool = False
+        if os.path.exists(cale):
+            self._fisier = open(cale, "r+b")
+            self._citeste_index()
+        else:
+            self._fisier = open(cale, "w+b")
+            self._fisier.write(_antet.pack(semnatura, versiune_format))
+            self._modificat = True
+
+    def __enter__(self) -> "ArhivaFluturasi":
+        return self
+
+    def __exit__(self, *exceptie) -> None:
+        self.inchide()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, cnp: str) -> bool:
+        return cnp in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Itereaza CNP-urile care au fluturas in arhiva."""
+        return iter(list(self._index))
+
+    def pozitii(self) -> dict[str, tuple[int, int]]:
+        """Returneaza o copie a indexului: CNP -> (pozitie, lungime) a fluturasului comprimat."""
+        return dict(self._index)
+
+    def momente(self) -> dict[str, float]:
+        """Returneaza CNP -> momentul exportului (timestamp) pentru fiecare fluturas din arhiva."""
+        return dict(self._momente)
+
+    @property
+    def octeti_morti(self) -> int:
+        """Octetii ocupati de fluturasi inlocuiti sau stersi (recuperati la compactare)."""
+        vii: int = sum(_antet_inregistrare.size + len(cnp.encode("utf-8")) + lungime for cnp, (_, lungime) in self._index.items())
+        return self._sfarsit - _antet.size - vii
+
+    def _citeste_index(self) -> None:
+        antet: bytes = self._fisier.read(_antet.size)
+        if len(antet) < _antet.size or _antet.unpack(antet)[0] != semnatura:
+            raise ValueError(f"{self.cale} nu este o arhiva de fluturasi")
+        self._versiune = _antet.unpack(antet)[1]
+        if self._versiune not in (1, versiune_format):
+            raise ValueError(f"versiune de arhiva necunoscuta: {self._versiune}")
+
+        marime: int = self._fisier.seek(0, os.SEEK_END)
+        if marime >= _antet.size + _final.size:
+            self._fisier.seek(marime - _final.size)
+            pozitie, lungime, semnatura_citita = _final.unpack(self._fisier.read(_final.size))
+            if semnatura_citita == semnatura_final and pozitie + lungime + _final.size == marime:
+                self._fisier.seek(pozitie)
+                try:
+                    self._index, momente = self._decodifica_index(zlib.decompress(self._fisier.read(lungime)), self._versiune > 1)
+                    self._momente = momente if momente is not None else dict.fromkeys(self._index, os.path.getmtime(self.cale))
+                    self._sfarsit = pozitie
+                    return
+                except (zlib.error, struct.error, ValueError):
+                    pass
+        self._reconstruieste_index(marime)
+
+    def _reconstruieste_index(self, marime: int) -> None:
+        """Reconstruieste indexul citind inregistrarile (arhiva fara final valid)."""
+        self._index = {}
+        moment_arhiva: float = os.path.getmtime(self.cale)
+        pozitie: int = _antet.size
+        self._fisier.seek(pozitie)
+        while pozitie + _antet_inregistrare.size <= marime:
+            lungime_cnp, lungime, suma = _antet_inregistrare.unpack(self._fisier.read(_antet_inregistrare.size))
+            inceput_date: int = pozitie + _antet_inregistrare.size + lungime_cnp
+            if inceput_date + lungime > marime:
+                break
+            cnp_octeti: bytes = self._fisier.read(lungime_cnp)
+            date: bytes = self._fisier.read(lungime)
+            if zlib.crc32(date, zlib.crc32(cnp_octeti)) != suma:
+                break
+            cnp: str = cnp_octeti.decode("utf-8", "replace")
+            if lungime:
+                self._index[cnp] = (inceput_date, lungime)
+            else:
+                self._index.pop(cnp, None)
+            pozitie = inceput_date + lungime
+        # momentele exportului erau doar in indexul pierdut
+        self._momente = {cnp: self._momente.get(cnp, moment_arhiva) for cnp in self._index}
+        # ce urmeaza dupa ultima inregistrare valida este suprascris la inchidere
+        self._sfarsit = pozitie
+        self._modificat = True
+
+    @staticmethod
+    def _codifica_index(index: dict[str, tuple[int, int]], momente: dict[str, float]) -> bytes:
+        text: bytes = "\n".join(index).encode("utf-8")
+        pozitii: array = array("Q", (pozitie for pozitie, _ in index.values()))
+        lungimi: array = array("I", (lungime for _, lungime in index.values()))
+        exportate: array = array("d", (momente.get(cnp, 0.0) for cnp in index))
+        return zlib.compress(_antet_index.pack(len(index), len(text)) + text + pozitii.tobytes() + lungimi.tobytes() + exportate.tobytes())
+
+    @staticmethod
+    def _decodifica_index(date: bytes, cu_momente: bool = True) -> tuple[dict[str, tuple[int, int]], dict[str, float] | None]:
+        numar, lungime_text = _antet_index.unpack_from(date)
+        pozitie: int = _antet_index.size
+        cnp_uri: list[str] = date[pozitie:pozitie + lungime_text].decode("utf-8").split("\n") if numar else []
+        pozitie += lungime_text
+        pozitii: array = array("Q")
+        pozitii.frombytes(date[pozitie:pozitie + numar * pozitii.itemsize])
+        pozitie += numar * pozitii.itemsize
+        lungimi: array = array("I")
+        lungimi.frombytes(date[pozitie:pozitie + numar * lungimi.itemsize])
+        pozitie += numar * lungimi.itemsize
+        if not len(cnp_uri) == len(pozitii) == len(lungimi) == numar:
+            raise ValueError("index de arhiva incomplet")
+        if not cu_momente:
+            return dict(zip(cnp_uri, zip(pozitii, lungimi))), None
+        exportate: array = array("d")
+        exportate.frombytes(date[pozitie:pozitie + numar * exportate.itemsize])
+        if len(exportate) != numar:
+            raise ValueError("index de arhiva incomplet")
+        return dict(zip(cnp_uri, zip(pozitii, lungimi))), dict(zip(cnp_uri, exportate))
+
+    def _adauga_inregistrare(self, cnp: str, date: bytes) -> int:
+        cnp_octeti: bytes = cnp.encode("utf-8")
+        if not self._la_sfarsit:
+            self._fisier.seek(self._sfarsit)
+            self._la_sfarsit = True
+        try:
+            self._fisier.write(_antet_inregistrare.pack(len(cnp_octeti), len(date), zlib.crc32(date, zlib.crc32(cnp_octeti))))
+            self._fisier.write(cnp_octeti)
+            self._fisier.write(date)
+        except OSError:
+            # o inregistrare scrisa partial este suprascrisa de urmatoarea
+            self._la_sfarsit = False
+            raise
+        inceput_date: int = self._sfarsit + _antet_inregistrare.size + len(cnp_octeti)
+        self._sfarsit = inceput_date + len(date)
+        self._modificat = True
+        return inceput_date
+
+    def citeste(self, cnp: str) -> dict | None:
+        """
+        Citeste fluturasul unui CNP, decomprimand doar inregistrarea lui.
+
+        Args:
+            cnp (str): CNP-ul angajatului.
+
+        Returns:
+            dict | None: Continutul fluturasului sau None daca nu exista in arhiva.
+        """
+        pozitie: tuple[int, int] | None = self._index.get(cnp)
+        if pozitie is None:
+            return None
+        self._fisier.seek(pozitie[0])
+        self._la_sfarsit = False
+        return decomprima(self._fisier.read(pozitie[1]))
+
+    def scrie(self, cnp: str, date: dict) -> None:
+        """
+        Adauga (sau inlocuieste) fluturasul unui CNP.
+
+        Args:
+            cnp (str): CNP-ul angajatului.
+            date (dict): Continutul fluturasului (serializabil JSON).
+        """
+        self.scrie_comprimat(cnp, comprima(date))
+
+    def scrie_comprimat(self, cnp: str, date: bytes, moment: float | None = None) -> None:
+        """
+        Ca scrie, pentru un fluturas deja comprimat cu comprima (ex: de un fir de lucru).
+
+        Args:
+            cnp (str): CNP-ul angajatului.
+            date (bytes): Fluturasul comprimat.
+            moment (float | None): Momentul exportului (implicit acum); pastrat la
+                                   compactare sau la conversia din fisiere.
+        """
+        lungime: int = len(date)
+        self._index[cnp] = (self._adauga_inregistrare(cnp, date), lungime)
+        self._momente[cnp] = time.time() if moment is None else moment
+
+    def sterge(self, cnp: str) -> bool:
+        """
+        Sterge fluturasul unui CNP (se adauga o inregistrare de stergere).
+
+        Returns:
+            bool: True daca fluturasul exista.
+        """
+        if cnp not in self._index:
+            return False
+        self._adauga_inregistrare(cnp, b"")
+        del self._index[cnp]
+        self._momente.pop(cnp, None)
+        return True
+
+    def salveaza_index(self) -> None:
+        """Scrie indexul si finalul dupa ultima inregistrare (apelata si de inchide)."""
+        if not self._modificat:
+            return
+        if self._versiune != versiune_format:
+            # inregistrarile nu s-au schimbat intre versiuni, doar indexul
+            self._fisier.seek(0)
+            self._fisier.write(_antet.pack(semnatura, versiune_format))
+            self._versiune = versiune_format
+        index: bytes = self._codifica_index(self._index, self._momente)
+        self._fisier.seek(self._sfarsit)
+        self._fisier.write(index)
+        self._fisier.write(_final.pack(self._sfarsit, len(index), semnatura_final))
+        self._fisier.truncate()
+        self._fisier.flush()
+        self._la_sfarsit = False
+        self._modificat = False
+
+    def inchide(self) -> None:
+        """Salveaza indexul (daca arhiva a fost modificata) si inchide fisierul."""
+        if not self._fisier.closed:
+            self.salveaza_index()
+            self._fisier.close()
+
+    def compacteaza(self) -> int:
+        """
+        Rescrie arhiva doar cu fluturasii actuali, eliminand inregistrarile inlocuite sau sterse.
+
+        Inregistrarile sunt copiate comprimate (fara decomprimare), intr-un
+        fisier temporar redenumit la final.
+
+        Returns:
+            int: Numarul de octeti recuperati.
+        """
+        self.salveaza_index()
+        marime_veche: int = os.path.getsize(self.cale)
+        cale_temporara: str = self.cale + ".tmp"
+        if os.path.exists(cale_temporara):
+            os.remove(cale_temporara)
+        with ArhivaFluturasi(cale_temporara) as noua:
+            for cnp, (pozitie, lungime) in sorted(self._index.items(), key=lambda intrare: intrare[1][0]):
+                self._fisier.seek(pozitie)
+                noua.scrie_comprimat(cnp, self._fisier.read(lungime), self._momente.get(cnp))
+        self._fisier.close()
+        os.replace(cale_temporara, self.cale)
+        self._fisier = open(self.cale, "r+b")
+        self._la_sfarsit = False
+        self._citeste_index()
+        return marime_veche - os.path.getsize(self.cale)
+
+
+def converteste_din_folder(folder: str, cale: str = nume_arhiva, sterge_fisiere: bool = False) -> tuple[int, list[str]]:
+    """
+    Muta fluturasii din formatul vechi (cate un fisier fluturas_{CNP}.json) in arhiva.
+
+    Fluturasii deja existenti in arhiva pentru acelasi CNP sunt inlocuiti.
+    Fisierele sunt sterse (daca se cere) abia dupa ce arhiva a fost inchisa
+    cu succes.
+
+    Exemple:
+        convertiti, nevalide = converteste_din_folder("fluturasi_angajati")
+
+    Args:
+        folder (str): Folderul cu fisierele fluturas_{CNP}.json.
+        cale (str): Fisierul arhivei (creat daca nu exista).
+        sterge_fisiere (bool): Sterge fisierele convertite.
+
+    Returns:
+        tuple[int, list[str]]: Numarul de fluturasi convertiti si fisierele care
+                               nu au putut fi citite (lasate neatinse).
+    """
+    convertite: list[str] = []
+    nevalide: list[str] = []
+    with ArhivaFluturasi(cale) as arhiva, os.scandir(folder) as intrari:
+        for intrare in intrari:
+            if not (intrare.is_file() and intrare.name.startswith("fluturas_") and intrare.name.endswith(".json")):
+                continue
+            try:
+                with open(intrare.path, "r", encoding="utf-8") as my_file:
+                    date: dict = json.load(my_file)
+            except (OSError, ValueError):
+                nevalide.append(intrare.path)
+                continue
+            arhiva.scrie_comprimat(intrare.name[len("fluturas_"):-len(".json")], comprima(date), intrare.stat().st_mtime)
+            convertite.append(intrare.path)
+    if sterge_fisiere:
+        for cale_fisier in convertite:
+            os.remove(cale_fisier)
+    return len(convertite), nevalide
+
@@ -7,12 +7,20 @@ Acest modul este responsabil pentru:
 - Calcularea fluturasului de salariu (brut -> net)
 - Filtrarea si calcularea pe departamente
 """
+import os
 import stil
 import validari
 import exportare
+import salarizare
+from angajat import Angajat
+from registru import RegistruAngajati
+from agregate import AgregatSalarii
+from typing import Iterable
 
+verificare_agregate: bool = os.environ.get("ANGAJATI_VERIFICA_AGREGATE") == "1"
 
-def obtine_total_salarii(angajati: list[dict]) -> float:
+
+def obtine_total_salarii(angajati: Iterable[Angajat]) -> float:
     """
     Calculeaza suma totala a salariilor brute ale tuturor angajatilor.
     
@@ -27,22 +35,29 @@ def obtine_total_salarii(angajati: list[dict]) -> float:
         3 angajati cu salarii [4050, 5000, 6000] -> 15050.0
     
     Args:
-        angajati (list[dict]): Lista de angajati care contin campul 'salar'.
+        angajati (Iterable[Angajat]): Lista de angajati
+                                   sau un flux (ex: incarcare_salvare.itereaza_angajati).
         
     Returns:
         float: Suma totala a tuturor salariilor din lista.
         
+    Pentru registrul aplicatiei, suma este citita din agregatul companiei,
+    tinut la zi la fiecare modificare (O(1)).
+    
     Note:
         - Functia nu afiseaza nimic, doar returneaza valoarea
         - Salariile sunt convertite la float pentru precizie
         - Lista goala returneaza 0.0
     """
+    if isinstance(angajati, RegistruAngajati):
+        return round(angajati.agregat_companie.total_brut, 2)
+
     total: float = 0.0
     for persoana in angajati:
-        total += float(persoana['salar'])
+        total += float(persoana.salar)
     return total
 
-def calcul_total_salarii_departament(angajati: list[dict]) -> None:
+def calcul_total_salarii_departament(angajati: RegistruAngajati) -> None:
     """
     Calculeaza si afiseaza totalul salariilor pentru un departament specific.
     
@@ -57,7 +72,7 @@ def calcul_total_salarii_departament(angajati: list[dict]) -> None:
     Comparatia departamentelor este case-insensitive.
     
     Args:
-        angajati (list[dict]): Lista de angajati pentru calcul.
+        angajati (RegistruAngajati): Lista de angajati pentru calcul.
         
     Returns:
         None: Functia afiseaza rezultatul direct in consola.
@@ -66,11 +81,13 @@ def calcul_total_salarii_departament(angajati: list[dict]) -> None:
         - Utilizatorul poate crea un departament nou daca nu exista
         - Totalul este calculat pe salariile brute
         - Departamentul este cautat dupa nume exact (dupa convertire la uppercase)
+        - Totalul este citit din agregatul departamentului, tinut la zi la
+          fiecare modificare, deci raspunsul este instant
     """
     stil.titlu(" ---> Calcul total salarii departament ")
 
 
-    departamente_disponibile: set = set(persoana["departament"] for persoana in angajati)
+    departamente_disponibile: set = angajati.departamente()
     while True:
 
         cautare_departament: str = input(f"Introdu un departament disponibil {stil.GALBEN}{departamente_disponibile}{stil.RESET} sau {stil.GALBEN}'0'{stil.RESET} pentru meniu:  ").strip().upper()
@@ -84,27 +101,64 @@ def calcul_total_salarii_departament(angajati: list[dict]) -> None:
             stil.atentionare(f"Nu exista nici un departament cu numele -> {stil.evidentiaza(cautare_departament)}")
             continue
 
-        total: float = 0
-        gasit: bool = False
-
-        for persoane in angajati:
-            if persoane["departament"].upper() == cautare_departament:
-                total += float(persoane["salar"])
-                gasit = True
-        if gasit:
-            stil.succes(f"Costul total pentru departamentul {cautare_departament} este de : {total} RON")
+        agregat: AgregatSalarii = angajati.agregat_departament(cautare_departament)
+        if agregat.numar:
+            stil.succes(f"Costul total pentru departamentul {cautare_departament} este de : {round(agregat.total_brut, 2)} RON")
+            afiseaza_detalii_agregat(agregat)
+            if verificare_agregate:
+                verifica_agregate(angajati)
             return
         else:
             stil.info("Departament negasit!")
 
 
-def calcul_fluturas_salariu(angajati: list[dict]) -> None:
+def afiseaza_detalii_agregat(agregat: AgregatSalarii) -> None:
+    """
+    Afiseaza numarul de angajati, totalul net si salariul minim/maxim dintr-un agregat.
+
+    Args:
+        agregat (AgregatSalarii): Agregatul companiei sau al unui departament.
+
+    Returns:
+        None: Functia afiseaza direct in consola.
+    """
+    if not agregat.numar:
+        return
+    stil.info(f"Angajati: {agregat.numar} | Total net: {agregat.total_net:.2f} RON | Salariu minim: {agregat.minim} RON | Salariu maxim: {agregat.maxim} RON")
+
+
+def verifica_agregate(angajati: RegistruAngajati) -> bool:
+    """
+    Verifica agregatele tinute la zi fata de o recalculare completa.
+
+    Este modul de verificare al optiunilor 6 si 7, activat cu variabila de
+    mediu ANGAJATI_VERIFICA_AGREGATE=1. Recalcularea parcurge toti angajatii,
+    deci este folosita doar pentru control, nu pentru raportare.
+
+    Args:
+        angajati (RegistruAngajati): Registrul verificat.
+
+    Returns:
+        bool: True daca toate agregatele sunt corecte.
+    """
+    diferente: dict[str, list[str]] = angajati.verifica_agregate()
+    if not diferente:
+        stil.succes("Verificare agregate: totalurile corespund recalcularii complete")
+        return True
+    for grup, mesaje in diferente.items():
+        for mesaj in mesaje:
+            stil.eroare(f"Verificare agregate [{grup}] -> {mesaj}")
+    return False
+
+
+def calcul_fluturas_salariu(angajati: RegistruAngajati) -> None:
     """
     Calculeaza si afiseaza fluturasul de salariu detaliat pentru un angajat.
     
-    Fluturasul include urmatoarele calcule conform legislatiei din Romania:
-    - CAS (Contributia Asigurari Sociale): 10% din brut
-    - CASS (Contributia Asigurari Sociale Sanatate): 25% din brut
+    Fluturasul este calculat de motorul unic de salarizare (modulul salarizare),
+    dupa regulile in vigoare:
+    - CAS (Contributia Asigurari Sociale): 25% din brut
+    - CASS (Contributia Asigurari Sociale Sanatate): 10% din brut
     - Impozit: 10% din baza de calcul (brut - CAS - CASS)
     - Salariu Net: brut - CAS - CASS - Impozit
     
@@ -113,7 +167,7 @@ def calcul_fluturas_salariu(angajati: list[dict]) -> None:
     - Anuleze exportul
     
     Args:
-        angajati (list[dict]): Lista de angajati in care se cauta angajatul.
+        angajati (RegistruAngajati): Lista de angajati in care se cauta angajatul.
         
     Returns:
         None: Functia afiseaza fluturasul si optional exporta in fisier.
@@ -128,27 +182,23 @@ def calcul_fluturas_salariu(angajati: list[dict]) -> None:
         cnp: str = validari.cere_cnp_valid()
         if cnp == "0":
             return
-        for persoana in angajati:
-            if persoana["cnp"] == cnp:
-                brut: float = float(persoana["salar"])
-                cas: float = brut * 0.10
-                cass: float = brut * 0.25
-                impozitare_baza: float = brut - cas - cass
-                impozit: float = impozitare_baza * 0.10
-                net: float = brut - cas - cass - impozit
-                print("")
-                stil.titlu(f"Fluturas salarial pentru {persoana['nume']} {persoana['prenume']}\n Salariu Brut: {brut:.2f} RON \n CAS(10%): {cas:.2f} RON \n CASS(25%): {cass:.2f} RON \n Impozit(10%): {impozit:.2f} RON \n Salariu: {net:.2f} RON")
-                while True:
-                    raspuns: str = input(f"\nDoriti sa exportati acest fluturas in format JSON {stil.GALBEN}(da/nu){stil.RESET}: ").strip().lower()
-                    if raspuns.isalpha() and raspuns == "da":
-                        exportare.actualizare_fluturas_fisier(persoana)
-                        stil.succes(f"Fluturasul a fost salvat in folderul 'fluturasi_angajati' ")
-                        break
-                    elif raspuns == "nu":
-                        stil.info("Exportare a fost anulata!")
-                        break
-                    else:
-                        stil.atentionare("Te rugam sa introduci doar (da/nu)")
-                return
+        persoana: Angajat | None = angajati.cauta(cnp)
+        if persoana is not None:
+            fluturas: salarizare.Fluturas = salarizare.calculeaza_fluturas(persoana.salar)
+            regula: salarizare.RegulaSalarizare = fluturas.regula
+            print("")
+            stil.titlu(f"Fluturas salarial pentru {persoana.nume} {persoana.prenume}\n Salariu Brut: {fluturas.brut:.2f} RON \n CAS({regula.cota_cas:.0%}): {fluturas.cas:.2f} RON \n CASS({regula.cota_cass:.0%}): {fluturas.cass:.2f} RON \n Impozit({regula.cota_impozit:.0%}): {fluturas.impozit:.2f} RON \n Salariu: {fluturas.net:.2f} RON")
+            while True:
+                raspuns: str = input(f"\nDoriti sa exportati acest fluturas in format JSON {stil.GALBEN}(da/nu){stil.RESET}: ").strip().lower()
+                if raspuns.isalpha() and raspuns == "da":
+                    exportare.actualizare_fluturas_fisier(persoana)
+                    stil.succes(f"Fluturasul a fost salvat in folderul 'fluturasi_angajati' ")
+                    break
+                elif raspuns == "nu":
+                    stil.info("Exportare a fost anulata!")
+                    break
+                else:
+                    stil.atentionare("Te rugam sa introduci doar (da/nu)")
+            return
                              
         stil.atentionare(f"Nu am gasit nici un angajat cu CNP-ul '{cnp}' ")
@@ -0,0 +1,356 @@
+"""
+Modulul catalog_fluturasi tine un catalog al fluturasilor exportati:
+CNP -> locatie, momentul exportului, salariul net, departament si nume.
+
+Catalogul este salvat langa fluturasi (fluturasi_angajati/catalog.json sau
+fluturasi.arh.catalog.json) si este reimprospatat incremental: pentru fiecare
+fluturas se pastreaza o stampila a versiunii lui (mtime si marimea fisierului,
+respectiv pozitia si lungimea inregistrarii din arhiva), iar un fluturas este
+recitit doar daca stampila s-a schimbat. Astfel, intrebari ca "ce angajati nu
+au fluturas luna aceasta?" sau "toti fluturasii din IT" nu mai deschid mii de
+fisiere.
+
+Fluturasii cititi sunt pastrati intr-un cache LRU marginit, validat tot prin
+stampila, deci un fluturas rescris intre timp nu este servit din cache.
+"""
+
+import os
+import json
+import time
+from collections import OrderedDict
+import arhiva_fluturasi
+from angajat import Angajat
+from typing import Iterable, Iterator
+
+capacitate_cache_implicita: int = 1024
+
+
+class IntrareCatalog:
+    """
+    Un fluturas exportat, asa cum apare in catalog.
+
+    Atribute:
+        cnp (str): CNP-ul angajatului.
+        locatie (str): Fisierul fluturasului (sau "arhiva#CNP").
+        exportat (float): Momentul exportului (timestamp), din data fisierului
+                          sau, in arhiva, din indexul arhivei.
+        net (float | None): Salariul net de pe fluturas.
+        departament (str): Departamentul de pe fluturas.
+        nume (str): Numele si prenumele de pe fluturas.
+        stampila (tuple[int, int]): Versiunea fluturasului (mtime_ns si marime,
+                                    respectiv pozitie si lungime in arhiva).
+    """
+
+    __slots__ = ("cnp", "locatie", "exportat", "net", "departament", "nume", "stampila")
+
+    def __init__(self, cnp: str, locatie: str, exportat: float, net: float | None, departament: str, nume: str, stampila: tuple[int, int]) -> None:
+        self.cnp: str = cnp
+        self.locatie: str = locatie
+        self.exportat: float = exportat
+        self.net: float | None = net
+        self.departament: str = departament
+        self.nume: str = nume
+        self.stampila: tuple[int, int] = stampila
+
+    @classmethod
+    def din_fluturas(cls, cnp: str, locatie: str, exportat: float, date: dict, stampila: tuple[int, int]) -> "IntrareCatalog":
+        """Construieste intrarea din continutul unui fluturas."""
+        nume: str = f"{date.get('Nume', '')} {date.get('Prenume', '')}".strip()
+        return cls(cnp, locatie, exportat, date.get("Salariu net"), date.get("Departament", ""), nume, stampila)
+
+    def in_lista(self) -> list:
+        return [self.locatie, self.exportat, self.net, self.departament, self.nume, *self.stampila]
+
+    @classmethod
+    def din_lista(cls, cnp: str, valori: list) -> "IntrareCatalog":
+        locatie, exportat, net, departament, nume, *stampila = valori
+        return cls(cnp, locatie, exportat, net, departament, nume, tuple(stampila))
+
+    def __repr__(self) -> str:
+        return f"IntrareCatalog({self.cnp!r}, {self.departament!r}, net={self.net}, exportat={time.strftime('%Y-%m-%d %H:%M', time.localtime(self.exportat))})"
+
+
+def inceput_luna(luna: str | None = None) -> float:
+    """
+    Returneaza momentul (timestamp, ora locala) de inceput al unei luni.
+
+    Exemple:
+        inceput_luna("2025-03") -> timestamp pentru 2025-03-01 00:00
+
+    Args:
+        luna (str | None): Luna, "AAAA-LL" (implicit luna curenta).
+
+    Returns:
+        float: Timestamp-ul primei secunde din luna.
+
+    Raises:
+        ValueError: Daca luna nu are formatul "AAAA-LL".
+    """
+    an, numar_luna = (int(parte) for parte in (luna or time.strftime("%Y-%m")).split("-"))
+    if not 1 <= numar_luna <= 12:
+        raise ValueError(f"luna invalida: {luna}")
+    return time.mktime((an, numar_luna, 1, 0, 0, 0, 0, 0, -1))
+
+
+class CatalogFluturasi:
+    """
+    Catalogul fluturasilor dintr-un folder (fluturas_{CNP}.json) sau dintr-o arhiva.
+
+    Exemple:
+        catalog = CatalogFluturasi(folder="fluturasi_angajati")
+        catalog.reimprospateaza()
+        catalog.din_departament("IT")
+        catalog.fara_fluturas(registru, "2025-03")
+        catalog.citeste("1234567890123")   -> dict sau None
+
+    Atribute:
+        folder (str | None): Folderul cu fluturasi (modul "fisiere").
+        cale_arhiva (str | None): Arhiva de fluturasi (modul "arhiva").
+        cale (str): Fisierul in care este salvat catalogul.
+        capacitate_cache (int): Numarul maxim de fluturasi pastrati in cache.
+    """
+
+    def __init__(self, folder: str | None = None, cale_arhiva: str | None = None, capacitate_cache: int = capacitate_cache_implicita) -> None:
+        """
+        Args:
+            folder (str | None): Folderul cu fluturasi.
+            cale_arhiva (str | None): Arhiva de fluturasi (se da exact una dintre surse).
+            capacitate_cache (int): Marimea cache-ului de fluturasi cititi.
+
+        Raises:
+            ValueError: Daca nu este data exact una dintre surse.
+        """
+        if (folder is None) == (cale_arhiva is None):
+            raise ValueError("catalogul are nevoie de un folder sau de o arhiva")
+        self.folder: str | None = folder
+        self.cale_arhiva: str | None = cale_arhiva
+        self.cale: str = f"{folder}/catalog.json" if folder is not None else f"{cale_arhiva}.catalog.json"
+        self.capacitate_cache: int = capacitate_cache
+        self._intrari: dict[str, IntrareCatalog] = {}
+        self._cache: OrderedDict[str, tuple[tuple[int, int], dict]] = OrderedDict()
+        self._reusite: int = 0
+        self._ratari: int = 0
+        self._modificat: bool = False
+        # indexul arhivei si stampila fisierului arhivei din care a fost citit
+        self._index_arhiva: dict[str, tuple[int, int]] = {}
+        self._stampila_arhiva: tuple[int, int] | None = None
+        self._momente_arhiva: dict[str, float] = {}
+        self._incarca()
+
+    def __len__(self) -> int:
+        return len(self._intrari)
+
+    def __iter__(self) -> Iterator[IntrareCatalog]:
+        return iter(list(self._intrari.values()))
+
+    def _incarca(self) -> None:
+        try:
+            with open(self.cale, "r", encoding="utf-8") as my_file:
+                self._intrari = {cnp: IntrareCatalog.din_lista(cnp, valori) for cnp, valori in json.load(my_file).items()}
+        except (OSError, ValueError, TypeError):
+            self._intrari = {}
+
+    def salveaza(self) -> None:
+        """Scrie catalogul pe disk (doar daca s-a schimbat), printr-un fisier temporar."""
+        if not self._modificat:
+            return
+        os.makedirs(os.path.dirname(self.cale) or ".", exist_ok=True)
+        with open(self.cale + ".tmp", "w", encoding="utf-8") as my_file:
+            json.dump({cnp: intrare.in_lista() for cnp, intrare in self._intrari.items()}, my_file, separators=(",", ":"), ensure_ascii=False)
+        os.replace(self.cale + ".tmp", self.cale)
+        self._modificat = False
+
+    def _cale_fisier(self, cnp: str) -> str:
+        return f"{self.folder}/fluturas_{cnp}.json"
+
+    def _actualizeaza_index_arhiva(self) -> None:
+        """Reciteste indexul arhivei (pozitii si momentele exportului) daca fisierul ei s-a schimbat."""
+        try:
+            informatii: os.stat_result = os.stat(self.cale_arhiva)
+        except OSError:
+            self._index_arhiva, self._momente_arhiva, self._stampila_arhiva = {}, {}, None
+            return
+        stampila: tuple[int, int] = (informatii.st_mtime_ns, informatii.st_size)
+        if stampila != self._stampila_arhiva:
+            with arhiva_fluturasi.ArhivaFluturasi(self.cale_arhiva) as arhiva:
+                self._index_arhiva = arhiva.pozitii()
+                self._momente_arhiva = arhiva.momente()
+            self._stampila_arhiva = stampila
+
+    def _citeste_sursa(self, cnp: str, stampila: tuple[int, int]) -> dict:
+        if self.folder is not None:
+            with open(self._cale_fisier(cnp), "r") as my_file:
+                return json.load(my_file)
+        with open(self.cale_arhiva, "rb") as my_file:
+            my_file.seek(stampila[0])
+            return arhiva_fluturasi.decomprima(my_file.read(stampila[1]))
+
+    def _memoreaza(self, cnp: str, stampila: tuple[int, int], date: dict) -> None:
+        self._cache[cnp] = (stampila, date)
+        self._cache.move_to_end(cnp)
+        if len(self._cache) > self.capacitate_cache:
+            self._cache.popitem(last=False)
+
+    def _valideaza(self, cnp: str) -> tuple[IntrareCatalog | None, dict | None]:
+        """Verifica stampila unui singur fluturas; returneaza intrarea si continutul, daca a fost recitit."""
+        if self.folder is not None:
+            cale: str = self._cale_fisier(cnp)
+            try:
+                informatii: os.stat_result = os.stat(cale)
+            except OSError:
+                informatii = None
+            stampila: tuple[int, int] | None = (informatii.st_mtime_ns, informatii.st_size) if informatii else None
+            exportat: float = informatii.st_mtime if informatii else 0.0
+        else:
+            self._actualizeaza_index_arhiva()
+            stampila = self._index_arhiva.get(cnp)
+            exportat = self._momente_arhiva.get(cnp, 0.0)
+            cale = f"{self.cale_arhiva}#{cnp}"
+
+        intrare: IntrareCatalog | None = self._intrari.get(cnp)
+        if stampila is None:
+            if intrare is not None:
+                del self._intrari[cnp]
+                self._cache.pop(cnp, None)
+                self._modificat = True
+            return None, None
+        if intrare is not None and intrare.stampila == stampila:
+            return intrare, None
+        try:
+            date: dict = self._citeste_sursa(cnp, stampila)
+        except (OSError, ValueError):
+            return None, None
+        intrare = self._intrari[cnp] = IntrareCatalog.din_fluturas(cnp, cale, exportat, date, stampila)
+        self._modificat = True
+        return intrare, date
+
+    def intrare(self, cnp: str) -> IntrareCatalog | None:
+        """
+        Returneaza intrarea din catalog a unui CNP, verificand doar fluturasul acelui CNP.
+
+        Args:
+            cnp (str): CNP-ul angajatului.
+
+        Returns:
+            IntrareCatalog | None: Intrarea sau None daca nu exista fluturas exportat.
+        """
+        return self._valideaza(cnp)[0]
+
+    def citeste(self, cnp: str) -> dict | None:
+        """
+        Returneaza continutul fluturasului unui CNP, din cache daca nu s-a schimbat.
+
+        Args:
+            cnp (str): CNP-ul angajatului.
+
+        Returns:
+            dict | None: O copie a fluturasului sau None daca nu exista.
+        """
+        intrare, date = self._valideaza(cnp)
+        if intrare is None:
+            return None
+        if date is None:
+            memorat: tuple[tuple[int, int], dict] | None = self._cache.get(cnp)
+            if memorat is not None and memorat[0] == intrare.stampila:
+                self._reusite += 1
+                self._cache.move_to_end(cnp)
+                return dict(memorat[1])
+            date = self._citeste_sursa(cnp, intrare.stampila)
+        self._ratari += 1
+        self._memoreaza(cnp, intrare.stampila, date)
+        return dict(date)
+
+    def invalideaza(self, cnp: str) -> None:
+        """Uita fluturasul unui CNP (catalog si cache), ex: dupa ce a fost rescris sau sters."""
+        self._cache.pop(cnp, None)
+        if self._intrari.pop(cnp, None) is not None:
+            self._modificat = True
+
+    def reimprospateaza(self) -> dict[str, int]:
+        """
+        Aduce catalogul la zi, recitind doar fluturasii noi sau modificati.
+
+        Returns:
+            dict[str, int]: "noi", "modificati" si "stersi" fata de starea anterioara.
+        """
+        stampile: dict[str, tuple[int, int]] = {}
+        momente: dict[str, float] = {}
+        if self.folder is not None:
+            if os.path.isdir(self.folder):
+                with os.scandir(self.folder) as intrari:
+                    for intrare in intrari:
+                        if intrare.name.startswith("fluturas_") and intrare.name.endswith(".json"):
+                            informatii: os.stat_result = intrare.stat()
+                            cnp: str = intrare.name[len("fluturas_"):-len(".json")]
+                            stampile[cnp] = (informatii.st_mtime_ns, informatii.st_size)
+                            momente[cnp] = informatii.st_mtime
+        else:
+            self._actualizeaza_index_arhiva()
+            stampile = self._index_arhiva
+            momente = self._momente_arhiva
+
+        rezultat: dict[str, int] = {"noi": 0, "modificati": 0, "stersi": 0}
+        for cnp in [cnp for cnp in self._intrari if cnp not in stampile]:
+            del self._intrari[cnp]
+            self._cache.pop(cnp, None)
+            rezultat["stersi"] += 1
+
+        for cnp, stampila in stampile.items():
+            intrare_veche: IntrareCatalog | None = self._intrari.get(cnp)
+            if intrare_veche is not None and intrare_veche.stampila == stampila:
+                continue
+            try:
+                date: dict = self._citeste_sursa(cnp, stampila)
+            except (OSError, ValueError):
+                continue
+            locatie: str = self._cale_fisier(cnp) if self.folder is not None else f"{self.cale_arhiva}#{cnp}"
+            self._intrari[cnp] = IntrareCatalog.din_fluturas(cnp, locatie, momente[cnp], date, stampila)
+            rezultat["noi" if intrare_veche is None else "modificati"] += 1
+
+        if any(rezultat.values()):
+            self._modificat = True
+        self.salveaza()
+        return rezultat
+
+    def din_departament(self, departament: str) -> list[IntrareCatalog]:
+        """
+        Returneaza fluturasii unui departament, ordonati dupa nume (din catalog, fara a citi fluturasii).
+
+        Note:
+            - Apeleaza reimprospateaza inainte pentru un rezultat la zi
+        """
+        return sorted((intrare for intrare in self._intrari.values() if intrare.departament == departament), key=lambda intrare: (intrare.nume, intrare.cnp))
+
+    def fara_fluturas(self, angajati: Iterable[Angajat], luna: str | None = None) -> list[Angajat]:
+        """
+        Returneaza angajatii care nu au un fluturas exportat in luna data.
+
+        Un angajat este returnat daca nu are fluturas deloc sau daca fluturasul
+        lui a fost exportat inainte de inceputul lunii.
+
+        Args:
+            angajati (Iterable[Angajat]): Angajatii verificati (ex: registrul).
+            luna (str | None): Luna, "AAAA-LL" (implicit luna curenta).
+
+        Returns:
+            list[Angajat]: Angajatii fara fluturas in luna data.
+
+        Note:
+            - Apeleaza reimprospateaza inainte pentru un rezultat la zi
+        """
+        prag: float = inceput_luna(luna)
+        lipsa: list[Angajat] = []
+        for persoana in angajati:
+            intrare: IntrareCatalog | None = self._intrari.get(persoana.cnp)
+            if intrare is None or intrare.exportat < prag:
+                lipsa.append(persoana)
+        return lipsa
+
+    def statistici_cache(self) -> dict[str, int]:
+        """
+        Returneaza statisticile cache-ului de fluturasi cititi.
+
+        Returns:
+            dict[str, int]: "reusite" (hits), "ratari" (misses), "marime" si "capacitate".
+        """
+        return {"reusite": self._reusite, "ratari": self._ratari, "marime": len(self._cache), "capacitate": self.capacitate_cache}
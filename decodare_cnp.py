@@ -0,0 +1,202 @@
+"""
+Modulul decodare_cnp verifica si decodeaza un CNP (cod numeric personal) complet:
+cifra de control, cifra de sex/secol, data nasterii si codul judetului.
+
+Structura unui CNP: S AA LL ZZ JJ NNN C
+    S   - sexul si secolul nasterii (1/2: 1900-1999, 3/4: 1800-1899,
+          5/6: 2000-2099, 7/8: rezidenti straini, 9: cetateni straini)
+    AA  - anul, LL - luna, ZZ - ziua nasterii
+    JJ  - codul judetului (01-46, 51, 52; 47/48 pentru fostele sectoare 7 si 8)
+    NNN - numar de ordine
+    C   - cifra de control, calculata cu ponderile 279146358279
+
+Rezultatele decodarii sunt tinute intr-un cache LRU pe CNP, deci un CNP este
+decodat o singura data indiferent de cate ori este cerut (ex: varsta in fiecare
+raport pe benzi de varsta). Varsta se calculeaza la cerere din data nasterii,
+fara sa depinda de campul 'varsta' introdus de mana.
+"""
+
+from datetime import date
+from functools import lru_cache
+from typing import Iterable
+from angajat import Angajat
+
+ponderi: tuple[int, ...] = (2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9)
+secole: dict[str, int] = {"1": 1900, "2": 1900, "3": 1800, "4": 1800, "5": 2000, "6": 2000}
+judete: dict[str, str] = {
+    "01": "Alba", "02": "Arad", "03": "Arges", "04": "Bacau", "05": "Bihor", "06": "Bistrita-Nasaud",
+    "07": "Botosani", "08": "Brasov", "09": "Braila", "10": "Buzau", "11": "Caras-Severin", "12": "Cluj",
+    "13": "Constanta", "14": "Covasna", "15": "Dambovita", "16": "Dolj", "17": "Galati", "18": "Gorj",
+    "19": "Harghita", "20": "Hunedoara", "21": "Ialomita", "22": "Iasi", "23": "Ilfov", "24": "Maramures",
+    "25": "Mehedinti", "26": "Mures", "27": "Neamt", "28": "Olt", "29": "Prahova", "30": "Satu Mare",
+    "31": "Salaj", "32": "Sibiu", "33": "Suceava", "34": "Teleorman", "35": "Timis", "36": "Tulcea",
+    "37": "Vaslui", "38": "Valcea", "39": "Vrancea", "40": "Bucuresti", "41": "Bucuresti Sector 1",
+    "42": "Bucuresti Sector 2", "43": "Bucuresti Sector 3", "44": "Bucuresti Sector 4",
+    "45": "Bucuresti Sector 5", "46": "Bucuresti Sector 6", "47": "Bucuresti Sector 7",
+    "48": "Bucuresti Sector 8", "51": "Calarasi", "52": "Giurgiu",
+}
+marime_cache: int = 1 << 16
+
+
+class CnpDecodat:
+    """
+    Datele decodate dintr-un CNP valid.
+
+    Exemple:
+        decodat = decodeaza("1800101400016")
+        decodat.sex, decodat.data_nasterii, decodat.judet  -> "M", date(1980, 1, 1), "Bucuresti"
+        decodat.varsta(date(2024, 6, 1))                   -> 44
+
+    Atribute:
+        cnp (str): CNP-ul decodat.
+        sex (str): "M" sau "F" ("" pentru cetatenii straini, cifra 9).
+        data_nasterii (date): Data nasterii.
+        cod_judet (str): Codul judetului (doua cifre).
+        strain (bool): True pentru rezidentii/cetatenii straini (cifrele 7, 8, 9).
+    """
+
+    __slots__ = ("cnp", "sex", "data_nasterii", "cod_judet", "strain")
+
+    def __init__(self, cnp: str, sex: str, data_nasterii: date, cod_judet: str, strain: bool) -> None:
+        self.cnp: str = cnp
+        self.sex: str = sex
+        self.data_nasterii: date = data_nasterii
+        self.cod_judet: str = cod_judet
+        self.strain: bool = strain
+
+    def __repr__(self) -> str:
+        return f"CnpDecodat({self.cnp!r}, sex={self.sex!r}, data_nasterii={self.data_nasterii!r}, judet={self.judet!r})"
+
+    @property
+    def judet(self) -> str:
+        """Numele judetului."""
+        return judete[self.cod_judet]
+
+    def varsta(self, la_data: date | None = None) -> int:
+        """Varsta in ani impliniti la data 'la_data' (implicit azi)."""
+        la_data = la_data or date.today()
+        nastere: date = self.data_nasterii
+        return la_data.year - nastere.year - ((la_data.month, la_data.day) < (nastere.month, nastere.day))
+
+
+def cifra_control(cnp: str) -> int:
+    """
+    Calculeaza cifra de control pentru primele 12 cifre ale unui CNP.
+
+    Suma cifrelor inmultite cu ponderile 279146358279 se imparte la 11;
+    restul este cifra de control, iar un rest de 10 devine 1.
+
+    Args:
+        cnp (str): CNP-ul (cel putin primele 12 cifre).
+
+    Returns:
+        int: Cifra de control (0-9).
+    """
+    rest: int = sum(int(cifra) * pondere for cifra, pondere in zip(cnp, ponderi)) % 11
+    return 1 if rest == 10 else rest
+
+
+@lru_cache(maxsize=marime_cache)
+def analizeaza(cnp: str) -> tuple[CnpDecodat | None, str | None]:
+    """
+    Verifica si decodeaza un CNP, cu rezultatul tinut in cache.
+
+    Exemple:
+        analizeaza("1800101400016") -> (CnpDecodat(...), None)
+        analizeaza("1800101400017") -> (None, "cnp_control")
+
+    Args:
+        cnp (str): CNP-ul de analizat.
+
+    Returns:
+        tuple[CnpDecodat | None, str | None]: CNP-ul decodat si None, sau None si
+            codul primei reguli incalcate: "cnp_caractere", "cnp_lungime",
+            "cnp_sex", "cnp_data", "cnp_judet" sau "cnp_control".
+    """
+    if not cnp.isdigit():
+        return None, "cnp_caractere"
+    if len(cnp) != 13:
+        return None, "cnp_lungime"
+
+    cifra_sex: str = cnp[0]
+    if cifra_sex == "0":
+        return None, "cnp_sex"
+    an_scurt: int = int(cnp[1:3])
+    secol: int | None = secole.get(cifra_sex)
+    if secol is None:
+        # rezidenti/cetateni straini: secolul nu este codificat
+        secol = 2000 if an_scurt <= date.today().year % 100 else 1900
+    try:
+        data_nasterii: date = date(secol + an_scurt, int(cnp[3:5]), int(cnp[5:7]))
+    except ValueError:
+        return None, "cnp_data"
+    if data_nasterii > date.today():
+        return None, "cnp_data"
+
+    if cnp[7:9] not in judete:
+        return None, "cnp_judet"
+    if cifra_control(cnp) != int(cnp[12]):
+        return None, "cnp_control"
+
+    sex: str = "" if cifra_sex == "9" else ("M" if int(cifra_sex) % 2 else "F")
+    return CnpDecodat(cnp, sex, data_nasterii, cnp[7:9], cifra_sex in "789"), None
+
+
+def decodeaza(cnp: str) -> CnpDecodat | None:
+    """Decodeaza un CNP (din cache); returneaza None daca CNP-ul nu este valid."""
+    return analizeaza(cnp)[0]
+
+
+def decodeaza_coloana(cnp_uri: Iterable[str]) -> list[CnpDecodat | None]:
+    """
+    Decodeaza o coloana intreaga de CNP-uri, intr-o singura trecere.
+
+    CNP-urile repetate (sau deja decodate anterior) sunt luate din cache.
+
+    Args:
+        cnp_uri (Iterable[str]): CNP-urile.
+
+    Returns:
+        list[CnpDecodat | None]: Cate un rezultat pentru fiecare CNP, in ordine
+                                 (None pentru CNP-urile invalide).
+    """
+    return [decodat for decodat, _ in map(analizeaza, cnp_uri)]
+
+
+def varsta_angajat(angajat: Angajat, la_data: date | None = None) -> int:
+    """
+    Returneaza varsta unui angajat, calculata din CNP.
+
+    Daca CNP-ul nu poate fi decodat (ex: CNP-uri vechi, introduse inainte de
+    verificarea cifrei de control), se foloseste campul 'varsta' salvat.
+
+    Args:
+        angajat (Angajat): Angajatul.
+        la_data (date | None): Data la care se calculeaza varsta (implicit azi).
+
+    Returns:
+        int: Varsta in ani impliniti.
+    """
+    decodat: CnpDecodat | None = analizeaza(angajat.cnp)[0]
+    return angajat.varsta if decodat is None else decodat.varsta(la_data)
+
+
+def varste(angajati: Iterable[Angajat], la_data: date | None = None) -> list[int]:
+    """
+    Calculeaza varstele unei coloane intregi de angajati, intr-o singura trecere.
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii.
+        la_data (date | None): Data la care se calculeaza varsta (implicit azi).
+
+    Returns:
+        list[int]: Varsta fiecarui angajat (din CNP sau, daca nu se poate, campul 'varsta').
+    """
+    la_data = la_data or date.today()
+    return [varsta_angajat(angajat, la_data) for angajat in angajati]
+
+
+def statistici_cache() -> dict[str, int]:
+    """Returneaza numarul de decodari luate din cache, ratate si CNP-urile tinute in cache."""
+    informatii = analizeaza.cache_info()
+    return {"gasite": informatii.hits, "ratate": informatii.misses, "marime": informatii.currsize}
@@ -4,37 +4,243 @@ de salariu in format JSON.
 
 Acest modul permite:
 - Exportul fluturasului de salariu pentru un angajat
+- Exportul in masa (paralel) al fluturasilor pentru toti angajatii
 - Actualizarea fluturasului existent
 - Afisarea fluturasului din fisierul JSON
+- Conversia fluturasilor din fisiere separate in arhiva unica
+- Sincronizarea fluturasilor exportati cu datele curente (manifest cu amprente)
+- Catalogul fluturasilor exportati (fluturasi lipsa, fluturasi pe departament)
+
+Moduri de stocare a fluturasilor (variabila 'mod_fluturasi', din variabila de
+mediu ANGAJATI_FLUTURASI):
+- "fisiere": cate un fisier fluturas_{CNP}.json in folderul 'fluturasi_angajati'
+- "arhiva": toti fluturasii intr-un singur fisier (fluturasi.arh, vezi modulul
+  arhiva_fluturasi), cu acces direct la fluturasul unui CNP
+Celelalte module folosesc doar functiile de mai jos (locatie_fluturas,
+exista_fluturas, citeste_fluturas, redenumeste_fluturas, sterge_fluturas),
+deci nu depind de modul de stocare.
 """
 
 import os
+import time
+import hashlib
 import validari
 import json
 import stil
+import salarizare
+import arhiva_fluturasi
+from catalog_fluturasi import CatalogFluturasi, IntrareCatalog
+from angajat import Angajat
+from registru import RegistruAngajati
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+folder_fluturasi: str = "fluturasi_angajati"
+mod_fluturasi: str = os.environ.get("ANGAJATI_FLUTURASI", "fisiere")
+
+
+# cate un catalog pentru fiecare mod de stocare, creat la prima folosire
+_cataloage: dict[str, CatalogFluturasi] = {}
+
+
+def catalog() -> CatalogFluturasi:
+    """Returneaza catalogul fluturasilor pentru modul de stocare curent (vezi modulul catalog_fluturasi)."""
+    if mod_fluturasi not in _cataloage:
+        if mod_fluturasi == "arhiva":
+            _cataloage[mod_fluturasi] = CatalogFluturasi(cale_arhiva=arhiva_fluturasi.nume_arhiva)
+        else:
+            _cataloage[mod_fluturasi] = CatalogFluturasi(folder=folder_fluturasi)
+    return _cataloage[mod_fluturasi]
+
+
+def locatie_fluturas(cnp: str) -> str:
+    """
+    Returneaza locul unde este pastrat fluturasul unui CNP (pentru mesaje si pentru modul "fisiere").
+
+    Exemple:
+        locatie_fluturas("1234567890123") -> "fluturasi_angajati/fluturas_1234567890123.json"
+                                             sau "fluturasi.arh#1234567890123" (mod "arhiva")
+    """
+    if mod_fluturasi == "arhiva":
+        return f"{arhiva_fluturasi.nume_arhiva}#{cnp}"
+    return f"{folder_fluturasi}/fluturas_{cnp}.json"
+
 
-def exporteaza_fluturas(angajati: list[dict]) -> None:
+def exista_fluturas(cnp: str) -> bool:
+    """Verifica daca exista un fluturas exportat pentru CNP-ul dat."""
+    return catalog().intrare(cnp) is not None
+
+
+def citeste_fluturas(cnp: str) -> dict | None:
+    """
+    Citeste fluturasul exportat al unui CNP.
+
+    Citirea trece prin catalog: fluturasul este luat din cache daca fisierul
+    (sau inregistrarea din arhiva) nu s-a schimbat de la ultima citire.
+
+    Args:
+        cnp (str): CNP-ul angajatului.
+
+    Returns:
+        dict | None: Continutul fluturasului sau None daca nu a fost exportat.
+    """
+    return catalog().citeste(cnp)
+
+
+def _scrie_fluturas(cnp: str, date_fluturas: dict) -> None:
+    catalog().invalideaza(cnp)
+    if mod_fluturasi == "arhiva":
+        with arhiva_fluturasi.ArhivaFluturasi() as arhiva:
+            arhiva.scrie(cnp, date_fluturas)
+        return
+    os.makedirs(folder_fluturasi, exist_ok=True)
+    with open(locatie_fluturas(cnp), "w") as my_file:
+        json.dump(date_fluturas, my_file, indent=4)
+
+
+def redenumeste_fluturas(cnp_vechi: str, cnp_nou: str) -> bool:
+    """
+    Muta fluturasul exportat de pe un CNP pe altul (la modificarea CNP-ului unui angajat).
+
+    Campul "CNP" din fluturas este actualizat.
+
+    Returns:
+        bool: True daca exista un fluturas pentru CNP-ul vechi.
+    """
+    date_fluturas: dict | None = citeste_fluturas(cnp_vechi)
+    if date_fluturas is None:
+        return False
+    date_fluturas["CNP"] = cnp_nou
+    _scrie_fluturas(cnp_nou, date_fluturas)
+    sterge_fluturas(cnp_vechi)
+    return True
+
+
+def sterge_fluturas(cnp: str) -> bool:
+    """
+    Sterge fluturasul exportat al unui CNP.
+
+    Returns:
+        bool: True daca fluturasul exista si a fost sters.
+    """
+    catalog().invalideaza(cnp)
+    if mod_fluturasi == "arhiva":
+        if not os.path.exists(arhiva_fluturasi.nume_arhiva):
+            return False
+        with arhiva_fluturasi.ArhivaFluturasi() as arhiva:
+            return arhiva.sterge(cnp)
+    if not os.path.exists(locatie_fluturas(cnp)):
+        return False
+    os.remove(locatie_fluturas(cnp))
+    return True
+
+
+def cale_manifest() -> str:
+    """Returneaza fisierul manifestului de fluturasi pentru modul de stocare curent."""
+    if mod_fluturasi == "arhiva":
+        return f"{arhiva_fluturasi.nume_arhiva}.manifest.json"
+    return f"{folder_fluturasi}/manifest.json"
+
+
+def amprenta_fluturas(persoana: Angajat, regula: salarizare.RegulaSalarizare | None = None) -> str:
+    """
+    Calculeaza amprenta datelor din care este construit fluturasul unui angajat.
+
+    Amprenta acopera campurile angajatului care apar in fluturas (nume,
+    prenume, CNP, departament, salariu brut) si regula de salarizare (versiune,
+    cote, salariu minim, rotunjire); daca oricare se schimba, se schimba si amprenta.
+
+    Exemple:
+        amprenta_fluturas(persoana) -> "3f1c9a..." (32 de caractere hexazecimale)
+
+    Args:
+        persoana (Angajat): Angajatul.
+        regula (RegulaSalarizare | None): Regula folosita (implicit regula curenta).
+
+    Returns:
+        str: Amprenta BLAKE2b (16 octeti), in hexazecimal.
+    """
+    regula = regula or salarizare.regula_curenta()
+    date: tuple = (persoana.nume, persoana.prenume, persoana.cnp, persoana.departament, persoana.salar, *(getattr(regula, camp) for camp in regula.__slots__))
+    return hashlib.blake2b(repr(date).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def incarca_manifest() -> dict[str, str]:
+    """
+    Citeste manifestul fluturasilor exportati (CNP -> amprenta datelor la export).
+
+    Returns:
+        dict[str, str]: Manifestul; gol daca fisierul nu exista sau este corupt.
+    """
+    try:
+        with open(cale_manifest(), "r", encoding="utf-8") as my_file:
+            return json.load(my_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def salveaza_manifest(manifest: dict[str, str]) -> None:
+    """Scrie manifestul intr-un fisier temporar si il redenumeste (scriere atomica)."""
+    cale: str = cale_manifest()
+    os.makedirs(os.path.dirname(cale) or ".", exist_ok=True)
+    with open(cale + ".tmp", "w", encoding="utf-8") as my_file:
+        json.dump(manifest, my_file, separators=(",", ":"))
+    os.replace(cale + ".tmp", cale)
+
+
+def _cnp_uri_exportate() -> set[str]:
+    """Returneaza CNP-urile care au un fluturas exportat (o listare de folder sau indexul arhivei)."""
+    if mod_fluturasi == "arhiva":
+        if not os.path.exists(arhiva_fluturasi.nume_arhiva):
+            return set()
+        with arhiva_fluturasi.ArhivaFluturasi() as arhiva:
+            return set(arhiva)
+    if not os.path.exists(folder_fluturasi):
+        return set()
+    with os.scandir(folder_fluturasi) as intrari:
+        return {intrare.name[len("fluturas_"):-len(".json")] for intrare in intrari if intrare.name.startswith("fluturas_") and intrare.name.endswith(".json")}
+
+
+def date_fluturas_angajat(persoana: Angajat, fluturas: salarizare.Fluturas | None = None) -> dict:
+    """
+    Construieste continutul fisierului JSON de fluturas pentru un angajat.
+
+    Args:
+        persoana (Angajat): Angajatul.
+        fluturas (Fluturas | None): Fluturasul deja calculat; daca lipseste,
+                                    este calculat cu salarizare.calculeaza_fluturas.
+
+    Returns:
+        dict: Nume, prenume, CNP, departament si componentele fluturasului.
+    """
+    fluturas = fluturas or salarizare.calculeaza_fluturas(persoana.salar)
+    return {
+        "Nume": persoana.nume,
+        "Prenume": persoana.prenume,
+        "CNP": persoana.cnp,
+        "Departament": persoana.departament,
+        **fluturas.in_dict()
+    }
+
+
+def exporteaza_fluturas(angajati: RegistruAngajati) -> None:
     """
     Exporta fluturasul de salariu al unui angajat in format JSON.
     
     Functia calculeaza toate componentele salariului (brut, CAS, CASS, impozit, net)
-    si salveaza intr-un fisier JSON structurat in folderul 'fluturasi_angajati'.
+    si salveaza intr-un fisier JSON structurat in folderul 'fluturasi_angajati'
+    (sau in arhiva fluturasi.arh, in modul "arhiva").
     
     Numele fisierului este generat automat pe baza CNP-ului:
     Format: fluturasi_angajati/fluturas_{CNP}.json
     
-    Datele exportate includ:
-    - Nume si prenume
-    - CNP
-    - Departament
-    - Salariu brut
-    - CAS (10%)
-    - CASS (25%)
-    - Impozit (10%)
-    - Salariu net
+    Datele exportate sunt cele din date_fluturas_angajat (nume, prenume, CNP,
+    departament si componentele calculate de motorul de salarizare).
     
     Args:
-        angajati (list[dict]): Lista de angajati in care se cauta angajatul.
+        angajati (RegistruAngajati): Lista de angajati in care se cauta angajatul.
         
     Returns:
         None: Functia creeaza fisierul JSON si afiseaza confirmare.
@@ -43,12 +249,10 @@ def exporteaza_fluturas(angajati: list[dict]) -> None:
         - Cautarea se face dupa CNP
         - Utilizatorul poate introduce '0' pentru a anula
         - Fisierul este suprascris daca deja exista pentru acel CNP
-        - Datele numerice sunt rotunjite la 2 zecimale
+        - Datele numerice sunt rotunjite dupa politica regulilor de salarizare
     """
     stil.titlu(" ---> Export fluturasi de salar")
 
-    os.makedirs("fluturasi_angajati", exist_ok=True)
-
     while True:
         cnp: str = validari.cere_cnp_valid()
            
@@ -56,42 +260,21 @@ def exporteaza_fluturas(angajati: list[dict]) -> None:
             return
         
         gasit: bool = False
-        for persoana in angajati:
-            if persoana["cnp"] == cnp:
-                gasit = True
-
-                brut: float = float(persoana["salar"])
-                cas: float = brut * 0.25
-                cass: float = brut * 0.10
-                impozitare_baza: float = brut - cas - cass
-                impozit: float = impozitare_baza * 0.10
-                net: float = brut - cas - cass - impozit
-                
-                nume_fisier: str = "fluturasi_angajati/fluturas_" + cnp + ".json"
-
-                date_fluturas: dict = {
-                    "Nume" : persoana['nume'],
-                    "Prenume" : persoana['prenume'],
-                    "cnp" : persoana['cnp'],
-                    "Departament" : persoana['departament'],
-                    "Salariu brut" : brut,
-                    "Cas (25%)" : round(cas / 2),
-                    "Cass (10%)" : round(cass / 2),
-                    "Impozit (10%)" : round(impozit / 2),
-                    "Salariu net" : round(net / 2)
-                }
-
-                with open(nume_fisier, "w") as my_file:
-                    json.dump(date_fluturas, my_file ,indent=4)
-                
-                stil.succes(f"Fisierul JSON pentru angajatul cu CNP-ul {cnp} a fost creat in {stil.evidentiaza(nume_fisier)}")
-                return
+        persoana: Angajat | None = angajati.cauta(cnp)
+        if persoana is not None:
+            gasit = True
+
+            nume_fisier: str = locatie_fluturas(cnp)
+            _scrie_fluturas(cnp, date_fluturas_angajat(persoana))
+
+            stil.succes(f"Fisierul JSON pentru angajatul cu CNP-ul {cnp} a fost creat in {stil.evidentiaza(nume_fisier)}")
+            return
             
         if not gasit :
             stil.info(f"Nu s-a gasit nici un angajat cu CNP-ul -> {stil.evidentiaza(cnp)}")
 
 
-def actualizare_fluturas_fisier(persoana: dict) -> None:
+def actualizare_fluturas_fisier(persoana: Angajat, fluturas: salarizare.Fluturas | None = None) -> None:
     """
     Actualizeaza sau creeaza fisierul JSON cu fluturasul de salariu.
     
@@ -100,14 +283,13 @@ def actualizare_fluturas_fisier(persoana: dict) -> None:
     automat dupa:
     - Exportul manual al fluturasului
     - Modificarea datelor unui angajat (daca fisierul exista)
-    Calculele sunt identice cu cele din calcul_fluturas_salariu:
-    - CAS: 25% din brut
-    - CASS: 10% din brut
-    - Impozit: 10% din baza de calcul
+    Calculele sunt facute de motorul de salarizare, la fel ca in
+    calcul_fluturas_salariu.
     
     Args:
-        persoana (dict): Dictionar cu datele complete ale angajatului.
-                        Trebuie sa contina: nume, prenume, cnp, departament, salar.
+        persoana (Angajat): Angajatul pentru care se scrie fluturasul.
+        fluturas (Fluturas | None): Fluturasul deja calculat (ex: dintr-un lot);
+                                    daca lipseste, este calculat acum.
         
     Returns:
         None: Functia scrie direct in fisierul JSON.
@@ -115,34 +297,350 @@ def actualizare_fluturas_fisier(persoana: dict) -> None:
     Note:
         - Creaza folderul (fluturasi_angajati) daca nu exista
         - Fisierul este suprascris complet de fiecare data
+        - In modul "arhiva" fluturasul este inlocuit in fluturasi.arh
         - Nu se afiseaza mesaje de confirmare (este o functie interna)
     """
-    os.makedirs("fluturasi_angajati", exist_ok=True)
-    
-    brut: float = float(persoana["salar"])
-    cas: float = brut * 0.25
-    cass: float = brut * 0.10
-    impozitare_baza: float = brut - cas - cass
-    impozit: float = impozitare_baza * 0.10
-    net: float = brut - cas - cass - impozit
-    cnp: str = persoana["cnp"]
-
-    nume_fisier: str = f"fluturasi_angajati/fluturas_{cnp}.json"
-
-    date_fluturas: dict = {
-        "Nume": persoana['nume'],
-        "Prenume": persoana['prenume'],
-        "CNP": persoana['cnp'],
-        "Departament": persoana['departament'],
-        "Salariu brut": brut,
-        "Cas (25%)": round(cas, 2),
-        "Cass (10%)": round(cass, 2),
-        "Impozit (10%)": round(impozit, 2),
-        "Salariu net": round(net, 2)
-    }
+    _scrie_fluturas(persoana.cnp, date_fluturas_angajat(persoana, fluturas))
 
-    with open(nume_fisier, "w") as my_file:
-        json.dump(date_fluturas, my_file, indent=4)
+
+def _scrie_fisiere(fisiere: list[tuple[str, str, str]]) -> tuple[int, int, list[tuple[str, str]]]:
+    """
+    Scrie un lot de fisiere de fluturas (ruleaza in firele de lucru).
+
+    Args:
+        fisiere (list[tuple[str, str, str]]): Tupluri (cnp, cale, continut JSON).
+
+    Returns:
+        tuple[int, int, list[tuple[str, str]]]: Fisierele scrise, octetii scrisi
+            si esecurile (cnp, mesaj) - un fisier care nu poate fi scris nu
+            opreste restul lotului.
+    """
+    scrise: int = 0
+    octeti: int = 0
+    esecuri: list[tuple[str, str]] = []
+    for cnp, cale, continut in fisiere:
+        try:
+            with open(cale, "w") as my_file:
+                my_file.write(continut)
+            scrise += 1
+            octeti += len(continut)
+        except OSError as eroare:
+            esecuri.append((cnp, str(eroare)))
+    return scrise, octeti, esecuri
+
+
+def _comprima_fluturasi(fluturasi: list[tuple[str, dict]]) -> list[tuple[str, bytes]]:
+    """
+    Comprima un lot de fluturasi pentru arhiva (ruleaza in firele de lucru).
+
+    Args:
+        fluturasi (list[tuple[str, dict]]): Perechi (cnp, continut fluturas).
+
+    Returns:
+        list[tuple[str, bytes]]: Perechi (cnp, fluturas comprimat cu arhiva_fluturasi.comprima).
+    """
+    return [(cnp, arhiva_fluturasi.comprima(date_fluturas)) for cnp, date_fluturas in fluturasi]
+
+
+def exporta_fluturasi_paralel(angajati: Iterable[Angajat], fire: int | None = None, marime_lot: int = 256, progres: Callable[[int], None] | None = None) -> dict:
+    """
+    Exporta fluturasii tuturor angajatilor primiti, scriind fisierele cu un grup de fire de lucru.
+
+    Fluturasii sunt calculati pe loturi (salarizare.calculeaza_lot) si
+    serializati in firul principal; fiecare lot de fisiere este apoi scris de
+    un fir de lucru. Cel mult cateva loturi sunt in lucru in acelasi timp, deci
+    memoria nu creste cu numarul de angajati.
+
+    In modul "arhiva", firele de lucru doar comprima fluturasii, iar firul
+    principal ii adauga in arhiva, in ordine; indexul arhivei este salvat o
+    singura data, la final. Un fluturas care nu poate fi adaugat in arhiva
+    este trecut la esecuri, ca in modul "fisiere", fara a opri exportul.
+
+    Exemple:
+        rezultat = exporta_fluturasi_paralel(registru.din_departament("IT"))
+        rezultat["fisiere"], rezultat["esecuri"]
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii (lista, registru sau flux).
+        fire (int | None): Numarul de fire de lucru (implicit nucleele + 4, maxim 32).
+        marime_lot (int): Numarul de fisiere scrise de un fir intr-un lot.
+        progres (Callable[[int], None] | None): Apelata dupa fiecare lot scris,
+                                                cu numarul de fluturasi procesati pana atunci.
+
+    Returns:
+        dict: "fisiere" (scrise cu succes), "octeti", "secunde" si "esecuri"
+              (lista de perechi (cnp, mesaj de eroare)).
+    """
+    arhiva: arhiva_fluturasi.ArhivaFluturasi | None = None
+    if mod_fluturasi == "arhiva":
+        arhiva = arhiva_fluturasi.ArhivaFluturasi()
+    else:
+        os.makedirs(folder_fluturasi, exist_ok=True)
+    fire = fire or min(32, (os.cpu_count() or 1) + 4)
+    inceput: float = time.perf_counter()
+    rezultat: dict = {"fisiere": 0, "octeti": 0, "secunde": 0.0, "esecuri": []}
+    procesati: int = 0
+
+    def preia(viitor: Future) -> None:
+        nonlocal procesati
+        if arhiva is not None:
+            scrise, octeti, esecuri = 0, 0, []
+            for cnp, date_fluturas in viitor.result():
+                try:
+                    arhiva.scrie_comprimat(cnp, date_fluturas)
+                    scrise += 1
+                    octeti += len(date_fluturas)
+                except OSError as eroare:
+                    esecuri.append((cnp, str(eroare)))
+        else:
+            scrise, octeti, esecuri = viitor.result()
+        rezultat["fisiere"] += scrise
+        rezultat["octeti"] += octeti
+        rezultat["esecuri"].extend(esecuri)
+        procesati += scrise + len(esecuri)
+        if progres is not None:
+            progres(procesati)
+
+    iterator: Iterator[Angajat] = iter(angajati)
+    try:
+        with ThreadPoolExecutor(max_workers=fire) as executor:
+            in_lucru: deque = deque()
+            while True:
+                lot_angajati: list[Angajat] = list(islice(iterator, marime_lot))
+                if not lot_angajati:
+                    break
+                lot: salarizare.LotFluturasi = salarizare.calculeaza_lot(persoana.salar for persoana in lot_angajati)
+                if arhiva is not None:
+                    fluturasi: list[tuple[str, dict]] = [(persoana.cnp, date_fluturas_angajat(persoana, lot[pozitie])) for pozitie, persoana in enumerate(lot_angajati)]
+                    in_lucru.append(executor.submit(_comprima_fluturasi, fluturasi))
+                else:
+                    fisiere: list[tuple[str, str, str]] = [
+                        (persoana.cnp, locatie_fluturas(persoana.cnp), json.dumps(date_fluturas_angajat(persoana, lot[pozitie]), indent=4))
+                        for pozitie, persoana in enumerate(lot_angajati)
+                    ]
+                    in_lucru.append(executor.submit(_scrie_fisiere, fisiere))
+                if len(in_lucru) >= 2 * fire:
+                    preia(in_lucru.popleft())
+            while in_lucru:
+                preia(in_lucru.popleft())
+    finally:
+        if arhiva is not None:
+            arhiva.inchide()
+
+    rezultat["secunde"] = time.perf_counter() - inceput
+    return rezultat
+
+
+def sincronizeaza_fluturasi(angajati: Iterable[Angajat], fire: int | None = None) -> dict:
+    """
+    Aduce fluturasii exportati la zi, rescriind doar fluturasii ale caror date s-au schimbat.
+
+    Pentru fiecare angajat se calculeaza amprenta datelor (amprenta_fluturas) si
+    se compara cu manifestul de la sincronizarea anterioara. Sunt rescrisi doar
+    fluturasii cu amprenta diferita sau lipsa (angajati noi, fluturasi stersi
+    manual), iar fluturasii angajatilor care nu mai exista sunt stersi. La final
+    manifestul este rescris; un fluturas care nu a putut fi scris nu intra in
+    manifest, deci este reincercat la urmatoarea sincronizare.
+
+    Exemple:
+        rezultat = sincronizeaza_fluturasi(registru)
+        rezultat["scrisi"], rezultat["stersi"], rezultat["neschimbati"]
+
+    Args:
+        angajati (Iterable[Angajat]): Toti angajatii (registrul sau un flux).
+        fire (int | None): Numarul de fire de lucru pentru scriere (vezi exporta_fluturasi_paralel).
+
+    Returns:
+        dict: "scrisi", "stersi", "neschimbati", "secunde" si "esecuri"
+              (lista de perechi (cnp, mesaj de eroare)).
+    """
+    inceput: float = time.perf_counter()
+    regula: salarizare.RegulaSalarizare = salarizare.regula_curenta()
+    manifest_vechi: dict[str, str] = incarca_manifest()
+    exportate: set[str] = _cnp_uri_exportate()
+    manifest: dict[str, str] = {}
+    cnp_curente: set[str] = set()
+    de_scris: list[Angajat] = []
+    for persoana in angajati:
+        amprenta: str = amprenta_fluturas(persoana, regula)
+        cnp_curente.add(persoana.cnp)
+        manifest[persoana.cnp] = amprenta
+        if manifest_vechi.get(persoana.cnp) != amprenta or persoana.cnp not in exportate:
+            de_scris.append(persoana)
+
+    rezultat: dict = {"scrisi": 0, "stersi": 0, "neschimbati": len(manifest) - len(de_scris), "secunde": 0.0, "esecuri": []}
+    if de_scris:
+        scriere: dict = exporta_fluturasi_paralel(de_scris, fire=fire)
+        rezultat["scrisi"] = scriere["fisiere"]
+        rezultat["esecuri"].extend(scriere["esecuri"])
+        # fluturasii nescrisi raman in afara manifestului, ca sa fie reincercati
+        for cnp, _ in scriere["esecuri"]:
+            manifest.pop(cnp, None)
+
+    # orfanii sunt fluturasii angajatilor care nu mai exista (nu cei nescrisi acum)
+    orfani: list[str] = sorted(exportate.difference(cnp_curente))
+    if orfani and mod_fluturasi == "arhiva":
+        with arhiva_fluturasi.ArhivaFluturasi() as arhiva:
+            rezultat["stersi"] = sum(arhiva.sterge(cnp) for cnp in orfani)
+    else:
+        for cnp in orfani:
+            try:
+                os.remove(locatie_fluturas(cnp))
+                rezultat["stersi"] += 1
+            except OSError as eroare:
+                rezultat["esecuri"].append((cnp, str(eroare)))
+
+    if rezultat["scrisi"] or rezultat["stersi"] or manifest != manifest_vechi:
+        salveaza_manifest(manifest)
+    rezultat["secunde"] = time.perf_counter() - inceput
+    return rezultat
+
+
+def exporta_toti_fluturasii(angajati: RegistruAngajati) -> None:
+    """
+    Exporta fluturasii pentru toti angajatii sau pentru un departament / nivel de senioritate.
+
+    Fisierele sunt scrise in paralel (exporta_fluturasi_paralel), cu progres
+    afisat la fiecare 10%. Un fisier care nu poate fi scris este raportat la
+    final, fara a opri exportul celorlalte. La final se afiseaza debitul
+    (fisiere/s si MB/s).
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia scrie fisierele si afiseaza rezultatul in consola.
+
+    Note:
+        - Apasa 'enter' la un filtru pentru a nu filtra dupa el
+        - Fisierele existente sunt suprascrise
+    """
+    stil.titlu(" ---> Export fluturasi pentru toti angajatii")
+
+    departamente_disponibile: set = angajati.departamente()
+    while True:
+        departament: str = input(f"Departament {stil.GALBEN}{departamente_disponibile}{stil.RESET} sau 'enter' pentru toti: ").strip().upper()
+        if not departament or departament in departamente_disponibile:
+            break
+        stil.atentionare(f"Nu exista nici un departament cu numele -> {stil.evidentiaza(departament)}")
+
+    while True:
+        senioritate: str = input(f"Senioritate {stil.GALBEN}{validari.aceptare_nivel}{stil.RESET} sau 'enter' pentru toate: ").strip().lower()
+        if not senioritate or senioritate in validari.aceptare_nivel:
+            break
+        stil.atentionare(f"Senioritate necunoscuta -> {stil.evidentiaza(senioritate)}")
+
+    selectati: list[Angajat] = angajati.din_departament(departament) if departament else list(angajati)
+    if senioritate:
+        selectati = [persoana for persoana in selectati if persoana.senioritate == senioritate]
+    if not selectati:
+        stil.atentionare("Nu exista nici un angajat pentru filtrele alese!")
+        return
+
+    total: int = len(selectati)
+    pas: int = max(1, total // 10)
+    urmatorul: int = pas
+
+    def afiseaza_progres(procesati: int) -> None:
+        nonlocal urmatorul
+        if procesati >= urmatorul or procesati == total:
+            stil.info(f"Progres: {procesati}/{total} ({procesati * 100 // total}%)")
+            urmatorul = (procesati // pas + 1) * pas
+
+    rezultat: dict = exporta_fluturasi_paralel(selectati, progres=afiseaza_progres)
+    secunde: float = rezultat["secunde"] or 1e-9
+    destinatie: str = f"arhiva '{arhiva_fluturasi.nume_arhiva}'" if mod_fluturasi == "arhiva" else f"folderul '{folder_fluturasi}'"
+    stil.succes(f"Au fost exportati {rezultat['fisiere']} fluturasi in {destinatie}")
+    stil.info(f"Durata: {rezultat['secunde']:.2f} s | {rezultat['fisiere'] / secunde:.0f} fisiere/s | {rezultat['octeti'] / secunde / 1_000_000:.2f} MB/s")
+    for cnp, mesaj in rezultat["esecuri"][:10]:
+        stil.eroare(f"Fluturasul pentru CNP-ul {cnp} nu a putut fi scris: {mesaj}")
+    if len(rezultat["esecuri"]) > 10:
+        stil.eroare(f"... si inca {len(rezultat['esecuri']) - 10} fisiere nescrise")
+
+
+def sincronizare_fluturasi(angajati: RegistruAngajati) -> None:
+    """
+    Sincronizeaza fluturasii exportati cu datele curente ale angajatilor.
+
+    Sunt rescrisi doar fluturasii angajatilor ale caror date (sau regula de
+    salarizare) s-au schimbat de la sincronizarea anterioara, sunt creati
+    fluturasii lipsa si sunt stersi fluturasii angajatilor care nu mai exista
+    (vezi sincronizeaza_fluturasi).
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia scrie/sterge fluturasii si afiseaza rezultatul in consola.
+
+    Note:
+        - Prima sincronizare (fara manifest) rescrie toti fluturasii
+        - Manifestul este pastrat in fluturasi_angajati/manifest.json
+          (sau fluturasi.arh.manifest.json in modul "arhiva")
+    """
+    stil.titlu(" ---> Sincronizare fluturasi exportati")
+
+    rezultat: dict = sincronizeaza_fluturasi(angajati)
+    stil.succes(f"Fluturasi rescrisi: {rezultat['scrisi']} | stersi: {rezultat['stersi']} | neschimbati: {rezultat['neschimbati']}")
+    stil.info(f"Durata: {rezultat['secunde']:.2f} s")
+    for cnp, mesaj in rezultat["esecuri"][:10]:
+        stil.eroare(f"Fluturasul pentru CNP-ul {cnp} nu a putut fi actualizat: {mesaj}")
+    if len(rezultat["esecuri"]) > 10:
+        stil.eroare(f"... si inca {len(rezultat['esecuri']) - 10} fluturasi neactualizati")
+
+
+def catalog_fluturasi(angajati: RegistruAngajati) -> None:
+    """
+    Cauta in catalogul fluturasilor exportati, fara a redeschide fiecare fluturas.
+
+    Catalogul este adus la zi (sunt recititi doar fluturasii noi sau
+    modificati), apoi utilizatorul alege una dintre interogari:
+    1. Angajatii fara fluturas exportat intr-o luna
+    2. Fluturasii exportati pentru un departament
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia afiseaza rezultatul in consola.
+
+    Note:
+        - Luna se introduce ca AAAA-LL; 'enter' inseamna luna curenta
+        - Un fluturas exportat inainte de inceputul lunii este considerat lipsa
+        - Utilizatorul poate introduce '0' pentru a reveni la meniu
+    """
+    stil.titlu(" ---> Catalog fluturasi exportati")
+
+    catalog_curent: CatalogFluturasi = catalog()
+    schimbari: dict[str, int] = catalog_curent.reimprospateaza()
+    stil.info(f"Fluturasi in catalog: {len(catalog_curent)} (noi: {schimbari['noi']}, modificati: {schimbari['modificati']}, stersi: {schimbari['stersi']})")
+
+    while True:
+        optiune: str = input(f"Alege {stil.GALBEN}1{stil.RESET} = angajati fara fluturas intr-o luna, {stil.GALBEN}2{stil.RESET} = fluturasii unui departament, {stil.GALBEN}0{stil.RESET} = inapoi: ").strip()
+        if optiune == "0":
+            return
+        if optiune == "1":
+            luna: str = input(f"Luna {stil.GALBEN}(AAAA-LL){stil.RESET} sau 'enter' pentru luna curenta: ").strip()
+            try:
+                lipsa: list[Angajat] = catalog_curent.fara_fluturas(angajati, luna or None)
+            except ValueError:
+                stil.atentionare(f"Luna invalida -> {stil.evidentiaza(luna)}")
+                continue
+            stil.titlu(f" ---> Angajati fara fluturas ({luna or time.strftime('%Y-%m')}): {len(lipsa)}")
+            for persoana in lipsa:
+                stil.info(f"{persoana.nume} {persoana.prenume} | CNP: {persoana.cnp} | Departament: {persoana.departament}")
+            return
+        if optiune == "2":
+            departament: str = input("Departament: ").strip().upper()
+            intrari: list[IntrareCatalog] = catalog_curent.din_departament(departament)
+            if not intrari:
+                stil.atentionare(f"Nu exista fluturasi exportati pentru departamentul -> {stil.evidentiaza(departament)}")
+                continue
+            stil.titlu(f" ---> Fluturasi {departament}: {len(intrari)}")
+            for intrare in intrari:
+                stil.info(f"{intrare.nume} | CNP: {intrare.cnp} | Net: {intrare.net} | Exportat: {time.strftime('%Y-%m-%d %H:%M', time.localtime(intrare.exportat))}")
+            return
+        stil.atentionare(f"Optiune invalida -> {stil.evidentiaza(optiune)}")
 
 
 def afisare_fluturas_din_fisier() -> None:
@@ -168,13 +666,13 @@ def afisare_fluturas_din_fisier() -> None:
         - Utilizatorul poate introduce '0' pentru a reveni la meniu
         - Daca fisierul nu exista, se afiseaza un mesaj de eroare
         - Toate campurile sunt afisate cu numele in uppercase
-        - Creaza folderul (fluturasi_angajati) daca nu exista
+        - In modul "arhiva" este decomprimat doar fluturasul cerut din fluturasi.arh
     """
     stil.titlu(f" ---> Afisare fluturas de salariu dintr-un fisier exportat")
 
-    folder: str = "fluturasi_angajati"
+    stocare: str = arhiva_fluturasi.nume_arhiva if mod_fluturasi == "arhiva" else folder_fluturasi
 
-    if not os.path.exists(folder):
+    if not os.path.exists(stocare):
         stil.info("Nu exista fisiere exportate!")
         return
 
@@ -185,19 +683,59 @@ def afisare_fluturas_din_fisier() -> None:
         if cnp == "0":
             return
         
-        nume_fisier: str = (f"{folder}/fluturas_{cnp}.json")
+        nume_fisier: str = locatie_fluturas(cnp)
+        date: dict | None = citeste_fluturas(cnp)
 
-        if not os.path.exists(nume_fisier):
+        if date is None:
             stil.atentionare(f"Nu s-a gasit nici un fluturas exportat pentru CNP-ul {stil.evidentiaza(cnp)}")
             return
         
         stil.titlu(f" ---> Fluturas salariu din fisierul {nume_fisier}")
 
-        with open(nume_fisier, "r" ) as fluturasi_salariu:
+        for camp, valoare in date.items():
+            stil.info(f"{camp.upper()}: {valoare}")
+
+        return
+
 
-            date: dict = json.load(fluturasi_salariu)
+def converteste_fluturasi_in_arhiva() -> None:
+    """
+    Muta fluturasii exportati ca fisiere separate in arhiva unica fluturasi.arh.
 
-            for camp, valoare in date.items():
-                stil.info(f"{camp.upper()}: {valoare}")
+    Fiecare fisier fluturas_{CNP}.json din folderul 'fluturasi_angajati' este
+    adaugat in arhiva (vezi arhiva_fluturasi.converteste_din_folder); la
+    alegere, fisierele convertite sunt sterse dupa ce arhiva a fost salvata.
 
+    Args:
+        None: Functia citeste optiunile de la tastatura.
+
+    Returns:
+        None: Functia scrie arhiva si afiseaza rezultatul in consola.
+
+    Note:
+        - Fluturasii deja existenti in arhiva pentru acelasi CNP sunt inlocuiti
+        - Fisierele care nu pot fi citite sunt raportate si lasate neatinse
+        - Pentru a folosi arhiva la export si afisare, porneste aplicatia cu
+          variabila de mediu ANGAJATI_FLUTURASI=arhiva
+    """
+    stil.titlu(" ---> Conversie fluturasi in arhiva")
+
+    if not os.path.exists(folder_fluturasi):
+        stil.info("Nu exista fisiere exportate!")
         return
+
+    while True:
+        sterge: str = input(f"Stergi fisierele convertite? {stil.GALBEN}(da/nu){stil.RESET}: ").strip().lower()
+        if sterge in ("da", "nu"):
+            break
+        stil.atentionare("Raspunde cu 'da' sau 'nu'!")
+
+    inceput: float = time.perf_counter()
+    convertiti, nevalide = arhiva_fluturasi.converteste_din_folder(folder_fluturasi, sterge_fisiere=sterge == "da")
+    stil.succes(f"Au fost convertiti {convertiti} fluturasi in {stil.evidentiaza(arhiva_fluturasi.nume_arhiva)} in {time.perf_counter() - inceput:.2f} s")
+    for cale in nevalide[:10]:
+        stil.eroare(f"Fisierul {cale} nu a putut fi citit")
+    if len(nevalide) > 10:
+        stil.eroare(f"... si inca {len(nevalide) - 10} fisiere necitite")
+    if mod_fluturasi != "arhiva":
+        stil.info(f"Porneste aplicatia cu {stil.evidentiaza('ANGAJATI_FLUTURASI=arhiva')} pentru a folosi arhiva")
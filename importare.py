@@ -0,0 +1,278 @@
+"""
+Modulul importare adauga angajati in masa dintr-un fisier CSV sau JSON Lines
+(ex: la preluarea unei alte companii), in locul introducerii fiecarei persoane
+prin adaugare_angajat.
+
+Randurile sunt citite si validate pe loturi, cu verificarile pe coloane din
+validari (format si unicitate CNP, nume, varsta, salariu minim, departament,
+senioritate), fara mesaje afisate pe rand. Randurile valide ale fiecarui lot
+sunt adaugate in registru deodata (RegistruAngajati.adauga_lot). In modurile
+"jurnal"/"binar" fiecare lot este scris in jurnal imediat, iar instantaneul
+este compactat cel mult o data, la final; in modul "json" fisierul este
+rescris o singura data, iar in modul "sqlite" randurile sunt inserate
+intr-o singura tranzactie. Daca salvarea esueaza, importul este anulat in
+intregime. Randurile invalide sunt raportate, cu numarul liniei, campul si
+motivul, intr-un raport de erori CSV.
+
+Coloanele asteptate sunt campurile angajatului: cnp, nume, prenume, varsta,
+salar, departament, senioritate. Alte coloane sunt ignorate, deci si un
+raport CSV exportat de modulul raport poate fi reimportat. CNP-urile sunt
+verificate complet (cifra de control, data nasterii, judet), iar varsta este
+calculata din data nasterii din CNP (coloana 'varsta' poate lipsi).
+"""
+
+import os
+import csv
+import json
+import time
+import stil
+import validari
+import decodare_cnp
+import incarcare_salvare
+from angajat import Angajat
+from registru import RegistruAngajati
+from datetime import date
+from itertools import islice
+from typing import Container, Iterator
+
+campuri: tuple[str, ...] = ("cnp", "nume", "prenume", "varsta", "salar", "departament", "senioritate")
+campuri_obligatorii: tuple[str, ...] = tuple(camp for camp in campuri if camp != "varsta")
+formate: tuple[str, ...] = ("csv", "jsonl")
+nume_raport_erori: str = "raport_import_erori.csv"
+marime_lot: int = 4096
+
+
+def _ca_text(valoare) -> str:
+    """Transforma o valoare citita (text sau numar JSON) in textul primit de validari."""
+    if isinstance(valoare, float) and valoare.is_integer():
+        return str(int(valoare))
+    text: str = str(valoare).strip()
+    if text.endswith(".0") and text[:-2].isdigit():
+        return text[:-2]
+    return text
+
+
+def citeste_randuri(cale: str) -> Iterator[tuple[int, dict | str]]:
+    """
+    Citeste randurile unui fisier CSV (cu antet) sau JSON Lines, pe rand.
+
+    Formatul este ales dupa extensie (.csv sau .jsonl).
+
+    Args:
+        cale (str): Fisierul de import.
+
+    Yields:
+        tuple[int, dict | str]: Numarul liniei si randul (camp -> valoare) sau,
+                                pentru o linie JSON invalida, mesajul de eroare.
+
+    Raises:
+        ValueError: Daca extensia nu este cunoscuta sau antetul CSV nu are toate campurile obligatorii.
+    """
+    extensie: str = os.path.splitext(cale)[1].lower().lstrip(".")
+    if extensie not in formate:
+        raise ValueError(f"format necunoscut: {extensie or cale} (acceptate: {', '.join(formate)})")
+
+    with open(cale, "r", encoding="utf-8-sig", newline="") as my_file:
+        if extensie == "csv":
+            cititor: csv.DictReader = csv.DictReader(my_file)
+            lipsa: list[str] = [camp for camp in campuri_obligatorii if camp not in (cititor.fieldnames or [])]
+            if lipsa:
+                raise ValueError(f"coloane lipsa in antetul CSV: {', '.join(lipsa)}")
+            for rand in cititor:
+                yield cititor.line_num, rand
+            return
+
+        for numar_linie, linie in enumerate(my_file, start=1):
+            if not linie.strip():
+                continue
+            try:
+                rand = json.loads(linie)
+            except json.JSONDecodeError as eroare:
+                yield numar_linie, f"JSON invalid: {eroare.msg}"
+                continue
+            yield numar_linie, rand if isinstance(rand, dict) else "linia nu este un obiect JSON"
+
+
+def valideaza_lot(randuri: list[dict], cnp_existente: Container[str], cnp_acceptate: set[str]) -> list[tuple[Angajat | None, list[tuple[str, str]]]]:
+    """
+    Valideaza un lot de randuri de import cu regulile din validari si construieste angajatii.
+
+    Varsta este calculata din CNP (decodare_cnp, o trecere pe lot); o varsta
+    din fisier care contrazice CNP-ul este inlocuita.
+    Campurile sunt verificate pe coloane (validari.valideaza_coloane), fara
+    mesaje afisate; unicitatea CNP-ului este verificata rand cu rand, in ordine,
+    deci un CNP repetat in acelasi lot este acceptat doar prima data. Valorile
+    sunt normalizate ca in adaugare_angajat (nume cu majuscula, departament cu
+    litere mari, senioritate cu litere mici).
+
+    Args:
+        randuri (list[dict]): Randurile citite (camp -> valoare).
+        cnp_existente (Container[str]): CNP-urile deja folosite (ex: registrul).
+        cnp_acceptate (set[str]): CNP-urile acceptate din randurile anterioare ale
+                                  fisierului; CNP-urile acceptate din lot sunt adaugate aici.
+
+    Returns:
+        list[tuple[Angajat | None, list[tuple[str, str]]]]: Pentru fiecare rand,
+            angajatul (None daca randul este invalid) si erorile gasite, ca perechi (camp, mesaj).
+    """
+    valori: list[dict[str, str]] = [{camp: _ca_text(rand[camp]) for camp in campuri if rand.get(camp) not in (None, "")} for rand in randuri]
+    azi: date = date.today()
+    for rand, decodat in zip(valori, decodare_cnp.decodeaza_coloana(rand.get("cnp", "") for rand in valori)):
+        if "departament" in rand:
+            rand["departament"] = rand["departament"].upper()
+        if decodat is not None:
+            # varsta din fisier este ignorata cand exista CNP-ul: nu o poate contrazice
+            rand["varsta"] = str(decodat.varsta(azi))
+    coloane: dict[str, list[str]] = {camp: [rand.get(camp, "") for rand in valori] for camp in campuri}
+    erori_coloane: dict = validari.valideaza_coloane(coloane, cnp_strict=True)
+
+    rezultate: list[tuple[Angajat | None, list[tuple[str, str]]]] = []
+    for pozitie, rand in enumerate(valori):
+        erori: list[tuple[str, str]] = [(camp, "valoare lipsa") for camp in campuri if camp not in rand]
+        erori.extend((camp, eroare.text()) for camp, eroare in erori_coloane.get(pozitie, ()) if camp in rand)
+        if "cnp" in rand and (rand["cnp"] in cnp_acceptate or rand["cnp"] in cnp_existente):
+            erori.append(("cnp", f"CNP-ul {rand['cnp']} este deja folosit"))
+        if erori:
+            rezultate.append((None, erori))
+            continue
+        cnp_acceptate.add(rand["cnp"])
+        rezultate.append((Angajat(
+            cnp=rand["cnp"],
+            nume=rand["nume"].strip().capitalize(),
+            prenume=rand["prenume"].strip().title(),
+            varsta=int(rand["varsta"]),
+            salar=float(rand["salar"]),
+            departament=rand["departament"],
+            senioritate=rand["senioritate"].lower(),
+        ), []))
+    return rezultate
+
+
+def importa_fisier(angajati: RegistruAngajati, cale: str, cale_erori: str | None = nume_raport_erori) -> dict:
+    """
+    Importa angajatii dintr-un fisier CSV/JSONL: valideaza toate randurile, adauga randurile valide si salveaza o singura data.
+
+    Daca salvarea esueaza, angajatii adaugati sunt scosi din registru, iar
+    loturile deja scrise in jurnal sunt taiate din el, deci registrul ramane
+    la fel ca fisierele de stocare (totul sau nimic).
+
+    Exemple:
+        rezultat = importa_fisier(registru, "angajati_noi.csv")
+        rezultat["importati"], rezultat["erori"]
+
+    Args:
+        angajati (RegistruAngajati): Registrul in care se adauga angajatii.
+        cale (str): Fisierul de import (.csv sau .jsonl).
+        cale_erori (str | None): Raportul CSV de erori (linie, cnp, camp, eroare);
+                                 None = nu se scrie raportul.
+
+    Returns:
+        dict: "randuri" (citite), "importati", "erori" (lista de tupluri
+              (linie, cnp, camp, mesaj)), "salvat" (bool) si "secunde".
+
+    Raises:
+        ValueError: Daca formatul fisierului nu este cunoscut sau antetul CSV este incomplet.
+    """
+    inceput: float = time.perf_counter()
+    # in modurile cu jurnal fiecare lot este scris imediat (o adaugare in jurnal)
+    pe_loturi: bool = incarcare_salvare.mod_stocare in ("jurnal", "binar")
+    marime_jurnal: int = incarcare_salvare.marime_jurnal() if pe_loturi else 0
+    salvat: bool = True
+    noi: list[Angajat] = []
+    erori: list[tuple[int, str, str, str]] = []
+    cnp_fisier: set[str] = set()
+    randuri: int = 0
+    iterator: Iterator[tuple[int, dict | str]] = citeste_randuri(cale)
+    while True:
+        lot: list[tuple[int, dict | str]] = list(islice(iterator, marime_lot))
+        if not lot:
+            break
+        randuri += len(lot)
+        valide: list[tuple[int, dict]] = []
+        for numar_linie, rand in lot:
+            if isinstance(rand, str):
+                erori.append((numar_linie, "", "", rand))
+            else:
+                valide.append((numar_linie, rand))
+        rezultate = valideaza_lot([rand for _, rand in valide], angajati, cnp_fisier)
+        noi_lot: list[Angajat] = []
+        for (numar_linie, rand), (angajat, probleme) in zip(valide, rezultate):
+            if angajat is None:
+                cnp: str = _ca_text(rand.get("cnp") or "")
+                erori.extend((numar_linie, cnp, camp, mesaj) for camp, mesaj in probleme)
+            else:
+                noi_lot.append(angajat)
+        angajati.adauga_lot(noi_lot)
+        noi.extend(noi_lot)
+        if pe_loturi and salvat and noi_lot:
+            salvat = incarcare_salvare.inregistreaza_adaugari(angajati, noi_lot, compacteaza=False)
+
+    if not pe_loturi:
+        salvat = not noi or incarcare_salvare.inregistreaza_adaugari(angajati, noi)
+    elif salvat and incarcare_salvare.trebuie_compactat():
+        # loturile sunt deja in jurnal; o compactare esuata le lasa acolo
+        incarcare_salvare.salveaza_fisier_angajati(angajati)
+    if not salvat:
+        if pe_loturi:
+            incarcare_salvare.trunchiaza_jurnal(marime_jurnal)
+        for angajat in noi:
+            angajati.sterge(angajat)
+
+    if cale_erori is not None and erori:
+        with open(cale_erori, "w", encoding="utf-8", newline="") as my_file:
+            scriitor = csv.writer(my_file)
+            scriitor.writerow(["linie", "cnp", "camp", "eroare"])
+            scriitor.writerows(erori)
+
+    return {"randuri": randuri, "importati": len(noi) if salvat else 0, "erori": erori, "salvat": salvat, "secunde": time.perf_counter() - inceput}
+
+
+def importa_angajati(angajati: RegistruAngajati) -> None:
+    """
+    Importa angajati in masa dintr-un fisier CSV sau JSONL.
+
+    Toate randurile sunt validate cu regulile din validari; randurile valide
+    sunt adaugate si salvate o singura data, iar erorile (linie, CNP, camp,
+    motiv) sunt scrise in raport_import_erori.csv.
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia adauga angajatii si afiseaza rezultatul in consola.
+
+    Note:
+        - Fisierul CSV trebuie sa aiba antet cu coloanele: cnp, nume, prenume,
+          varsta, salar, departament, senioritate (alte coloane sunt ignorate);
+          varsta poate lipsi, fiind calculata oricum din CNP
+        - Un fisier JSONL are cate un obiect JSON cu aceleasi campuri pe linie
+        - Utilizatorul poate introduce '0' pentru a reveni la meniu
+    """
+    stil.titlu(" ---> Import angajati din CSV/JSONL")
+
+    while True:
+        cale: str = input(f"Calea fisierului {stil.GALBEN}(.csv / .jsonl){stil.RESET} sau {stil.GALBEN}'0'{stil.RESET} pentru meniu: ").strip()
+        if cale == "0":
+            return
+        if os.path.isfile(cale):
+            break
+        stil.eroare(f"Fisierul nu exista -> {stil.evidentiaza(cale)}")
+
+    try:
+        rezultat: dict = importa_fisier(angajati, cale)
+    except ValueError as eroare:
+        stil.eroare(f"Fisierul nu poate fi importat: {eroare}")
+        return
+
+    if not rezultat["salvat"]:
+        stil.eroare("Nu s-a putut salva! Niciun angajat nu a fost importat.")
+    else:
+        stil.succes(f"Au fost importati {rezultat['importati']} angajati din {rezultat['randuri']} randuri in {rezultat['secunde']:.2f} s")
+
+    erori: list[tuple[int, str, str, str]] = rezultat["erori"]
+    if erori:
+        stil.atentionare(f"{len(erori)} erori, raportul complet in {stil.evidentiaza(nume_raport_erori)}")
+        for numar_linie, cnp, camp, mesaj in erori[:10]:
+            stil.eroare(f"Linia {numar_linie} (CNP {cnp or '-'}) {camp}: {mesaj}")
+        if len(erori) > 10:
+            stil.eroare(f"... si inca {len(erori) - 10} erori")
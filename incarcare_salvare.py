@@ -3,15 +3,47 @@ Modulul incarcare_salvare gestioneaza operatiunile de citire si scriere a datelo
 din/in fisierul JSON principal (angajati.json).
 
 Acest modul asigura persistenta datelor intre sesiuni ale aplicatiei.
+
+Moduri de stocare (variabila 'mod_stocare'):
+- "json": fiecare modificare rescrie complet fisierul angajati.json
+- "jurnal": fiecare modificare este adaugata ca o inregistrare mica in
+  angajati.jurnal, iar la pornire jurnalul este reaplicat peste ultimul
+  instantaneu (angajati.json). Compactarea rescrie instantaneul cand jurnalul
+  depaseste pragul de marime sau de vechime.
+- "sqlite": angajatii sunt pastrati in baza de date angajati.db (vezi modulul
+  stocare_sqlite), iar fiecare modificare actualizeaza un singur rand.
+- "binar": ca "jurnal", dar instantaneul este fisierul binar angajati.bin
+  (vezi modulul instantaneu_binar), deschis prin mmap la pornire, iar
+  jurnalul lui este angajati.bin.jurnal.
+
+Fiecare format de instantaneu are jurnalul lui, deci un jurnal este reaplicat
+doar peste instantaneul pe care l-a continuat. Daca modul este schimbat intre
+porniri (ex: din "binar" in "jurnal"), datele sunt citite din formatul scris
+ultimul si rescrise imediat in formatul modului curent.
 """
 
 import os
 import json
+import time
+import struct
+import sqlite3
 import stil
+import stocare_sqlite
+import instantaneu_binar
+from angajat import Angajat
+from registru import RegistruAngajati, RegistruLenes
+from typing import Iterable, Iterator
 
 nume_fisier = "angajati.json"
+nume_jurnal = "angajati.jurnal"
+nume_instantaneu_binar = "angajati.bin"
+nume_jurnal_binar = "angajati.bin.jurnal"
+
+mod_stocare: str = os.environ.get("ANGAJATI_STOCARE", "jurnal")
+prag_compactare_octeti: int = 1_000_000
+prag_compactare_secunde: int = 3600
 
-def incarca_fisier_angajati() -> list[dict]:
+def incarca_fisier_angajati() -> list[Angajat]:
     """
     Incarca datele angajatilor din fisierul JSON de stocare.
     
@@ -25,28 +57,265 @@ def incarca_fisier_angajati() -> list[dict]:
     Formatul fisierului JSON este o lista de dictionare, fiecare dictionar
     reprezentand un angajat cu urmatoarele campuri:
     - cnp, nume, prenume, varsta, salar, departament, senioritate
+    Dictionarele sunt convertite in obiecte Angajat chiar in timpul decodarii.
     
     Returns:
-        list[dict]: Lista de dictionare cu datele angajatilor sau lista goala
-                    daca fisierul nu exista sau este corupt.
+        list[Angajat]: Lista cu datele angajatilor sau lista goala
+                       daca fisierul nu exista sau este corupt.
                     
+    In modul "jurnal", modificarile din angajati.jurnal sunt reaplicate peste
+    datele citite din fisierul JSON (ultimul instantaneu); un jurnal ramas este
+    reaplicat si in modul "json", care il sterge apoi la prima salvare. In modul "sqlite",
+    datele sunt citite din angajati.db; la prima pornire baza de date este
+    creata prin migrarea datelor salvate (vezi citeste_date_salvate). In modul
+    "binar", instantaneul angajati.bin este deschis prin mmap, iar peste el
+    este reaplicat angajati.bin.jurnal.
+
+    Daca celalalt format de instantaneu (JSON sau binar) a fost scris dupa cel
+    al modului curent, modul a fost schimbat intre porniri: datele sunt citite
+    din formatul mai nou si rescrise imediat in formatul modului curent (ex: la
+    prima pornire in modul "binar" angajati.bin este creat din angajati.json).
+
     Note:
         - Fisierul este citit cu encoding UTF-8 pentru suport caractere speciale
         - Erorile de tip JSONDecodeError si IOError sunt prinse si tratate graceful
-        - Nu se opreste executia aplicatiei in caz de eroare de citire
+        - Nu se opreste executia aplicatiei in caz de eroare de citire; exceptie
+          fac migrarea esuata in angajati.db (vezi _migreaza_in_sqlite) si
+          conversia esuata intre formate (vezi _converteste_instantaneu)
+    """
+    if mod_stocare == "sqlite":
+        if not os.path.exists(stocare_sqlite.nume_baza_date):
+            return _migreaza_in_sqlite()
+        return stocare_sqlite.incarca_angajati()
+
+    binar: bool = mod_stocare == "binar"
+    if _ultima_scriere(not binar) > _ultima_scriere(binar):
+        return _converteste_instantaneu(not binar)
+    return citeste_instantaneu(binar)
+
+
+def incarca_registru() -> RegistruAngajati:
+    """
+    Deschide registrul de angajati folosit de aplicatie, dupa 'mod_stocare'.
+
+    In modul "sqlite" registrul este RegistruSqlite, care interogheaza direct
+    angajati.db (la prima pornire baza de date este creata prin migrarea din
+    angajati.json). In modul "binar" registrul este un RegistruLenes: la
+    pornire se verifica doar daca modul a fost schimbat (vezi
+    incarca_fisier_angajati), iar angajati.bin si jurnalul lui sunt citite la
+    prima folosire a registrului. In celelalte moduri angajatii sunt incarcati
+    cu incarca_fisier_angajati intr-un RegistruAngajati din memorie.
+
+    Returns:
+        RegistruAngajati: Registrul de angajati.
+    """
+    if mod_stocare == "sqlite":
+        if not os.path.exists(stocare_sqlite.nume_baza_date):
+            _migreaza_in_sqlite()
+        return stocare_sqlite.RegistruSqlite()
+    if mod_stocare == "binar" and _ultima_scriere(False) <= _ultima_scriere(True):
+        return RegistruLenes(lambda: citeste_instantaneu(binar=True))
+    return RegistruAngajati(incarca_fisier_angajati())
+
+
+def _migreaza_in_sqlite() -> list[Angajat]:
+    """
+    Migreaza datele salvate (vezi citeste_date_salvate) in angajati.db; opreste aplicatia daca migrarea esueaza.
+
+    Daca aplicatia ar continua cu un registru gol, prima adaugare ar crea
+    angajati.db doar cu acel angajat, iar migrarea nu ar mai fi incercata
+    niciodata (datele din angajati.json ar disparea in modul "sqlite"). Din
+    acelasi motiv, un instantaneu care nu poate fi citit opreste migrarea.
+
+    Returns:
+        list[Angajat]: Angajatii migrati.
+
+    Raises:
+        SystemExit: Daca datele nu pot fi citite sau migrarea esueaza (ex: CNP
+                    duplicat in angajati.json).
+    """
+    binar: bool = _ultima_scriere(True) > _ultima_scriere(False)
+    sursa: str = _fisiere_instantaneu(binar)[0]
+    try:
+        date: list[Angajat] = _citeste_instantaneu(binar)
+        stocare_sqlite.migreaza(date)
+    except (ValueError, KeyError, struct.error, IOError) as erroare_citire:
+        stil.eroare(f"Ai o mica eroare la citirea fisierului {sursa} : {erroare_citire}")
+        stil.eroare(f"Corecteaza {sursa} si porneste din nou aplicatia (datele nu au fost modificate)")
+        raise SystemExit(1)
+    except sqlite3.Error as erroare_migrare:
+        stil.eroare(f"Ai o mica eroare la migrarea in baza de date (ex: CNP duplicat in {sursa}) : {erroare_migrare}")
+        stil.eroare(f"Corecteaza {sursa} si porneste din nou aplicatia (datele nu au fost modificate)")
+        raise SystemExit(1)
+    return date
+
+
+def _converteste_instantaneu(binar: bool) -> list[Angajat]:
+    """
+    Citeste datele din celalalt format de instantaneu si le rescrie in formatul modului curent.
+
+    Este apelata cand modul a fost schimbat intre porniri (ex: din "binar" in
+    "jurnal"): instantaneul modului curent si jurnalul lui sunt mai vechi decat
+    celalalt format, deci nu pot fi folosite. Daca citirea sau rescrierea
+    esueaza, aplicatia este oprita: altfel modificarile urmatoare ar fi
+    inregistrate peste un instantaneu vechi.
+
+    Args:
+        binar (bool): True = datele sunt citite din angajati.bin, False = din angajati.json.
+
+    Returns:
+        list[Angajat]: Angajatii cititi.
+
+    Raises:
+        SystemExit: Daca datele nu pot fi citite sau rescrise.
+    """
+    sursa: str = _fisiere_instantaneu(binar)[0]
+    destinatie: str = _fisiere_instantaneu(not binar)[0]
+    try:
+        date: list[Angajat] = _citeste_instantaneu(binar)
+    except (ValueError, KeyError, struct.error, IOError) as erroare_citire:
+        stil.eroare(f"Ai o mica eroare la citirea fisierului {sursa} : {erroare_citire}")
+        stil.eroare(f"Corecteaza {sursa} sau porneste aplicatia in modul in care a fost scris (datele nu au fost modificate)")
+        raise SystemExit(1)
+    stil.atentionare(f"Datele cele mai noi sunt in {sursa}, ele sunt rescrise in {destinatie} (modul '{mod_stocare}')")
+    if not salveaza_fisier_angajati(date):
+        raise SystemExit(1)
+    return date
+
+
+def _fisiere_instantaneu(binar: bool) -> tuple[str, str]:
+    """Returneaza (instantaneu, jurnal) pentru formatul binar sau JSON."""
+    return (nume_instantaneu_binar, nume_jurnal_binar) if binar else (nume_fisier, nume_jurnal)
+
+
+def jurnal_curent() -> str:
+    """Returneaza jurnalul formatului de instantaneu al modului curent (angajati.jurnal sau angajati.bin.jurnal)."""
+    return _fisiere_instantaneu(mod_stocare == "binar")[1]
+
+
+def _ultima_scriere(binar: bool) -> int:
+    """Returneaza momentul (ns) ultimei scrieri a instantaneului sau a jurnalului unui format (0 daca lipsesc)."""
+    return max((os.stat(cale).st_mtime_ns for cale in _fisiere_instantaneu(binar) if os.path.exists(cale)), default=0)
+
+
+def _citeste_instantaneu(binar: bool) -> list[Angajat]:
+    """
+    Citeste instantaneul binar sau JSON si reaplica peste el jurnalul formatului.
+
+    Raises:
+        ValueError, KeyError, struct.error, IOError: Daca instantaneul nu poate fi citit.
+    """
+    cale, jurnal = _fisiere_instantaneu(binar)
+    date: list[Angajat] = []
+    if binar and os.path.exists(cale):
+        with instantaneu_binar.InstantaneuBinar(cale) as instantaneu:
+            date = list(instantaneu)
+    elif os.path.exists(cale):
+        with open(cale, "r", encoding="utf-8") as my_file:
+            date = json.load(my_file, object_hook=Angajat.din_dict)
+    reaplica_jurnal(date, jurnal)
+    return date
+
+
+def citeste_instantaneu(binar: bool = False) -> list[Angajat]:
+    """
+    Citeste instantaneul binar sau JSON si reaplica jurnalul lui (daca exista).
+
+    Args:
+        binar (bool): True = angajati.bin si angajati.bin.jurnal, False = angajati.json si angajati.jurnal.
+
+    Returns:
+        list[Angajat]: Angajatii cititi sau lista goala daca instantaneul este corupt.
     """
-    if not os.path.exists(nume_fisier):
-        return []
     try:
-        with open(nume_fisier, "r", encoding="utf-8") as my_file:
-            date: list[dict] = json.load(my_file)
-            return date
-    except (json.JSONDecodeError, IOError) as erroare_incarcare:
-        stil.eroare(f"Ai o mica eroare la citirea fisierului : {erroare_incarcare}")
-        return []
+        return _citeste_instantaneu(binar)
+    except KeyError as camp_lipsa:
+        stil.eroare(f"Ai o mica eroare la citirea fisierului : un angajat nu are campul {camp_lipsa}")
+    except (ValueError, struct.error, IOError) as erroare_incarcare:
+        stil.eroare(f"Ai o mica eroare la citirea fisierului {_fisiere_instantaneu(binar)[0]} : {erroare_incarcare}")
+    return []
+
+
+def citeste_date_salvate() -> list[Angajat]:
+    """Citeste angajatii din formatul de instantaneu (JSON sau binar) scris ultimul, cu jurnalul lui."""
+    return citeste_instantaneu(_ultima_scriere(True) > _ultima_scriere(False))
+
+
+def itereaza_angajati(cale: str = nume_fisier, marime_bloc: int = 1 << 16) -> Iterator[Angajat]:
+    """
+    Citeste incremental fisierul JSON si returneaza cate un angajat pe rand.
+
+    Spre deosebire de incarca_fisier_angajati, fisierul nu este incarcat
+    complet in memorie: se citesc blocuri de 'marime_bloc' caractere, iar
+    fiecare obiect din lista principala este decodat cu JSONDecoder.raw_decode
+    imediat ce este complet. Memoria folosita depinde de marimea unui angajat,
+    nu de marimea fisierului, deci si exporturi de cativa GB pot fi procesate.
+
+    Exemple:
+        total = calculare.obtine_total_salarii(itereaza_angajati("export_hr.json"))
+        membri_it = raport.filtreaza(itereaza_angajati("export_hr.json"), raport.FiltruRaport(departament="IT"))
+        exportare.exporta_fluturasi_paralel(itereaza_angajati("export_hr.json"))
+
+    Args:
+        cale (str): Calea catre fisierul JSON (o lista de dictionare).
+        marime_bloc (int): Numarul de caractere citite la fiecare pas.
+
+    Yields:
+        Angajat: Cate un angajat, pe rand.
+
+    Raises:
+        ValueError: Daca fisierul nu contine o lista JSON valida.
+
+    Note:
+        - Jurnalul de modificari nu este aplicat (citire doar din instantaneu)
+        - Daca fisierul nu exista, generatorul nu returneaza nimic
+    """
+    if not os.path.exists(cale):
+        return
+
+    decodor = json.JSONDecoder()
+    with open(cale, "r", encoding="utf-8") as my_file:
+        tampon: str = ""
+        pozitie: int = 0
+        sfarsit_fisier: bool = False
+        inceput_lista: bool = False
+
+        while True:
+            while pozitie < len(tampon) and tampon[pozitie] in " \t\r\n,":
+                pozitie += 1
+
+            if pozitie >= len(tampon):
+                if sfarsit_fisier:
+                    raise ValueError(f"Fisierul {cale} se termina inainte de ']'")
+                tampon = my_file.read(marime_bloc)
+                pozitie = 0
+                sfarsit_fisier = not tampon
+                continue
+
+            if not inceput_lista:
+                if tampon[pozitie] != "[":
+                    raise ValueError(f"Fisierul {cale} nu contine o lista JSON")
+                inceput_lista = True
+                pozitie += 1
+                continue
 
+            if tampon[pozitie] == "]":
+                return
 
-def salveaza_fisier_angajati(angajati: list[dict]) -> bool:
+            try:
+                angajat, pozitie = decodor.raw_decode(tampon, pozitie)
+            except json.JSONDecodeError:
+                if sfarsit_fisier:
+                    raise ValueError(f"Fisierul {cale} contine un angajat invalid sau incomplet")
+                bloc: str = my_file.read(marime_bloc)
+                sfarsit_fisier = not bloc
+                tampon = tampon[pozitie:] + bloc
+                pozitie = 0
+                continue
+            yield Angajat.din_dict(angajat)
+
+
+def salveaza_fisier_angajati(angajati: Iterable[Angajat]) -> bool:
     """
     Salveaza lista curenta de angajati in fisierul JSON de stocare.
     
@@ -59,24 +328,260 @@ def salveaza_fisier_angajati(angajati: list[dict]) -> bool:
     este necesar (debugging sau editare manuala).
     
     Args:
-        angajati (list[dict]): Lista completa de angajati care trebuie salvata.
-                               Fiecare element este un dictionar cu datele angajatului.
+        angajati (Iterable[Angajat]): Lista completa de angajati care trebuie salvata.
+                                  Fiecare angajat este scris ca dictionar JSON.
         
     Returns:
         bool: True daca salvarea a reusit cu succes, False daca a aparut o eroare
               (de exemplu: permisiuni insuficiente, disk plin, etc.)
               
     Note:
-        - Fisierul este suprascris complet de fiecare data (nu append)
+        - Fisierul este suprascris complet de fiecare data (nu append), printr-un
+          fisier temporar, iar jurnalul formatului este golit (compactare)
         - Encoding UTF-8 asigura suport pentru caractere romanesti
         - In caz de eroare, mesajul este afisat dar aplicatia continua
+        - In modul "sqlite" tabela este rescrisa intr-o singura tranzactie
+        - In modul "binar" se scrie instantaneul binar angajati.bin (si se
+          goleste angajati.bin.jurnal)
     """
+    if mod_stocare == "sqlite":
+        try:
+            stocare_sqlite.salveaza_angajati(angajati)
+            return True
+        except sqlite3.Error as error_save:
+            stil.eroare(f"Ai o mica eroare la salvarea in baza de date : {error_save}")
+            return False
+
     try:
-        with open(nume_fisier, "w" , encoding="utf-8") as my_file:
-            json.dump(angajati, my_file, indent=4)
+        if mod_stocare == "binar":
+            instantaneu_binar.scrie_instantaneu(angajati, nume_instantaneu_binar)
+            if os.path.exists(nume_jurnal_binar):
+                os.remove(nume_jurnal_binar)
+            return True
+
+        fisier_temporar: str = nume_fisier + ".tmp"
+        with open(fisier_temporar, "w" , encoding="utf-8") as my_file:
+            json.dump(list(angajati), my_file, indent=4, default=Angajat.in_dict)
+        os.replace(fisier_temporar, nume_fisier)
+        if os.path.exists(nume_jurnal):
+            os.remove(nume_jurnal)
         return True
     except IOError as error_save:
         stil.eroare(f"Ai o mica eroare la salvarea fisierului : {error_save}")
         return False
-    
+
+
+def inregistreaza_modificare(angajati: Iterable[Angajat], operatie: str, angajat: Angajat, cnp_vechi: str | None = None) -> bool:
+    """
+    Persista o singura modificare (adaugare, modificare sau stergere).
+
+    Este punctul de salvare apelat de operatiunile CRUD din operatiuni_date.
+    In functie de 'mod_stocare':
+    - "json": rescrie complet fisierul (comportamentul clasic)
+    - "jurnal": adauga o singura linie in angajati.jurnal, deci costul scrierii
+      depinde doar de marimea modificarii, nu de numarul de angajati
+    - "binar": la fel, in angajati.bin.jurnal
+    - "sqlite": actualizeaza un singur rand in baza de date
+
+    Dupa adaugarea in jurnal se verifica pragurile de compactare; daca sunt
+    depasite, instantaneul este rescris si jurnalul golit.
+
+    Args:
+        angajati (Iterable[Angajat]): Lista completa de angajati (dupa modificare).
+        operatie (str): Una din "adaugare", "modificare", "stergere".
+        angajat (Angajat): Angajatul afectat (starea noua).
+        cnp_vechi (str | None): CNP-ul inainte de modificare, pentru operatia
+                                "modificare" (CNP-ul poate fi schimbat).
+
+    Returns:
+        bool: True daca modificarea a fost persistata, False in caz de eroare.
+    """
+    if mod_stocare == "sqlite":
+        try:
+            stocare_sqlite.aplica_modificare(operatie, angajat, cnp_vechi)
+            return True
+        except sqlite3.Error as error_save:
+            stil.eroare(f"Ai o mica eroare la salvarea in baza de date : {error_save}")
+            return False
+    if mod_stocare not in ("jurnal", "binar"):
+        return salveaza_fisier_angajati(angajati)
+
+    inregistrare: dict = {"op": operatie, "cnp": cnp_vechi or angajat.cnp}
+    if operatie != "stergere":
+        inregistrare["angajat"] = angajat.in_dict()
+    try:
+        _adauga_in_jurnal(json.dumps(inregistrare) + "\n")
+    except IOError as error_save:
+        stil.eroare(f"Ai o mica eroare la scrierea jurnalului : {error_save}")
+        return False
+
+    if trebuie_compactat():
+        return salveaza_fisier_angajati(angajati)
+    return True
+
+
+def inregistreaza_adaugari(angajati: Iterable[Angajat], noi: list[Angajat], compacteaza: bool = True) -> bool:
+    """
+    Persista dintr-o data adaugarea mai multor angajati (ex: un import in masa).
+
+    In functie de 'mod_stocare':
+    - "json": fisierul este rescris o singura data
+    - "jurnal"/"binar": toate adaugarile sunt scrise in jurnal printr-o singura
+      scriere, apoi se verifica pragurile de compactare (o data); un lot mai
+      mare decat pragul de compactare rescrie direct instantaneul
+    - "sqlite": toate randurile sunt inserate intr-o singura tranzactie
+
+    Args:
+        angajati (Iterable[Angajat]): Lista completa de angajati (dupa adaugare).
+        noi (list[Angajat]): Angajatii adaugati.
+        compacteaza (bool): False = in modurile "jurnal"/"binar" adaugarile sunt
+                            doar scrise in jurnal, fara verificarea pragurilor
+                            (ex: un import scris lot cu lot, compactat o data la final).
+
+    Returns:
+        bool: True daca adaugarile au fost persistate, False in caz de eroare.
+    """
+    if mod_stocare == "sqlite":
+        try:
+            stocare_sqlite.adauga_angajati(noi)
+            return True
+        except sqlite3.Error as error_save:
+            stil.eroare(f"Ai o mica eroare la salvarea in baza de date : {error_save}")
+            return False
+    if mod_stocare not in ("jurnal", "binar"):
+        return salveaza_fisier_angajati(angajati)
+
+    linii: str = "".join(json.dumps({"op": "adaugare", "cnp": persoana.cnp, "angajat": persoana.in_dict()}) + "\n" for persoana in noi)
+    if compacteaza and len(linii) >= prag_compactare_octeti:
+        # jurnalul ar fi compactat imediat: instantaneul este rescris direct (atomic)
+        return salveaza_fisier_angajati(angajati)
+    try:
+        _adauga_in_jurnal(linii)
+    except IOError as error_save:
+        stil.eroare(f"Ai o mica eroare la scrierea jurnalului : {error_save}")
+        return False
+
+    if compacteaza and trebuie_compactat():
+        return salveaza_fisier_angajati(angajati)
+    return True
+
+
+def marime_jurnal() -> int:
+    """Returneaza marimea in octeti a jurnalului modului curent (0 daca nu exista)."""
+    jurnal: str = jurnal_curent()
+    return os.path.getsize(jurnal) if os.path.exists(jurnal) else 0
+
+
+def trunchiaza_jurnal(marime: int) -> None:
+    """
+    Readuce jurnalul modului curent la marimea data (vezi marime_jurnal).
+
+    Este folosita pentru a anula inregistrarile adaugate dupa un anumit punct
+    (ex: loturile deja scrise ale unui import care nu a putut fi salvat complet).
+    """
+    jurnal: str = jurnal_curent()
+    if not marime:
+        if os.path.exists(jurnal):
+            os.remove(jurnal)
+        return
+    with open(jurnal, "r+b") as my_file:
+        my_file.truncate(marime)
+
+
+def _adauga_in_jurnal(linii: str) -> None:
+    """
+    Adauga linii la sfarsitul jurnalului modului curent (vezi jurnal_curent).
+
+    Daca jurnalul nu se termina cu o linie noua (ex: o scriere intrerupta), se incepe
+    cu o linie noua, altfel prima inregistrare noua s-ar lipi de linia
+    incompleta si s-ar pierde amandoua la reaplicare.
+    """
+    jurnal: str = jurnal_curent()
+    with open(jurnal, "ab") as my_file:
+        if my_file.tell() > 0:
+            with open(jurnal, "rb") as citire:
+                citire.seek(-1, os.SEEK_END)
+                if citire.read(1) != b"\n":
+                    linii = "\n" + linii
+        my_file.write(linii.encode("utf-8"))
+
+
+def trebuie_compactat() -> bool:
+    """
+    Verifica daca jurnalul a depasit pragul de marime sau de vechime.
+
+    Vechimea este masurata fata de ultima scriere a instantaneului
+    (data modificarii fisierului angajati.json sau angajati.bin).
+
+    Returns:
+        bool: True daca instantaneul trebuie rescris.
+    """
+    instantaneu, jurnal = _fisiere_instantaneu(mod_stocare == "binar")
+    if not os.path.exists(jurnal):
+        return False
+    if os.path.getsize(jurnal) >= prag_compactare_octeti:
+        return True
+    if not os.path.exists(instantaneu):
+        return True
+    return time.time() - os.path.getmtime(instantaneu) >= prag_compactare_secunde
+
+
+def reaplica_jurnal(angajati: list[Angajat], jurnal: str = nume_jurnal) -> None:
+    """
+    Reaplica peste lista incarcata modificarile inregistrate in jurnal.
+
+    Fiecare linie din jurnal este un obiect JSON de forma
+    {"op": ..., "cnp": ..., "angajat": {...}}. Pozitiile angajatilor sunt
+    cautate printr-un dictionar CNP -> index construit o singura data, iar
+    angajatii stersi sunt eliminati la final intr-o singura trecere, pastrand
+    ordinea din lista.
+
+    Reaplicarea este idempotenta: o adaugare sau o modificare deja prezenta in
+    instantaneu (ex: oprire intre rescrierea instantaneului si stergerea
+    jurnalului) inlocuieste inregistrarea existenta, fara duplicate.
+
+    Args:
+        angajati (list[Angajat]): Lista incarcata din instantaneu, modificata in-place.
+        jurnal (str): Jurnalul formatului instantaneului (angajati.jurnal sau angajati.bin.jurnal).
+
+    Note:
+        - O ultima linie incompleta (ex: oprire brusca) este ignorata cu avertisment
+    """
+    if not os.path.exists(jurnal):
+        return
+
+    pozitii: dict[str, int] = {persoana.cnp: index for index, persoana in enumerate(angajati)}
+    sterse: int = 0
+    with open(jurnal, "r", encoding="utf-8") as my_file:
+        for numar_linie, linie in enumerate(my_file, start=1):
+            if not linie.strip():
+                continue
+            try:
+                inregistrare: dict = json.loads(linie)
+                operatie: str = inregistrare["op"]
+                cnp: str = inregistrare["cnp"]
+                if operatie != "stergere":
+                    inregistrare["angajat"] = Angajat.din_dict(inregistrare["angajat"])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                stil.atentionare(f"Linia {numar_linie} din {jurnal} este incompleta si a fost ignorata")
+                continue
+
+            if operatie == "adaugare":
+                if cnp in pozitii:
+                    angajati[pozitii[cnp]] = inregistrare["angajat"]
+                else:
+                    pozitii[cnp] = len(angajati)
+                    angajati.append(inregistrare["angajat"])
+            elif operatie == "modificare" and (cnp in pozitii or inregistrare["angajat"].cnp in pozitii):
+                # daca CNP-ul vechi lipseste, modificarea este deja in instantaneu (sub CNP-ul nou)
+                index: int = pozitii.pop(cnp) if cnp in pozitii else pozitii.pop(inregistrare["angajat"].cnp)
+                angajati[index] = inregistrare["angajat"]
+                pozitii[angajati[index].cnp] = index
+            elif operatie == "stergere" and cnp in pozitii:
+                angajati[pozitii.pop(cnp)] = None
+                sterse += 1
+
+    if sterse:
+        angajati[:] = [persoana for persoana in angajati if persoana is not None]
+
 
@@ -0,0 +1,252 @@
+"""
+Modulul index_nume contine indexul de cautare dupa nume si prenume.
+
+Numele si prenumele sunt impartite in cuvinte normalizate (litere mici, fara
+diacritice, numele compuse "Ana-Maria" impartite la cratima). Vocabularul de
+cuvinte distincte este mult mai mic decat numarul de angajati (numele se
+repeta), iar pentru fiecare cuvant se tine multimea angajatilor care il
+poarta. Pe vocabular sunt construite:
+- o lista sortata, pentru completare dupa prefix cu bisect
+- un index de trigrame (grupuri de 3 litere), pentru cautarea toleranta la
+  greseli de scriere
+
+O cautare cu mai multe cuvinte ("pop ion") porneste de la cuvantul cel mai
+selectiv si verifica celelalte cuvinte doar pe angajatii gasiti, deci costul
+depinde de numarul de potriviri, nu de numarul total de angajati.
+"""
+
+import re
+import heapq
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Iterable
+
+
+def normalizeaza(text: str) -> str:
+    """
+    Aduce un nume la forma folosita in index: litere mici, fara diacritice.
+
+    Exemple:
+        "  Ștefan  Ion " -> "stefan ion"
+
+    Args:
+        text (str): Textul original.
+
+    Returns:
+        str: Textul normalizat.
+    """
+    if not text.isascii():
+        descompus: str = unicodedata.normalize("NFKD", text)
+        text = "".join(caracter for caracter in descompus if not unicodedata.combining(caracter))
+    return " ".join(text.lower().split())
+
+
+def tokenizeaza(text: str) -> list[str]:
+    """
+    Imparte un nume in cuvinte normalizate, fara duplicate.
+
+    Exemple:
+        "Popescu Ana-Maria" -> ["popescu", "ana", "maria"]
+
+    Args:
+        text (str): Numele (sau textul cautat).
+
+    Returns:
+        list[str]: Cuvintele, in ordinea aparitiei.
+    """
+    return list(dict.fromkeys(cuvant for cuvant in re.split(r"[\s\-]+", normalizeaza(text)) if cuvant))
+
+
+def trigrame(cuvant: str) -> set[str]:
+    """Returneaza trigramele unui cuvant normalizat (cu spatii la capete)."""
+    bordat: str = f"  {cuvant} "
+    return {bordat[pozitie:pozitie + 3] for pozitie in range(len(bordat) - 2)}
+
+
+class IndexNume:
+    """
+    Index pe nume si prenume pentru completare dupa prefix si cautare aproximativa.
+
+    Indexul lucreaza cu id-uri de angajati; registrul le transforma inapoi in
+    obiecte Angajat.
+
+    Exemple:
+        index = IndexNume()
+        index.adauga("Popescu", "Ion", id(angajat))
+        index.prefix("pop i")         -> [id(angajat)]
+        index.aproximativ("popesku")  -> [(id(angajat), 0.45...)]
+    """
+
+    def __init__(self) -> None:
+        self._cuvinte_angajat: dict[int, list[str]] = {}
+        # cuvant -> id-urile angajatilor care il poarta, in ordinea adaugarii
+        self._angajati_cuvant: dict[str, dict[int, None]] = {}
+        # vocabularul sortat; cuvintele noi sunt adaugate la sfarsit si sortate
+        # la prima cautare, deci incarcarea initiala nu plateste o insertie
+        # sortata pentru fiecare cuvant
+        self._vocabular: list[str] = []
+        self._nesortate: int = 0
+        self._trigrame_cuvant: dict[str, set[str]] = {}
+        self._liste_trigrame: dict[str, set[str]] = {}
+
+    def adauga(self, nume: str, prenume: str, identificator: int) -> None:
+        """Indexeaza numele si prenumele unui angajat."""
+        self._indexeaza(tokenizeaza(f"{nume} {prenume}"), identificator)
+
+    def adauga_lot(self, nume_angajati: Iterable[tuple[str, str, int]]) -> None:
+        """
+        Indexeaza mai multi angajati deodata, din tupluri (nume, prenume, id).
+
+        Numele complete care se repeta in lot sunt impartite in cuvinte o
+        singura data.
+        """
+        cuvinte_nume: dict[tuple[str, str], list[str]] = {}
+        for nume, prenume, identificator in nume_angajati:
+            cuvinte: list[str] | None = cuvinte_nume.get((nume, prenume))
+            if cuvinte is None:
+                cuvinte = cuvinte_nume[nume, prenume] = tokenizeaza(f"{nume} {prenume}")
+            self._indexeaza(cuvinte, identificator)
+
+    def _indexeaza(self, cuvinte: list[str], identificator: int) -> None:
+        self._cuvinte_angajat[identificator] = cuvinte
+        for cuvant in cuvinte:
+            purtatori: dict[int, None] | None = self._angajati_cuvant.get(cuvant)
+            if purtatori is not None:
+                purtatori[identificator] = None
+                continue
+            self._angajati_cuvant[cuvant] = {identificator: None}
+            self._vocabular.append(cuvant)
+            self._nesortate += 1
+            grupuri: set[str] = trigrame(cuvant)
+            self._trigrame_cuvant[cuvant] = grupuri
+            for grup in grupuri:
+                self._liste_trigrame.setdefault(grup, set()).add(cuvant)
+
+    def scoate(self, identificator: int) -> None:
+        """Scoate din index un angajat indexat anterior."""
+        for cuvant in self._cuvinte_angajat.pop(identificator):
+            purtatori: dict[int, None] = self._angajati_cuvant[cuvant]
+            del purtatori[identificator]
+            if purtatori:
+                continue
+            del self._angajati_cuvant[cuvant]
+            self._sorteaza()
+            del self._vocabular[bisect_left(self._vocabular, cuvant)]
+            for grup in self._trigrame_cuvant.pop(cuvant):
+                lista: set[str] = self._liste_trigrame[grup]
+                lista.discard(cuvant)
+                if not lista:
+                    del self._liste_trigrame[grup]
+
+    def _sorteaza(self) -> None:
+        if self._nesortate > 8:
+            self._vocabular.sort()
+        elif self._nesortate:
+            noi: list[str] = self._vocabular[-self._nesortate:]
+            del self._vocabular[-self._nesortate:]
+            for cuvant in noi:
+                insort(self._vocabular, cuvant)
+        self._nesortate = 0
+
+    def _cu_prefix(self, prefix: str) -> list[str]:
+        inceput: int = bisect_left(self._vocabular, prefix)
+        sfarsit: int = bisect_left(self._vocabular, prefix + "￿", inceput)
+        return self._vocabular[inceput:sfarsit]
+
+    def _numar_purtatori(self, cuvinte: Iterable[str]) -> int:
+        return sum(len(self._angajati_cuvant[cuvant]) for cuvant in cuvinte)
+
+    def prefix(self, text: str, limita: int = 20) -> list[int]:
+        """
+        Returneaza angajatii la care fiecare cuvant cautat este inceputul unui cuvant din nume.
+
+        Ordinea cuvintelor nu conteaza: "pop ion", "ion pop" si "popescu i"
+        gasesc toti angajatul "Popescu Ion".
+
+        Args:
+            text (str): Textul cautat.
+            limita (int): Numarul maxim de rezultate.
+
+        Returns:
+            list[int]: Id-urile gasite (alfabetic dupa cuvantul cel mai selectiv).
+        """
+        cautate: list[str] = tokenizeaza(text)
+        if not cautate:
+            return []
+        self._sorteaza()
+        potriviri: list[list[str]] = [self._cu_prefix(cuvant) for cuvant in cautate]
+        if not all(potriviri):
+            return []
+
+        selectiv: int = min(range(len(cautate)), key=lambda pozitie: self._numar_purtatori(potriviri[pozitie]))
+        restul: list[str] = [cuvant for pozitie, cuvant in enumerate(cautate) if pozitie != selectiv]
+        rezultat: dict[int, None] = {}
+        for cuvant in potriviri[selectiv]:
+            for identificator in self._angajati_cuvant[cuvant]:
+                if identificator in rezultat:
+                    continue
+                cuvinte: list[str] = self._cuvinte_angajat[identificator]
+                if all(any(propriu.startswith(cautat) for propriu in cuvinte) for cautat in restul):
+                    rezultat[identificator] = None
+                    if len(rezultat) == limita:
+                        return list(rezultat)
+        return list(rezultat)
+
+    def _asemanatoare(self, cautat: str, prag: float) -> dict[str, float]:
+        """
+        Returneaza cuvintele din vocabular asemanatoare cu 'cautat' si asemanarea lor.
+
+        Asemanarea este indicele Jaccard al trigramelor. Un cuvant cu asemanarea
+        cel putin 'prag' are cel putin 'prag' din trigramele cautate, deci
+        candidatii sunt luati doar din listele celor mai rare trigrame
+        (filtrare dupa prefix), fara a parcurge listele foarte frecvente.
+        """
+        grupuri_cautate: set[str] = trigrame(cautat)
+        necesare: int = max(1, int(prag * len(grupuri_cautate)))
+        rare: list[str] = sorted(grupuri_cautate, key=lambda grup: len(self._liste_trigrame.get(grup, ())))
+        candidati: set[str] = set()
+        for grup in rare[:len(rare) - necesare + 1]:
+            candidati.update(self._liste_trigrame.get(grup, ()))
+
+        asemanari: dict[str, float] = {}
+        for cuvant in candidati:
+            grupuri: set[str] = self._trigrame_cuvant[cuvant]
+            comune: int = len(grupuri_cautate & grupuri)
+            asemanare: float = comune / (len(grupuri_cautate) + len(grupuri) - comune)
+            if asemanare >= prag:
+                asemanari[cuvant] = asemanare
+        return asemanari
+
+    def aproximativ(self, text: str, limita: int = 10, prag: float = 0.4) -> list[tuple[int, float]]:
+        """
+        Cauta angajatii cu numele asemanator textului dat, tolerand greseli de scriere.
+
+        Fiecare cuvant cautat este comparat cu vocabularul; scorul unui angajat
+        este media, pe cuvintele cautate, a celei mai bune asemanari cu un
+        cuvant din numele lui (un cuvant fara potrivire contribuie cu 0).
+
+        Args:
+            text (str): Numele cautat (poate contine greseli).
+            limita (int): Numarul maxim de rezultate.
+            prag (float): Asemanarea minima (0-1) dintre doua cuvinte.
+
+        Returns:
+            list[tuple[int, float]]: Perechi (id, scor), descrescator dupa scor.
+        """
+        cautate: list[str] = tokenizeaza(text)
+        asemanari: list[dict[str, float]] = [self._asemanatoare(cuvant, prag) for cuvant in cautate]
+        gasite: list[dict[str, float]] = [potriviri for potriviri in asemanari if potriviri]
+        if not gasite:
+            return []
+
+        selectiv: dict[str, float] = min(gasite, key=self._numar_purtatori)
+        candidati: set[int] = set()
+        for cuvant in selectiv:
+            candidati.update(self._angajati_cuvant[cuvant])
+
+        def scor(identificator: int) -> float:
+            cuvinte: list[str] = self._cuvinte_angajat[identificator]
+            total: float = sum(max((potriviri.get(cuvant, 0.0) for cuvant in cuvinte), default=0.0) for potriviri in asemanari)
+            return total / len(asemanari)
+
+        return heapq.nlargest(limita, ((identificator, scor(identificator)) for identificator in candidati), key=lambda pereche: pereche[1])
@@ -0,0 +1,75 @@
+"""
+Modulul index_sortat contine un index ordonat dupa o valoare numerica
+(salar, varsta) care permite interogari pe interval.
+
+Indexul este o lista sortata de perechi (valoare, id angajat); cautarea
+capetelor intervalului se face cu bisect in O(log n), iar rezultatul este
+felia dintre ele, deci o interogare costa O(log n + k) pentru k rezultate.
+Perechile noi sunt adaugate la sfarsit si sortate la prima interogare, deci
+incarcarea initiala a registrului nu plateste o insertie sortata pe angajat.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Iterator
+
+
+class IndexSortat:
+    """
+    Index ordonat al id-urilor de angajati dupa o valoare numerica.
+
+    Exemple:
+        index = IndexSortat()
+        index.adauga(6500.0, id(angajat))
+        list(index.interval(6000, 9000))  -> [id(angajat)]
+    """
+
+    def __init__(self) -> None:
+        self._chei: list[tuple[float, int]] = []
+        self._nesortate: int = 0
+
+    def __len__(self) -> int:
+        return len(self._chei)
+
+    def adauga(self, valoare: float, identificator: int) -> None:
+        """Adauga perechea (valoare, id); lista este sortata la urmatoarea cautare."""
+        self._chei.append((valoare, identificator))
+        self._nesortate += 1
+
+    def adauga_lot(self, perechi: Iterable[tuple[float, int]]) -> None:
+        """Adauga mai multe perechi (valoare, id) deodata; lista este sortata o singura data, la urmatoarea cautare."""
+        inainte: int = len(self._chei)
+        self._chei.extend(perechi)
+        self._nesortate += len(self._chei) - inainte
+
+    def _sorteaza(self) -> None:
+        if self._nesortate > 8:
+            self._chei.sort()
+        elif self._nesortate:
+            noi: list[tuple[float, int]] = self._chei[-self._nesortate:]
+            del self._chei[-self._nesortate:]
+            for pereche in noi:
+                insort(self._chei, pereche)
+        self._nesortate = 0
+
+    def scoate(self, valoare: float, identificator: int) -> None:
+        """Scoate perechea (valoare, id); perechea trebuie sa existe in index."""
+        self._sorteaza()
+        pozitie: int = bisect_left(self._chei, (valoare, identificator))
+        del self._chei[pozitie]
+
+    def interval(self, minim: float, maxim: float) -> Iterator[int]:
+        """
+        Returneaza id-urile cu valoarea in intervalul inchis [minim, maxim], crescator.
+
+        Args:
+            minim (float): Capatul de jos al intervalului.
+            maxim (float): Capatul de sus al intervalului.
+
+        Yields:
+            int: Id-urile angajatilor din interval.
+        """
+        self._sorteaza()
+        inceput: int = bisect_left(self._chei, (minim,))
+        sfarsit: int = bisect_right(self._chei, (maxim, float("inf")))
+        for _, identificator in self._chei[inceput:sfarsit]:
+            yield identificator
@@ -0,0 +1,180 @@
+"""
+Modulul instantaneu_binar implementeaza un format binar compact pentru
+instantaneul angajatilor (angajati.bin), citit prin mmap.
+
+Structura fisierului:
+- antet: semnatura, versiune, numar de angajati si pozitiile sectiunilor
+- categorii: tabelele de departamente si senioritati (codificare prin dictionar)
+- inregistrari: cate o inregistrare de lungime fixa pentru fiecare angajat,
+  cu 'varsta' si 'salar' ca numere de lungime fixa, departamentul si
+  senioritatea ca coduri in tabelele de categorii si pozitia (offset,
+  lungime) a sirurilor cnp/nume/prenume in zona de siruri
+- zona de siruri: textele UTF-8 lipite unul dupa altul
+
+Inregistrarile au lungime fixa, deci angajatul i este citit direct de la
+pozitia i * marime_inregistrare, fara a decoda restul fisierului.
+"""
+
+import os
+import mmap
+import struct
+from angajat import Angajat
+from typing import Iterable, Iterator
+
+semnatura: bytes = b"ANGB"
+versiune_format: int = 1
+
+# semnatura, versiune, numar angajati, offset categorii, offset inregistrari, offset siruri
+_antet = struct.Struct("<4sHIQQQ")
+# cnp (offset, lungime), nume (offset, lungime), prenume (offset, lungime),
+# varsta, salar, cod departament, cod senioritate, indicatori
+_inregistrare = struct.Struct("<IHIHIHidHBB")
+_lungime_text = struct.Struct("<H")
+
+# indicator: 'salar' era numar intreg in JSON (pentru reconstructie exacta)
+_salar_intreg: int = 1
+
+
+def _scrie_tabel(valori: list[str]) -> bytes:
+    """Codifica o tabela de categorii: numarul de valori urmat de siruri cu lungime."""
+    parti: list[bytes] = [_lungime_text.pack(len(valori))]
+    for valoare in valori:
+        octeti: bytes = valoare.encode("utf-8")
+        parti.append(_lungime_text.pack(len(octeti)))
+        parti.append(octeti)
+    return b"".join(parti)
+
+
+def _citeste_tabel(date, pozitie: int) -> tuple[list[str], int]:
+    """Decodifica o tabela de categorii si returneaza valorile si pozitia urmatoare."""
+    (numar,) = _lungime_text.unpack_from(date, pozitie)
+    pozitie += _lungime_text.size
+    valori: list[str] = []
+    for _ in range(numar):
+        (lungime,) = _lungime_text.unpack_from(date, pozitie)
+        pozitie += _lungime_text.size
+        valori.append(bytes(date[pozitie:pozitie + lungime]).decode("utf-8"))
+        pozitie += lungime
+    return valori, pozitie
+
+
+def scrie_instantaneu(angajati: Iterable[Angajat], cale: str) -> int:
+    """
+    Scrie instantaneul binar pornind de la lista de angajati.
+
+    Fisierul este scris intai intr-un fisier temporar si apoi redenumit, deci
+    un instantaneu existent nu este corupt de o scriere intrerupta.
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii de scris.
+        cale (str): Calea fisierului binar (ex: angajati.bin).
+
+    Returns:
+        int: Numarul de angajati scrisi.
+    """
+    departamente: dict[str, int] = {}
+    senioritati: dict[str, int] = {}
+    inregistrari = bytearray()
+    siruri = bytearray()
+
+    def adauga_sir(text: str) -> tuple[int, int]:
+        octeti: bytes = text.encode("utf-8")
+        pozitie: int = len(siruri)
+        siruri.extend(octeti)
+        return pozitie, len(octeti)
+
+    numar: int = 0
+    for persoana in angajati:
+        cod_departament: int = departamente.setdefault(persoana.departament, len(departamente))
+        cod_senioritate: int = senioritati.setdefault(persoana.senioritate, len(senioritati))
+        indicatori: int = _salar_intreg if isinstance(persoana.salar, int) else 0
+        inregistrari.extend(_inregistrare.pack(
+            *adauga_sir(persoana.cnp),
+            *adauga_sir(persoana.nume),
+            *adauga_sir(persoana.prenume),
+            int(persoana.varsta),
+            float(persoana.salar),
+            cod_departament,
+            cod_senioritate,
+            indicatori,
+        ))
+        numar += 1
+
+    categorii: bytes = _scrie_tabel(list(departamente)) + _scrie_tabel(list(senioritati))
+    offset_categorii: int = _antet.size
+    offset_inregistrari: int = offset_categorii + len(categorii)
+    offset_siruri: int = offset_inregistrari + len(inregistrari)
+
+    fisier_temporar: str = cale + ".tmp"
+    with open(fisier_temporar, "wb") as my_file:
+        my_file.write(_antet.pack(semnatura, versiune_format, numar, offset_categorii, offset_inregistrari, offset_siruri))
+        my_file.write(categorii)
+        my_file.write(inregistrari)
+        my_file.write(siruri)
+    os.replace(fisier_temporar, cale)
+    return numar
+
+
+class InstantaneuBinar:
+    """
+    Cititor lenes pentru instantaneul binar, deschis prin mmap.
+
+    Deschiderea citeste doar antetul si tabelele de categorii; fiecare angajat
+    este decodat abia cand este accesat (index sau iterare). Obiectul se
+    comporta ca o secventa de obiecte Angajat si poate fi folosit cu 'with'.
+
+    Exemple:
+        with InstantaneuBinar("angajati.bin") as instantaneu:
+            print(len(instantaneu), instantaneu[0].nume)
+    """
+
+    def __init__(self, cale: str) -> None:
+        self._fisier = open(cale, "rb")
+        self._date = mmap.mmap(self._fisier.fileno(), 0, access=mmap.ACCESS_READ)
+        (semnatura_citita, versiune, self._numar, offset_categorii,
+         self._offset_inregistrari, self._offset_siruri) = _antet.unpack_from(self._date, 0)
+        if semnatura_citita != semnatura or versiune != versiune_format:
+            self.inchide()
+            raise ValueError(f"Fisierul {cale} nu este un instantaneu binar valid")
+        self.departamente, pozitie = _citeste_tabel(self._date, offset_categorii)
+        self.senioritati, _ = _citeste_tabel(self._date, pozitie)
+
+    def __len__(self) -> int:
+        return self._numar
+
+    def _text(self, pozitie: int, lungime: int) -> str:
+        inceput: int = self._offset_siruri + pozitie
+        return self._date[inceput:inceput + lungime].decode("utf-8")
+
+    def __getitem__(self, index: int) -> Angajat:
+        if index < 0:
+            index += self._numar
+        if not 0 <= index < self._numar:
+            raise IndexError("index angajat in afara instantaneului")
+        (cnp_poz, cnp_lung, nume_poz, nume_lung, prenume_poz, prenume_lung,
+         varsta, salar, cod_departament, cod_senioritate, indicatori) = _inregistrare.unpack_from(
+            self._date, self._offset_inregistrari + index * _inregistrare.size)
+        return Angajat(
+            self._text(cnp_poz, cnp_lung),
+            self._text(nume_poz, nume_lung),
+            self._text(prenume_poz, prenume_lung),
+            varsta,
+            int(salar) if indicatori & _salar_intreg else salar,
+            self.departamente[cod_departament],
+            self.senioritati[cod_senioritate],
+        )
+
+    def __iter__(self) -> Iterator[Angajat]:
+        for index in range(self._numar):
+            yield self[index]
+
+    def inchide(self) -> None:
+        """Inchide maparea in memorie si fisierul."""
+        self._date.close()
+        self._fisier.close()
+
+    def __enter__(self) -> "InstantaneuBinar":
+        return self
+
+    def __exit__(self, *exceptie) -> None:
+        self.inchide()
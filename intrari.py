@@ -0,0 +1,159 @@
+"""
+Modulul intrari contine buclele de citire de la tastatura folosite de mai
+multe optiuni din meniu: intervale (minim-maxim), alegerea unei valori dintr-o
+lista (format, departament, senioritate, coloane), lista de percentile si
+verificarea ca exista angajati inainte de un calcul.
+
+Fiecare functie reia intrebarea pana cand raspunsul este valid, deci toate
+optiunile accepta aceleasi forme de raspuns si afiseaza aceleasi mesaje.
+"""
+
+import math
+from typing import Collection, Sequence
+import stil
+
+
+def interval_din_text(text: str) -> tuple[float | None, float | None]:
+    """
+    Interpreteaza un interval de forma 'minim-maxim', cu un capat optional.
+
+    Exemple:
+        "4000-8000" -> (4000.0, 8000.0)
+        "4000-"     -> (4000.0, None)   (fara limita de sus)
+        "-8000"     -> (None, 8000.0)   (fara limita de jos)
+        "35-25"     -> (25.0, 35.0)     (capetele sunt ordonate automat)
+
+    Args:
+        text (str): Textul introdus.
+
+    Returns:
+        tuple[float | None, float | None]: Capetele intervalului (None = fara limita).
+
+    Raises:
+        ValueError: Daca textul nu are exact un '-', un capat nu este numar
+                    sau ambele capete lipsesc.
+    """
+    capete: list[str] = text.split("-")
+    if len(capete) != 2 or not (capete[0].strip() or capete[1].strip()):
+        raise ValueError(f"interval invalid: {text}")
+    minim, maxim = (float(capat) if capat.strip() else None for capat in capete)
+    if minim is not None and maxim is not None and minim > maxim:
+        minim, maxim = maxim, minim
+    return minim, maxim
+
+
+def descrie_interval(minim: float | None, maxim: float | None, unitate: str) -> str:
+    """
+    Descrie un interval pentru mesaje (ex: "intre 4000 si 8000 RON", "de cel putin 4000 RON").
+
+    Args:
+        minim (float | None): Capatul de jos (None = fara limita).
+        maxim (float | None): Capatul de sus (None = fara limita).
+        unitate (str): Unitatea de masura (ex: "RON", "ani").
+
+    Returns:
+        str: Descrierea intervalului.
+    """
+    if minim is None:
+        return f"de cel mult {maxim:g} {unitate}"
+    if maxim is None:
+        return f"de cel putin {minim:g} {unitate}"
+    return f"intre {minim:g} si {maxim:g} {unitate}"
+
+
+def cere_interval(mesaj: str, obligatoriu: bool = False) -> tuple[float | None, float | None] | None:
+    """
+    Cere utilizatorului un interval de forma 'minim-maxim' (vezi interval_din_text).
+
+    Args:
+        mesaj (str): Intrebarea afisata (ex: "Interval de salariu (RON)").
+        obligatoriu (bool): True = intervalul trebuie introdus, iar '0' revine la
+                            meniu; False = 'enter' inseamna fara filtru.
+
+    Returns:
+        tuple[float | None, float | None] | None: Capetele intervalului; (None, None)
+            daca un interval optional a fost sarit; None daca utilizatorul a ales
+            '0' (meniu) la un interval obligatoriu.
+    """
+    sfarsit: str = f"{stil.GALBEN}'0'{stil.RESET} pentru meniu" if obligatoriu else "'enter' pentru toate"
+    while True:
+        text: str = input(f"{mesaj} {stil.GALBEN}(minim-maxim, minim- sau -maxim){stil.RESET} sau {sfarsit}: ").strip()
+        if obligatoriu and text == "0":
+            return None
+        if not obligatoriu and not text:
+            return None, None
+        try:
+            return interval_din_text(text)
+        except ValueError:
+            stil.eroare(f"Interval invalid, ai introdus -> {stil.evidentiaza(text)}")
+
+
+def capete_interval(interval: tuple[float | None, float | None]) -> tuple[float, float]:
+    """Inlocuieste capetele lipsa ale unui interval cu -inf / +inf (pentru cautarile in indexuri)."""
+    minim, maxim = interval
+    return (-math.inf if minim is None else minim), (math.inf if maxim is None else maxim)
+
+
+def cere_optiune(mesaj: str, optiuni: Collection[str], eroare: str, implicit: str | None = None, majuscule: bool = False) -> str:
+    """
+    Cere utilizatorului o valoare dintr-o lista de optiuni.
+
+    Exemple:
+        cere_optiune("Format", ("csv", "jsonl"), "Format necunoscut", implicit="csv")
+        cere_optiune("Departament", registru.departamente(), "Nu exista nici un departament cu numele", implicit="")
+
+    Args:
+        mesaj (str): Intrebarea afisata; optiunile sunt adaugate dupa ea.
+        optiuni (Collection[str]): Valorile acceptate.
+        eroare (str): Inceputul mesajului afisat pentru o valoare necunoscuta.
+        implicit (str | None): Valoarea returnata la 'enter' ("" = fara filtru);
+                               None = raspunsul este obligatoriu.
+        majuscule (bool): True = raspunsul este trecut cu litere mari (ex:
+                          departamente); altfel cu litere mici.
+
+    Returns:
+        str: Optiunea aleasa sau valoarea implicita.
+    """
+    if implicit is None:
+        sfarsit: str = ""
+    elif implicit:
+        sfarsit = f" (implicit {implicit})"
+    else:
+        sfarsit = " sau 'enter' pentru toate"
+    while True:
+        text: str = input(f"{mesaj} {stil.GALBEN}{optiuni}{stil.RESET}{sfarsit}: ").strip()
+        text = text.upper() if majuscule else text.lower()
+        if not text and implicit is not None:
+            return implicit
+        if text in optiuni:
+            return text
+        stil.eroare(f"{eroare} -> {stil.evidentiaza(text)}")
+
+
+def cere_percentile(implicite: Sequence[float]) -> list[float]:
+    """
+    Cere o lista de percentile (0-100) separate prin virgula.
+
+    Args:
+        implicite (Sequence[float]): Percentilele folosite la 'enter'.
+
+    Returns:
+        list[float]: Percentilele alese.
+    """
+    while True:
+        text: str = input(f"Percentile (0-100) separate prin virgula (implicit {stil.GALBEN}{','.join(f'{procent:g}' for procent in implicite)}{stil.RESET}): ").strip()
+        try:
+            percentile: list[float] = [float(procent) for procent in text.split(",")] if text else list(implicite)
+            if all(0 <= procent <= 100 for procent in percentile):
+                return percentile
+        except ValueError:
+            pass
+        stil.eroare(f"Percentile invalide, ai introdus -> {stil.evidentiaza(text)}")
+
+
+def exista_angajati(angajati: Collection) -> bool:
+    """Returneaza True daca exista angajati; altfel afiseaza o atentionare si returneaza False."""
+    if angajati:
+        return True
+    stil.atentionare("Nu exista angajati in baza de date!")
+    return False
@@ -15,13 +15,22 @@ import operatiuni_date
 import incarcare_salvare
 import calculare
 import exportare
+import importare
+import stat_plata
+import simulare
+import statistici
+import schita_cuantile
+import raport
 import stil
+from registru import RegistruAngajati
+
+ultima_optiune: int = 26
 
 def afisare_meniu() -> None:
     """
     Afiseaza meniul principal al aplicatiei cu toate optiunile disponibile.
     
-    Meniul contine 13 optiuni (0-12) grupate logic:
+    Meniul contine 26 optiuni (1-26) grupate logic:
     
     Gestionare angajati (1-5):
     - Adaugare, cautare, modificare, stergere, afisare toti
@@ -35,8 +44,31 @@ def afisare_meniu() -> None:
     - Export fluturas JSON
     - Afisare fluturas din fisier
     
-    Iesire (0):
-    - Inchiderea aplicatiei
+    Iesire (13):
+    - Inchiderea aplicatiei (acelasi numar ca inainte de optiunile noi)
+    
+    Filtrare pe intervale (14-15):
+    - Interval de salariu
+    - Interval de varsta (optional pe departament)
+    
+    Cautare (16):
+    - Cautare dupa nume (prefix sau aproximativa)
+    
+    Salarizare si rapoarte (17-20, 25):
+    - Stat de plata pe mai multe luni (CSV/JSONL)
+    - Simulare ajustari salariale (fara modificarea datelor)
+    - Statistici grupate (departament x senioritate x varsta)
+    - Percentile aproximative (schite KLL combinabile)
+    - Raport companie cu salarizarea calculata (CSV/JSONL, coloane si filtre)
+    
+    Export in masa (21-24):
+    - Export fluturasi pentru toti angajatii (optional filtrati)
+    - Conversie fluturasi din fisiere separate in arhiva unica
+    - Sincronizare fluturasi (rescrie doar fluturasii schimbati)
+    - Catalog fluturasi (fluturasi lipsa intr-o luna, fluturasi pe departament)
+    
+    Import in masa (26):
+    - Import angajati din CSV/JSONL, cu validare si raport de erori
     
     Returns:
         None: Functia afiseaza meniul direct in consola.
@@ -44,7 +76,8 @@ def afisare_meniu() -> None:
     Note:
         - Meniul este afisat la fiecare iteratie a buclei principale
         - Liniile de separare (-) ajuta la lizibilitate
-        - Numerotarea incepe de la 0 pentru consistenta cu input-ul
+        - Optiunile noi sunt adaugate dupa 'Iesire', deci numerele optiunilor
+          existente (inclusiv 13 pentru iesire) nu se schimba
     """
    
     stil.titlu(" ---> Gestioneaza compania ")
@@ -60,7 +93,20 @@ def afisare_meniu() -> None:
     print("10. Afisare angajati pe baza departamentului")
     print("11. Export fluturas salariu")
     print("12. Afisare fluturas din fisier")
-    print("13. Iesire")  
+    print("13. Iesire")
+    print("14. Afisare angajati dupa interval de salariu")
+    print("15. Afisare angajati dupa interval de varsta")
+    print("16. Cautare angajat (dupa nume)")
+    print("17. Stat de plata pe mai multe luni")
+    print("18. Simulare salarii (ce-ar fi daca...)")
+    print("19. Statistici salariale grupate")
+    print("20. Percentile aproximative salarii")
+    print("21. Export fluturasi pentru toti angajatii")
+    print("22. Conversie fluturasi in arhiva unica")
+    print("23. Sincronizare fluturasi exportati")
+    print("24. Catalog fluturasi exportati")
+    print("25. Raport companie (CSV/JSONL)")
+    print("26. Import angajati din CSV/JSONL")
     print("-"*40)
 
 def main() -> None:
@@ -76,16 +122,17 @@ def main() -> None:
     2. BUCLA PRINCIPALA:
        - Afiseaza meniul
        - Cere optiunea de la utilizator
-       - Valideaza input-ul (trebuie sa fie numar intre 0-12)
+       - Valideaza input-ul (trebuie sa fie numar intre 1 si ultima optiune)
        - Executa functia corespunzatoare optiunii alese
     
     3. IESIRE:
-       - La optiunea 0, bucla se intrerupe
+       - La optiunea 13, bucla se intrerupe
+       - Jurnalul de modificari este compactat daca a depasit pragurile
        - Mesaj de confirmare la inchidere
     
     Validarea input-ului include:
     - Verificarea daca este numar intreg
-    - Verificarea daca este in intervalul 0-12
+    - Verificarea daca este in intervalul 1-ultima optiune
     - Mesaje de eroare descriptive pentru input invalid
     
     Returns:
@@ -96,23 +143,25 @@ def main() -> None:
         - Toate erorile de input sunt prinse si tratate graceful
         - Datele sunt salvate automat dupa fiecare modificare
     """
-    lista_angajati: list[dict] = incarcare_salvare.incarca_fisier_angajati()
+    lista_angajati: RegistruAngajati = incarcare_salvare.incarca_registru()
     
     while True:
         afisare_meniu()
-        alege: str = input(f"Alege o optiune de la {stil.GALBEN}1-13{stil.RESET}: ").strip()
+        alege: str = input(f"Alege o optiune de la {stil.GALBEN}1-{ultima_optiune}{stil.RESET}: ").strip()
         
         try:
             alege_numar: int = int(alege)
 
-            if alege_numar < 1 or alege_numar > 13:
-                stil.eroare(f"Numarul trebuie sa fie intre 1-13 , ai introdus -> {stil.evidentiaza(alege_numar)}")
+            if alege_numar < 1 or alege_numar > ultima_optiune:
+                stil.eroare(f"Numarul trebuie sa fie intre 1-{ultima_optiune} , ai introdus -> {stil.evidentiaza(alege_numar)}")
                 continue
         except ValueError:
             stil.eroare(f"Trebuie sa introduceti un numar valid , ai introdus -> {stil.evidentiaza(alege)}")
             continue
 
         if alege == "13":
+            if incarcare_salvare.mod_stocare in ("jurnal", "binar") and incarcare_salvare.trebuie_compactat():
+                incarcare_salvare.salveaza_fisier_angajati(lista_angajati)
             stil.info(f"Program inchis, ai ales -> {stil.evidentiaza(alege)} ")
             break
         elif alege == "1":
@@ -139,6 +188,32 @@ def main() -> None:
             exportare.exporteaza_fluturas(lista_angajati)
         elif alege == "12":
             exportare.afisare_fluturas_din_fisier()  
+        elif alege == "14":
+            operatiuni_date.afiseaza_dupa_interval_salariu(lista_angajati)
+        elif alege == "15":
+            operatiuni_date.afiseaza_dupa_interval_varsta(lista_angajati)
+        elif alege == "16":
+            operatiuni_date.cautare_dupa_nume(lista_angajati)
+        elif alege == "17":
+            stat_plata.calcul_stat_plata(lista_angajati)
+        elif alege == "18":
+            simulare.simulare_salarii(lista_angajati)
+        elif alege == "19":
+            statistici.statistici_grupate(lista_angajati)
+        elif alege == "20":
+            schita_cuantile.percentile_aproximative(lista_angajati)
+        elif alege == "21":
+            exportare.exporta_toti_fluturasii(lista_angajati)
+        elif alege == "22":
+            exportare.converteste_fluturasi_in_arhiva()
+        elif alege == "23":
+            exportare.sincronizare_fluturasi(lista_angajati)
+        elif alege == "24":
+            exportare.catalog_fluturasi(lista_angajati)
+        elif alege == "25":
+            raport.raport_companie(lista_angajati)
+        elif alege == "26":
+            importare.importa_angajati(lista_angajati)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
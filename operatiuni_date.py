@@ -6,32 +6,35 @@ Acesta este modulul principal de interactiune cu datele, fiind apelat
 din meniul principal al aplicatiei.
 """
 
-import os , json 
 import stil
 import exportare
 import validari
+import intrari
 import incarcare_salvare
 import calculare
+import decodare_cnp
+from angajat import Angajat
+from registru import RegistruAngajati
 
 
-def adaugare_angajat(angajati: list[dict]) -> None:
+def adaugare_angajat(angajati: RegistruAngajati) -> None:
     """
     Adauga un angajat nou in baza de date a companiei.
     
     Procesul de adaugare include urmatoarele etape:
-    1. Validarea CNP-ului (unicitate si format corect)
-    2. Introducerea si validarea numelui si prenumelui
-    3. Introducerea si validarea varstei (minim 18 ani)
+    1. Validarea CNP-ului (unicitate, format, cifra de control, data nasterii, judet)
+    2. Calculul varstei din data nasterii din CNP (minim 18 ani)
+    3. Introducerea si validarea numelui si prenumelui
     4. Introducerea si validarea salariului (minim salariu minim legal)
     5. Selectarea sau crearea unui departament
     6. Selectarea nivelului de senioritate (junior/mid/senior)
-    7. Salvarea datelor in fisierul JSON
+    7. Salvarea datelor (o singura inregistrare in jurnal sau fisierul JSON)
     
     Functia verifica daca CNP-ul exista deja in baza de date pentru a evita
     duplicatele. Daca CNP-ul este deja inregistrat, operatiunea este anulata.
     
     Args:
-        angajati (list[dict]): Lista curenta de angajati la care se adauga noul angajat.
+        angajati (RegistruAngajati): Lista curenta de angajati la care se adauga noul angajat.
         
     Returns:
         None: Functia modifica lista 'angajati' in-place si salveaza in fisier.
@@ -43,15 +46,21 @@ def adaugare_angajat(angajati: list[dict]) -> None:
     """
     stil.titlu(" ---> Adagua un angajat ")
 
-    cnp: str = validari.cere_cnp_valid()
+    cnp: str = validari.cere_cnp_valid(strict=True)
     if cnp == "0":
         return "0"
 
-    for persoana in angajati:
-        if persoana["cnp"] == cnp:
-            stil.eroare(f" Acest {cnp} CNP a fost deja introdus pentru alta persoana")
-            return
+    if cnp in angajati:
+        stil.eroare(f" Acest {cnp} CNP a fost deja introdus pentru alta persoana")
+        return
     
+    # varsta rezulta din data nasterii din CNP (CNP-ul a fost verificat strict)
+    decodat: decodare_cnp.CnpDecodat = decodare_cnp.decodeaza(cnp)
+    varsta: str = str(decodat.varsta())
+    if not validari.varsta_validare(varsta):
+        return
+    stil.info(f"Varsta din CNP: {varsta} ani (nascut la {decodat.data_nasterii:%d.%m.%Y}, judetul {decodat.judet})")
+
     while True:
         nume: str = input("Nume: ").capitalize()
         if validari.validare_nume(nume):
@@ -64,18 +73,13 @@ def adaugare_angajat(angajati: list[dict]) -> None:
             prenume = prenume.title()
             break
 
-    while True:
-        varsta: str = input(f"Varsta necsara {stil.GALBEN}> 18{stil.RESET}: ")
-        if validari.varsta_validare(varsta):
-            break
-
     while True:
         salar: str = input(f"Salariu Brut {stil.GALBEN}'minim 4050'{stil.RESET}: ")
         if validari.salariu_validare(salar):
             break
     
     while True: 
-        departamente_disponibile: set = set(persoana["departament"] for persoana in angajati)
+        departamente_disponibile: set = angajati.departamente()
         departament: str = input(f"Departamente disponibile {stil.GALBEN}{departamente_disponibile}{stil.RESET} sau creaza unul nou: ").strip().upper()
         if validari.departament_validare(departament):
             break
@@ -86,31 +90,31 @@ def adaugare_angajat(angajati: list[dict]) -> None:
             break
         stil.eroare(f"Senioritatea trebuie sa fie una din cele disponibile {stil.GALBEN}{validari.aceptare_nivel}{stil.RESET}.")
 
-    angajat_nou: dict = {
-        "cnp": cnp,
-        "nume": nume,
-        "prenume": prenume,
-        "varsta": int(varsta),
-        "salar": float(salar),
-        "departament": departament,
-        "senioritate": senioritate
-    }
-    angajati.append(angajat_nou)
-    
-    if incarcare_salvare.salveaza_fisier_angajati(angajati):
+    angajat_nou: Angajat = Angajat(
+        cnp=cnp,
+        nume=nume,
+        prenume=prenume,
+        varsta=int(varsta),
+        salar=float(salar),
+        departament=departament,
+        senioritate=senioritate
+    )
+    angajati.adauga(angajat_nou)
+    
+    if incarcare_salvare.inregistreaza_modificare(angajati, "adaugare", angajat_nou):
         print("-"*30)
-        stil.succes(f"Angajatul ' {angajat_nou['nume']} {angajat_nou['prenume']} ' a fost adaugat cu success!")
+        stil.succes(f"Angajatul ' {angajat_nou.nume} {angajat_nou.prenume} ' a fost adaugat cu success!")
     else: 
         stil.eroare("Nu s-a putut salva !")
 
 
 
-def cautare_angajat(angajati: list[dict]) -> None:
+def cautare_angajat(angajati: RegistruAngajati) -> None:
     """
     Cauta si afiseaza datele complete ale unui angajat pe baza CNP-ului.
     
-    Functia parcurge lista de angajati si compara CNP-ul introdus cu CNP-ul
-    fiecarui angajat. La gasirea unei potriviri, afiseaza toate informatiile:
+    Angajatul este gasit direct prin indexul CNP -> angajat al registrului
+    (cost constant, indiferent de numarul de angajati) si sunt afisate:
     - Nume complet
     - CNP
     - Varsta
@@ -119,7 +123,7 @@ def cautare_angajat(angajati: list[dict]) -> None:
     - Nivel de senioritate
     
     Args:
-        angajati (list[dict]): Lista de angajati in care se face cautarea.
+        angajati (RegistruAngajati): Lista de angajati in care se face cautarea.
         
     Returns:
         None: Functia afiseaza rezultatele direct in consola.
@@ -136,27 +140,65 @@ def cautare_angajat(angajati: list[dict]) -> None:
         if cnp == "0":
             return
 
-        gasit: bool = False
-        for persoana in angajati: 
-            if persoana["cnp"] == cnp:
-                print("")
-                stil.titlu(f"Date gasite pentru : {persoana['nume']} {persoana['prenume']} \n CNP: {persoana['cnp']}\n Varsta: {persoana['varsta']} \n Salariu: {persoana['salar']} RON \n Departament: {persoana['departament']} \n Senioritate: {persoana['senioritate']}")
-                print("")
-                gasit = True
-                return
-        if not gasit:
-            stil.atentionare(f"CNP-ul {cnp} nu a fost gasit!")
-    
+        persoana: Angajat | None = angajati.cauta(cnp)
+        if persoana is not None:
+            print("")
+            stil.titlu(f"Date gasite pentru : {persoana.nume} {persoana.prenume} \n CNP: {persoana.cnp}\n Varsta: {persoana.varsta} \n Salariu: {persoana.salar} RON \n Departament: {persoana.departament} \n Senioritate: {persoana.senioritate}")
+            print("")
+            return
+        stil.atentionare(f"CNP-ul {cnp} nu a fost gasit!")
 
-def modificare_angajat(angajati: list[dict]) -> None:
+
+def cautare_dupa_nume(angajati: RegistruAngajati) -> None:
+    """
+    Cauta angajati dupa nume si/sau prenume.
+
+    Se afiseaza intai angajatii al caror nume incepe cu textul introdus
+    (completare dupa prefix); daca nu exista niciunul, se afiseaza numele
+    cele mai asemanatoare (cautare toleranta la greseli de scriere).
+
+    Args:
+        angajati (RegistruAngajati): Registrul in care se face cautarea.
+
+    Returns:
+        None: Functia afiseaza rezultatele direct in consola.
+
+    Note:
+        - Ordinea nu conteaza: "Popescu Ion" si "Ion Popescu" gasesc acelasi angajat
+        - Literele mari si diacriticele sunt ignorate
+        - Utilizatorul poate introduce '0' pentru a reveni la meniu
+    """
+    stil.titlu(" ---> Cauta angajat dupa nume ")
+
+    while True:
+        text: str = input(f"Numele (sau inceputul numelui) ori {stil.GALBEN}'0'{stil.RESET} pentru a reveni: ").strip()
+        if text == "0":
+            return
+        if not text:
+            stil.atentionare("Introdu cel putin o litera!")
+            continue
+
+        gasiti: list[Angajat] = angajati.cu_nume_incepand(text)
+        if not gasiti:
+            gasiti = angajati.cu_nume_asemanator(text)
+            if gasiti:
+                stil.atentionare(f"Nu exista nici un angajat care sa inceapa cu -> {stil.evidentiaza(text)}. Nume asemanatoare:")
+
+        if gasiti:
+            for persoana in gasiti:
+                stil.info(f" {persoana.nume} {persoana.prenume} | CNP: {persoana.cnp} | {persoana.departament} | {persoana.senioritate}")
+            return
+        stil.atentionare(f"Nu a fost gasit nici un angajat cu numele -> {stil.evidentiaza(text)}")
+
+
+def modificare_angajat(angajati: RegistruAngajati) -> None:
     """
     Permite modificarea oricaror date ale unui angajat existent.
     
     Utilizatorul poate actualiza urmatoarele campuri (optional):
-    - CNP (cu actualizarea fisierului fluturas asociat)
+    - CNP (cu actualizarea fisierului fluturas asociat; varsta rezulta din CNP)
     - Nume
     - Prenume
-    - Varsta
     - Salariu
     - Departament
     - Senioritate
@@ -169,14 +211,16 @@ def modificare_angajat(angajati: list[dict]) -> None:
     este redenumit pentru a reflecta noul CNP.
     
     Args:
-        angajati (list[dict]): Lista de angajati care contine angajatul de modificat.
+        angajati (RegistruAngajati): Lista de angajati care contine angajatul de modificat.
         
     Returns:
         None: Functia modifica datele in-place si salveaza in fisier.
         
     Note:
         - Toate noile valori sunt validate inainte de a fi acceptate
-        - CNP-ul nou trebuie sa fie unic (nu poate apartine altui angajat)
+        - CNP-ul nou trebuie sa fie unic (nu poate apartine altui angajat) si
+          sa apartina unei persoane de cel putin 18 ani
+        - Varsta nu se introduce de mana: este calculata din CNP
         - Modificarile sunt salvate automat in fisierul JSON
         - Fisierul fluturas este actualizat daca exista
     """
@@ -185,128 +229,112 @@ def modificare_angajat(angajati: list[dict]) -> None:
         cnp: str = validari.cere_cnp_valid()
         if cnp == "0":
             return
-        for persoana in angajati:
-            if persoana["cnp"] == cnp:
-
-                stil.titlu(f" ---> Mofica datele pentru '{persoana['nume']} {persoana['prenume']}'")
-
-                cnp_vechi: str = persoana["cnp"]
-                cnp_nou: str = input(f"Introdu un cnp nou sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip()
-
-                if cnp_nou:
-                    while True:
-                        if not validari.cnp_validare(cnp_nou):
-                            cnp_nou = input(f"Introdu un cnp nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip()
-                            if not cnp_nou:
-                                break
-                            continue
-
-                        toate_cnpuriile: list = [persoana["cnp"] for persoana in angajati]
-
-                        if cnp_nou in toate_cnpuriile:
-                            stil.eroare(f"CNP-ul '{cnp_nou}' apartine deja a altui angajat! ")
-                            cnp_nou = input(f"Introdu un cnp nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip()
-                            if not cnp_nou:
-                                break
-                            continue
-                        else:
-                            persoana["cnp"] = cnp_nou
-                            stil.succes(f"CNP-ul a fost actualizat din {cnp_vechi} in {cnp_nou}")
+        persoana: Angajat | None = angajati.cauta(cnp)
+        if persoana is not None:
 
-                            cale_veche: str = f"fluturasi_angajati/fluturas_{cnp_vechi}.json"
-                            cale_noua: str = f"fluturasi_angajati/fluturas_{cnp_nou}.json"
+            stil.titlu(f" ---> Mofica datele pentru '{persoana.nume} {persoana.prenume}'")
 
-                            if os.path.exists(cale_veche):
-                                with open (cale_veche, "r") as my_file:
-                                    date_fluturas: dict = json.load(my_file)
+            cnp_vechi: str = persoana.cnp
+            vechi: Angajat = persoana.copie()
+            cnp_nou: str = input(f"Introdu un cnp nou sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip()
 
-                                date_fluturas["cnp"] = cnp_nou
-                                
-                                with open(cale_noua, "w") as my_file:
-                                    json.dump(date_fluturas, my_file, indent=4)
+            if cnp_nou:
+                while True:
+                    if not validari.cnp_validare(cnp_nou, strict=True):
+                        cnp_nou = input(f"Introdu un cnp nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip()
+                        if not cnp_nou:
+                            break
+                        continue
 
-                                os.remove(cale_veche)
-                                stil.succes(f" Fisierul fluturas a fost redenumit din '{cnp_vechi}' in '{cnp_nou}' ")
+                    if cnp_nou in angajati:
+                        stil.eroare(f"CNP-ul '{cnp_nou}' apartine deja a altui angajat! ")
+                        cnp_nou = input(f"Introdu un cnp nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip()
+                        if not cnp_nou:
                             break
-                nume_vechi = persoana["nume"]
-                nume_nou: str = input(f"Introdu un nume nou sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().title()
-                if nume_nou:
-                    while not validari.validare_nume(nume_nou):
-                        nume_nou = input(f"Introdu un nume nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().title()
-                        if not nume_nou:
+                        continue
+
+                    # varsta rezulta din noul CNP (verificat strict, deci decodabil)
+                    if not validari.varsta_validare(str(decodare_cnp.decodeaza(cnp_nou).varsta())):
+                        cnp_nou = input(f"Introdu un cnp nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip()
+                        if not cnp_nou:
                             break
-                    if nume_nou:
-                        persoana["nume"] = nume_nou.title()
-                        stil.succes(f"Numele a fost actualizat din {nume_vechi} in {nume_nou}")
+                        continue
+                    else:
+                        persoana.cnp = cnp_nou
+                        stil.succes(f"CNP-ul a fost actualizat din {cnp_vechi} in {cnp_nou}")
+                        stil.info(f"Varsta din noul CNP: {decodare_cnp.decodeaza(cnp_nou).varsta()} ani")
 
-                prenume_vechi = persoana["prenume"]
-                prenume_nou: str = input(f"Introdu un prenume nou sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().title()
+                        if exportare.redenumeste_fluturas(cnp_vechi, cnp_nou):
+                            stil.succes(f" Fisierul fluturas a fost redenumit din '{cnp_vechi}' in '{cnp_nou}' ")
+                        break
+            nume_vechi = persoana.nume
+            nume_nou: str = input(f"Introdu un nume nou sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().title()
+            if nume_nou:
+                while not validari.validare_nume(nume_nou):
+                    nume_nou = input(f"Introdu un nume nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().title()
+                    if not nume_nou:
+                        break
+                if nume_nou:
+                    persoana.nume = nume_nou.title()
+                    stil.succes(f"Numele a fost actualizat din {nume_vechi} in {nume_nou}")
+
+            prenume_vechi = persoana.prenume
+            prenume_nou: str = input(f"Introdu un prenume nou sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().title()
+            if prenume_nou:
+                while not validari.validare_nume(prenume_nou):
+                    prenume_nou = input(f"Introdu un prenume nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().title()
+                    if not prenume_nou:
+                        break
                 if prenume_nou:
-                    while not validari.validare_nume(prenume_nou):
-                        prenume_nou = input(f"Introdu un prenume nou valid sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().title()
-                        if not prenume_nou:
-                            break
-                    if prenume_nou:
-                        persoana["prenume"] = prenume_nou.title()
-                        stil.succes(f"Prenumele a fost actualizat din {prenume_vechi} in {prenume_nou}")
-
-                varsta_veche = persoana["varsta"]
-                varsta_noua: str = input(f"Introdu o varsta noua sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ")
-                if varsta_noua:
-                    while not validari.varsta_validare(varsta_noua):
-                        varsta_noua = input(f"Introdu o varsta noua sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ")
-                        if not varsta_noua:
-                            break
-                    if varsta_noua:
-                        persoana["varsta"] = int(varsta_noua)
-                        stil.succes(f"Varsta a fost actualizata din {varsta_veche} ani in {varsta_noua} ani")
-                
-                salariu_vechi = persoana["salar"]
-                salariu_nou: str = input(f"Introdu un salariu nou ({stil.GALBEN} minim {validari.salariu_minim}{stil.RESET}) sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ")
+                    persoana.prenume = prenume_nou.title()
+                    stil.succes(f"Prenumele a fost actualizat din {prenume_vechi} in {prenume_nou}")
+
+            salariu_vechi = persoana.salar
+            salariu_nou: str = input(f"Introdu un salariu nou ({stil.GALBEN} minim {validari.salariu_minim()}{stil.RESET}) sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ")
+            if salariu_nou:
+                while not validari.salariu_validare(salariu_nou):
+                    salariu_nou = input(f"Introdu un salariu nou ({stil.GALBEN}minim {validari.salariu_minim()}{stil.RESET}) sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ")
+                    if not salariu_nou:
+                        break
                 if salariu_nou:
-                    while not validari.salariu_validare(salariu_nou):
-                        salariu_nou = input(f"Introdu un salariu nou ({stil.GALBEN}minim {validari.salariu_minim}{stil.RESET}) sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ")
-                        if not salariu_nou:
-                            break
-                    if salariu_nou:
-                        persoana["salar"] = float(salariu_nou)
-                        stil.succes(f"Salariul a fost actualizat din {salariu_vechi} RON in {salariu_nou} RON")
-
-                departament_vechi = persoana["departament"]
-                departamente_disponibile: set = set(persoana["departament"] for persoana in angajati)
-                departament_nou: str = input(f"Introdu un departament nou, disponibile -> {stil.GALBEN}{departamente_disponibile}{stil.RESET} sau creaza unu nou: ").strip().upper()
+                    persoana.salar = float(salariu_nou)
+                    stil.succes(f"Salariul a fost actualizat din {salariu_vechi} RON in {salariu_nou} RON")
+
+            departament_vechi = persoana.departament
+            departamente_disponibile: set = angajati.departamente()
+            departament_nou: str = input(f"Introdu un departament nou, disponibile -> {stil.GALBEN}{departamente_disponibile}{stil.RESET} sau creaza unu nou: ").strip().upper()
+            if departament_nou:
+                while not validari.departament_validare(departament_nou):
+                    departament_nou = input(f"Introdu un departament nou, disponibile -> {stil.GALBEN}{departamente_disponibile}{stil.RESET} sau creaza unu nou: ").strip().upper()
+                    if not departament_nou:
+                        break
                 if departament_nou:
-                    while not validari.departament_validare(departament_nou):
-                        departament_nou = input(f"Introdu un departament nou, disponibile -> {stil.GALBEN}{departamente_disponibile}{stil.RESET} sau creaza unu nou: ").strip().upper()
-                        if not departament_nou:
-                            break
-                    if departament_nou:
-                        persoana["departament"] = departament_nou
-                        stil.succes(f"Departamentul a fost actualizat din {departament_vechi} in {departament_nou}")
+                    persoana.departament = departament_nou
+                    stil.succes(f"Departamentul a fost actualizat din {departament_vechi} in {departament_nou}")
                 
-                senioritate_veche = persoana["senioritate"]
-                senioritate_noua: str = input(f"Introdu o senioritate noua, disponibile -> {stil.GALBEN}{validari.aceptare_nivel}{stil.RESET} sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().lower()
+            senioritate_veche = persoana.senioritate
+            senioritate_noua: str = input(f"Introdu o senioritate noua, disponibile -> {stil.GALBEN}{validari.aceptare_nivel}{stil.RESET} sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra: ").strip().lower()
+            if senioritate_noua:
+                while not validari.senior_validare(senioritate_noua):
+                    stil.eroare(f"Nivel invalid! Nivele disponibile -> {stil.GALBEN}{validari.aceptare_nivel}{stil.RESET}")
+                    senioritate_noua = input(f"Introdu o senioritate din, disponibile -> {stil.GALBEN}{validari.aceptare_nivel}{stil.RESET} sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra : ").strip().lower()
+                    if not senioritate_noua:
+                        break
                 if senioritate_noua:
-                    while not validari.senior_validare(senioritate_noua):
-                        stil.eroare(f"Nivel invalid! Nivele disponibile -> {stil.GALBEN}{validari.aceptare_nivel}{stil.RESET}")
-                        senioritate_noua = input(f"Introdu o senioritate din, disponibile -> {stil.GALBEN}{validari.aceptare_nivel}{stil.RESET} sau apasa {stil.GALBEN}'enter'{stil.RESET} pentru a-l pastra : ").strip().lower()
-                        if not senioritate_noua:
-                            break
-                    if senioritate_noua:
-                        persoana["senioritate"] = senioritate_noua
-                        stil.succes(f"Senioritatea a fost actualizat din {senioritate_veche} in {senioritate_noua}")
-
-                if incarcare_salvare.salveaza_fisier_angajati(angajati):
-                    stil.succes(f"Datele pentru angajatul '{persoana['nume']} {persoana['prenume']}' au fost salvate cu success!")
-                    cale_fluturas: str = f"fluturasi_angajati/fluturas_{persoana['cnp']}.json"
-                    if os.path.exists(cale_fluturas):
-                        exportare.actualizare_fluturas_fisier(persoana)
-                        stil.succes(f"Fluturasul a fost actualizat pentru fostul CNP-ul '{cnp}' in noul CNP : {cnp_nou} ")
-                    return
+                    persoana.senioritate = senioritate_noua
+                    stil.succes(f"Senioritatea a fost actualizat din {senioritate_veche} in {senioritate_noua}")
+
+            angajati.actualizeaza(persoana, vechi)
+            if incarcare_salvare.inregistreaza_modificare(angajati, "modificare", persoana, cnp):
+                stil.succes(f"Datele pentru angajatul '{persoana.nume} {persoana.prenume}' au fost salvate cu success!")
+                if exportare.exista_fluturas(persoana.cnp):
+                    exportare.actualizare_fluturas_fisier(persoana)
+                    stil.succes(f"Fluturasul a fost actualizat pentru fostul CNP-ul '{cnp}' in noul CNP : {cnp_nou} ")
+                return
         stil.atentionare(f"Nu s-a gasit nici un angajat cu CNP-ul: '{cnp}' ")
 
 
-def sterge_angajat(angajati: list[dict]) -> None:
+def sterge_angajat(angajati: RegistruAngajati) -> None:
     """
     Sterge un angajat din baza de date dupa confirmarea utilizatorului.
     
@@ -323,7 +351,7 @@ def sterge_angajat(angajati: list[dict]) -> None:
     - Optiunea de a pastra fisierul fluturas daca se doreste
     
     Args:
-        angajati (list[dict]): Lista de angajati din care se sterge angajatul.
+        angajati (RegistruAngajati): Lista de angajati din care se sterge angajatul.
         
     Returns:
         None: Functia modifica lista in-place si salveaza in fisier.
@@ -343,40 +371,38 @@ def sterge_angajat(angajati: list[dict]) -> None:
         
         gasit: bool = False
 
-        for index, angajat in enumerate(angajati):
-            if angajat['cnp'] == cnp:
-                gasit = True
+        angajat: Angajat | None = angajati.cauta(cnp)
+        if angajat is not None:
+            gasit = True
 
-                while True:
-                    confirmare: str = input(f"Sigur doriti sa stergeti angajatul '{angajat['nume']} {angajat['prenume']}' {stil.GALBEN}(da/nu){stil.RESET}: ").strip().lower()
-                    if confirmare.lower() == "da":
-
-                        fluturas_fisier: str = f"fluturasi_angajati/fluturas_{cnp}.json"
-
-                        if os.path.exists(fluturas_fisier):
-                            sterge_fluturas: str = input(f"Fluturas gasit , vrei sa stergi acest fisier? {stil.GALBEN}(da/nu){stil.RESET}: ").strip().lower()
-                            if sterge_fluturas == "da":
-                                os.remove(fluturas_fisier)
-                                stil.succes(f"Fluturasul pentru '{angajat['nume']} {angajat['prenume']}' cu CNP-ul {angajat['cnp']} a fost sters.")
-                            else:
-                                stil.info(f"Fisierul a ramas inca pe disk tu ai ales -> {stil.evidentiaza.sterge_fluturas}")
-
-                        angajati.pop(index)
-                        if incarcare_salvare.salveaza_fisier_angajati(angajati):
-                            stil.succes(f"Angajatul '{angajat['nume']} {angajat['prenume']}' sters cu success!")
+            while True:
+                confirmare: str = input(f"Sigur doriti sa stergeti angajatul '{angajat.nume} {angajat.prenume}' {stil.GALBEN}(da/nu){stil.RESET}: ").strip().lower()
+                if confirmare.lower() == "da":
+
+                    if exportare.exista_fluturas(cnp):
+                        sterge_fluturas: str = input(f"Fluturas gasit , vrei sa stergi acest fisier? {stil.GALBEN}(da/nu){stil.RESET}: ").strip().lower()
+                        if sterge_fluturas == "da":
+                            exportare.sterge_fluturas(cnp)
+                            stil.succes(f"Fluturasul pentru '{angajat.nume} {angajat.prenume}' cu CNP-ul {angajat.cnp} a fost sters.")
                         else:
-                            stil.eroare("Eroare la salvare!")
-                        return
-                    elif confirmare == "nu":
-                        stil.info(f"Operatiune oprita!")
-                        break
+                            stil.info(f"Fisierul a ramas inca pe disk tu ai ales -> {stil.evidentiaza(sterge_fluturas)}")
+
+                    angajati.sterge(angajat)
+                    if incarcare_salvare.inregistreaza_modificare(angajati, "stergere", angajat):
+                        stil.succes(f"Angajatul '{angajat.nume} {angajat.prenume}' sters cu success!")
                     else:
-                        stil.eroare(f"Raspuns inalid, ai introdus '{stil.ALBASTRU}{confirmare}{stil.RESET}{stil.ROSU}' Incearca din nou sau{stil.RESET} {stil.GALBEN}'0'{stil.RESET} {stil.ROSU}pentru meniu{stil.RESET}")
+                        stil.eroare("Eroare la salvare!")
+                    return
+                elif confirmare == "nu":
+                    stil.info(f"Operatiune oprita!")
+                    break
+                else:
+                    stil.eroare(f"Raspuns inalid, ai introdus '{stil.ALBASTRU}{confirmare}{stil.RESET}{stil.ROSU}' Incearca din nou sau{stil.RESET} {stil.GALBEN}'0'{stil.RESET} {stil.ROSU}pentru meniu{stil.RESET}")
         if not gasit:        
             stil.atentionare(f"Nu s-a gasit nici un angajat cu CNP-ul '{cnp}'")
 
 
-def afisare_toti_angajatii(angajati: list[dict]) -> None:
+def afisare_toti_angajatii(angajati: RegistruAngajati) -> None:
     """
     Afiseaza o lista sumara cu toti angajatii din companie.
     
@@ -389,7 +415,7 @@ def afisare_toti_angajatii(angajati: list[dict]) -> None:
     La inceputul listei este afisat numarul total de angajati.
     
     Args:
-        angajati (list[dict]): Lista de angajati de afisat.
+        angajati (RegistruAngajati): Lista de angajati de afisat.
         
     Returns:
         None: Functia afiseaza rezultatele direct in consola.
@@ -406,11 +432,11 @@ def afisare_toti_angajatii(angajati: list[dict]) -> None:
         return
     
     for persoane in angajati:
-        print(f"{persoane['nume']} {persoane['prenume']} | CNP: {persoane['cnp']} | Departament: {persoane['departament']} | Senioritate: {persoane['senioritate']}" )
+        print(f"{persoane.nume} {persoane.prenume} | CNP: {persoane.cnp} | Departament: {persoane.departament} | Senioritate: {persoane.senioritate}" )
     
     stil.info(f"Total de  [ {len(angajati)} ] angajati in companie")
 
-def afiseaza_total_salarii(angajati: list[dict]) -> None:
+def afiseaza_total_salarii(angajati: RegistruAngajati) -> None:
     """
     Calculeaza si afiseaza costul total lunar cu salariile pentru toti angajatii.
     
@@ -423,21 +449,27 @@ def afiseaza_total_salarii(angajati: list[dict]) -> None:
     - Raportari catre management
     
     Args:
-        angajati (list[dict]): Lista de angajati pentru calcul.
+        angajati (RegistruAngajati): Lista de angajati pentru calcul.
         
     Returns:
         None: Functia afiseaza rezultatul direct in consola.
         
     Note:
         - Calculul este facut pe salariile brute (inainte de taxe)
-        - Functia foloseste helper-ul din modulul calculare
+        - Functia foloseste helper-ul din modulul calculare, care citeste
+          agregatul companiei tinut la zi (raspuns instant)
+        - Cu ANGAJATI_VERIFICA_AGREGATE=1 agregatele sunt verificate fata de
+          o recalculare completa
     """  
     print("-"*40)
     total: float = calculare.obtine_total_salarii(angajati)
     stil.succes(f"Cost total lunar salarii este {total} RON")
+    calculare.afiseaza_detalii_agregat(angajati.agregat_companie)
+    if calculare.verificare_agregate:
+        calculare.verifica_agregate(angajati)
 
 
-def afiseaza_dupa_senioritate(angajati: list[dict]) -> None:
+def afiseaza_dupa_senioritate(angajati: RegistruAngajati) -> None:
     """
     Filtreaza si afiseaza angajatii pe baza nivelului de senioritate.
     
@@ -450,7 +482,7 @@ def afiseaza_dupa_senioritate(angajati: list[dict]) -> None:
     impreuna cu informatii despre departamentul lor.
     
     Args:
-        angajati (list[dict]): Lista de angajati pentru filtrare.
+        angajati (RegistruAngajati): Lista de angajati pentru filtrare.
         
     Returns:
         None: Functia afiseaza rezultatele direct in consola.
@@ -459,6 +491,7 @@ def afiseaza_dupa_senioritate(angajati: list[dict]) -> None:
         - Utilizatorul poate introduce '0' pentru a reveni la meniu
         - Daca nu exista angajati pe nivelul selectat, se afiseaza un mesaj
         - Comparatia este case-insensitive
+        - Angajatii sunt luati direct din indexul pe senioritate al registrului
     """
     stil.titlu(" ---> Angajati dupa senioritate")
     while True:
@@ -474,9 +507,9 @@ def afiseaza_dupa_senioritate(angajati: list[dict]) -> None:
 
     gasit: bool = False
         
-    for persoana in angajati:
-        if persoana["senioritate"].lower() == nivel:
-            stil.info(f" Angajatul : {persoana['nume']} {persoana['prenume']} este '{persoana['senioritate']}' in departamentul '{persoana['departament']}' ")
+    for persoana in angajati.cu_senioritate(nivel):
+        if persoana.senioritate.lower() == nivel:
+            stil.info(f" Angajatul : {persoana.nume} {persoana.prenume} este '{persoana.senioritate}' in departamentul '{persoana.departament}' ")
             gasit = True
 
     if gasit:
@@ -484,7 +517,7 @@ def afiseaza_dupa_senioritate(angajati: list[dict]) -> None:
     else:
         stil.atentionare(f"Nu exista nici un angajat pe nivelul '{nivel}'")
     
-def afisare_dupa_departament(angajati: list[dict]) -> None:
+def afisare_dupa_departament(angajati: RegistruAngajati) -> None:
     """
     Filtreaza si afiseaza angajatii pe baza departamentului din care fac parte.
     
@@ -497,20 +530,23 @@ def afisare_dupa_departament(angajati: list[dict]) -> None:
     - Nivel de senioritate
     
     Args:
-        angajati (list[dict]): Lista de angajati pentru filtrare.
+        angajati (RegistruAngajati): Lista de angajati pentru filtrare.
         
     Returns:
         None: Functia afiseaza rezultatele direct in consola.
         
     Note:
-        - Departamentele sunt afisate intr-un set (fara duplicate)
+        - Departamentele sunt afisate intr-un set (fara duplicate), luat din
+          registrul de departamente
+        - Angajatii sunt luati direct din indexul pe departament, deci costul
+          depinde de marimea departamentului, nu a companiei
         - Input-ul este convertit la uppercase pentru comparatie
         - Daca departamentul nu exista, se afiseaza un mesaj informativ
     """
     stil.titlu(" ---> Afisare dupa departament")
 
     gasit: bool = False
-    departamente_disponibile: set = set(persoana["departament"] for persoana in angajati)
+    departamente_disponibile: set = angajati.departamente()
     while True:
         
         departament_cautat: str = input(f"Introdu un departament disponibil -> {stil.GALBEN}{departamente_disponibile}{stil.RESET} sau {stil.GALBEN}'0'{stil.RESET} pentru meniu: ").strip().upper()
@@ -525,12 +561,79 @@ def afisare_dupa_departament(angajati: list[dict]) -> None:
             stil.atentionare(f"Nu exista nici un departament cu numele -> {stil.evidentiaza(departament_cautat)}")
             continue
 
-        for persoana in angajati:
-            if persoana["departament"].upper() == departament_cautat:
-                stil.info(f" {persoana['nume']} {persoana['prenume']} | {persoana['departament']} | {persoana['senioritate']}")
+        for persoana in angajati.din_departament(departament_cautat):
+            if persoana.departament.upper() == departament_cautat:
+                stil.info(f" {persoana.nume} {persoana.prenume} | {persoana.departament} | {persoana.senioritate}")
                 gasit = True
 
         if gasit:
             return
         else:
-            stil.info(f"Nu exista nici un angajat in departamentul -> {stil.evidentiaza(departament_cautat)}")
\ No newline at end of file
+            stil.info(f"Nu exista nici un angajat in departamentul -> {stil.evidentiaza(departament_cautat)}")
+
+def afiseaza_dupa_interval_salariu(angajati: RegistruAngajati) -> None:
+    """
+    Afiseaza angajatii cu salariul brut intr-un interval (ex: intre 6000 si 9000 RON).
+
+    Cautarea foloseste indexul ordonat pe salariu al registrului, deci costa
+    O(log n + k), unde k este numarul de angajati gasiti.
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia afiseaza rezultatele direct in consola.
+
+    Note:
+        - Capetele intervalului sunt incluse; un capat poate lipsi (ex: 6000- sau -9000)
+        - Angajatii sunt afisati crescator dupa salariu
+    """
+    stil.titlu(" ---> Angajati dupa interval de salariu")
+
+    interval: tuple[float | None, float | None] | None = intrari.cere_interval("Interval de salariu (RON)", obligatoriu=True)
+    if interval is None:
+        return
+
+    gasiti: list[Angajat] = angajati.cu_salariu_intre(*intrari.capete_interval(interval))
+    for persoana in gasiti:
+        stil.info(f" {persoana.nume} {persoana.prenume} | {persoana.salar} RON | {persoana.departament} | {persoana.senioritate}")
+
+    if gasiti:
+        stil.info(f"Total de  [ {len(gasiti)} ] angajati in interval")
+    else:
+        stil.atentionare(f"Nu exista nici un angajat cu salariul {intrari.descrie_interval(*interval, 'RON')}")
+
+
+def afiseaza_dupa_interval_varsta(angajati: RegistruAngajati) -> None:
+    """
+    Afiseaza angajatii cu varsta intr-un interval, optional dintr-un singur departament.
+
+    Cautarea foloseste indexul ordonat pe varsta al registrului (O(log n + k)).
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia afiseaza rezultatele direct in consola.
+
+    Note:
+        - Un capat al intervalului poate lipsi (ex: 50- = cel putin 50 de ani)
+        - Apasa 'enter' la departament pentru a cauta in toata compania
+        - Angajatii sunt afisati crescator dupa varsta
+    """
+    stil.titlu(" ---> Angajati dupa interval de varsta")
+
+    interval: tuple[float | None, float | None] | None = intrari.cere_interval("Interval de varsta (ani)", obligatoriu=True)
+    if interval is None:
+        return
+
+    departament: str = intrari.cere_optiune("Departament", angajati.departamente(), "Nu exista nici un departament cu numele", implicit="", majuscule=True)
+
+    gasiti: list[Angajat] = angajati.cu_varsta_intre(*intrari.capete_interval(interval), departament or None)
+    for persoana in gasiti:
+        stil.info(f" {persoana.nume} {persoana.prenume} | {persoana.varsta} ani | {persoana.departament} | {persoana.senioritate}")
+
+    if gasiti:
+        stil.info(f"Total de  [ {len(gasiti)} ] angajati in interval")
+    else:
+        stil.atentionare(f"Nu exista nici un angajat cu varsta {intrari.descrie_interval(*interval, 'ani')}")
@@ -0,0 +1,249 @@
+"""
+Modulul raport exporta tabelul complet al angajatilor, impreuna cu salarizarea
+calculata (brut, CAS, CASS, impozit, net), in format CSV sau JSON Lines, pentru
+sistemele din aval.
+
+Exportul este o conducta de generatoare:
+    angajati -> filtrare -> calcul pe loturi (salarizare.calculeaza_lot)
+             -> selectia coloanelor -> serializare pe loturi -> scriere bufferizata
+Fiecare etapa consuma si produce randuri pe rand (sau loturi de marime fixa),
+deci memoria ramane constanta indiferent de numarul de angajati atunci cand
+sursa este un flux (ex: incarcare_salvare.itereaza_angajati()).
+"""
+
+import io
+import os
+import csv
+import json
+import time
+from itertools import islice
+from typing import Iterable, Iterator, Sequence
+import stil
+import intrari
+import validari
+import salarizare
+import decodare_cnp
+from angajat import Angajat
+from registru import RegistruAngajati
+
+coloane_angajat: tuple[str, ...] = ("cnp", "nume", "prenume", "varsta", "salar", "departament", "senioritate")
+coloane_salarizare: tuple[str, ...] = ("brut", "cas", "cass", "impozit", "net", "versiune_reguli")
+coloane: tuple[str, ...] = coloane_angajat + coloane_salarizare
+formate: tuple[str, ...] = ("csv", "jsonl")
+marime_lot: int = 4096
+marime_tampon: int = 1 << 20
+
+
+class FiltruRaport:
+    """
+    Filtrele unui raport; un angajat intra in raport doar daca le respecta pe toate.
+
+    Exemple:
+        FiltruRaport(departament="IT", salar_minim=5000)
+        FiltruRaport(senioritate="junior", varsta_maxima=30)
+
+    Atribute:
+        departament (str | None): Doar angajatii acestui departament (None = toti).
+        senioritate (str | None): Doar angajatii cu aceasta senioritate (None = toti).
+        salar_minim (float | None): Salariul brut minim (inclusiv).
+        salar_maxim (float | None): Salariul brut maxim (inclusiv).
+        varsta_minima (int | None): Varsta minima (inclusiv), calculata din CNP.
+        varsta_maxima (int | None): Varsta maxima (inclusiv), calculata din CNP.
+    """
+
+    __slots__ = ("departament", "senioritate", "salar_minim", "salar_maxim", "varsta_minima", "varsta_maxima")
+
+    def __init__(self, departament: str | None = None, senioritate: str | None = None, salar_minim: float | None = None, salar_maxim: float | None = None, varsta_minima: int | None = None, varsta_maxima: int | None = None) -> None:
+        self.departament: str | None = departament
+        self.senioritate: str | None = senioritate
+        self.salar_minim: float | None = salar_minim
+        self.salar_maxim: float | None = salar_maxim
+        self.varsta_minima: int | None = varsta_minima
+        self.varsta_maxima: int | None = varsta_maxima
+
+    def __repr__(self) -> str:
+        filtre: list[str] = [f"{camp}={getattr(self, camp)!r}" for camp in self.__slots__ if getattr(self, camp) is not None]
+        return f"FiltruRaport({', '.join(filtre)})"
+
+    def potriveste(self, angajat: Angajat) -> bool:
+        """Verifica daca angajatul respecta toate filtrele."""
+        return ((self.departament is None or angajat.departament == self.departament)
+                and (self.senioritate is None or angajat.senioritate == self.senioritate)
+                and (self.salar_minim is None or angajat.salar >= self.salar_minim)
+                and (self.salar_maxim is None or angajat.salar <= self.salar_maxim)
+                and (self.varsta_minima is None or decodare_cnp.varsta_angajat(angajat) >= self.varsta_minima)
+                and (self.varsta_maxima is None or decodare_cnp.varsta_angajat(angajat) <= self.varsta_maxima))
+
+
+def filtreaza(angajati: Iterable[Angajat], filtru: FiltruRaport | None = None) -> Iterator[Angajat]:
+    """Prima etapa a conductei: pastreaza doar angajatii care respecta filtrul."""
+    if filtru is None:
+        return iter(angajati)
+    return (angajat for angajat in angajati if filtru.potriveste(angajat))
+
+
+def calculeaza_randuri(angajati: Iterable[Angajat], coloane_alese: Sequence[str], regula: salarizare.RegulaSalarizare | None = None) -> Iterator[tuple]:
+    """
+    A doua etapa: calculeaza salarizarea pe loturi si produce randurile raportului.
+
+    Salarizarea este calculata doar daca este ceruta cel putin o coloana de
+    salarizare; angajatii sunt preluati cate 'marime_lot', deci in memorie
+    este cel mult un lot.
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii (deja filtrati).
+        coloane_alese (Sequence[str]): Coloanele raportului, in ordine.
+        regula (RegulaSalarizare | None): Regula de salarizare (implicit regula curenta).
+
+    Yields:
+        tuple: Cate un rand, cu valorile coloanelor alese.
+    """
+    regula = regula or salarizare.regula_curenta()
+    cu_salarizare: bool = any(coloana in coloane_salarizare for coloana in coloane_alese)
+    iterator: Iterator[Angajat] = iter(angajati)
+    while True:
+        lot_angajati: list[Angajat] = list(islice(iterator, marime_lot))
+        if not lot_angajati:
+            return
+        lot: salarizare.LotFluturasi | None = salarizare.calculeaza_lot((angajat.salar for angajat in lot_angajati), regula) if cu_salarizare else None
+        # coloanele lotului, apoi randurile prin zip (fara un dictionar pe rand)
+        surse: list[Sequence] = []
+        for coloana in coloane_alese:
+            if coloana == "versiune_reguli":
+                surse.append([regula.versiune] * len(lot_angajati))
+            elif coloana in coloane_salarizare:
+                surse.append(getattr(lot, coloana))
+            elif coloana == "varsta":
+                # varsta din CNP, si pentru angajatii cititi in flux (fara registru)
+                surse.append(decodare_cnp.varste(lot_angajati))
+            else:
+                surse.append([getattr(angajat, coloana) for angajat in lot_angajati])
+        yield from zip(*surse)
+
+
+def serializeaza(randuri: Iterable[tuple], coloane_alese: Sequence[str], format_iesire: str = "csv") -> Iterator[str]:
+    """
+    A treia etapa: transforma randurile in text CSV sau JSON Lines, cate un bloc pe lot.
+
+    Args:
+        randuri (Iterable[tuple]): Randurile raportului.
+        coloane_alese (Sequence[str]): Numele coloanelor (antetul CSV / cheile JSON).
+        format_iesire (str): "csv" sau "jsonl".
+
+    Yields:
+        str: Blocuri de text (antetul CSV, apoi cate un bloc pentru fiecare lot de randuri).
+    """
+    iterator: Iterator[tuple] = iter(randuri)
+    if format_iesire == "csv":
+        tampon: io.StringIO = io.StringIO()
+        csv.writer(tampon, lineterminator="\n").writerow(coloane_alese)
+        yield tampon.getvalue()
+    while True:
+        lot: list[tuple] = list(islice(iterator, marime_lot))
+        if not lot:
+            return
+        tampon = io.StringIO()
+        if format_iesire == "csv":
+            csv.writer(tampon, lineterminator="\n").writerows(lot)
+        else:
+            for rand in lot:
+                tampon.write(json.dumps(dict(zip(coloane_alese, rand)), ensure_ascii=False))
+                tampon.write("\n")
+        yield tampon.getvalue()
+
+
+def scrie_raport(angajati: Iterable[Angajat], cale: str, format_iesire: str = "csv", coloane_alese: Sequence[str] | None = None, filtru: FiltruRaport | None = None) -> dict[str, float]:
+    """
+    Scrie raportul companiei (angajati + salarizare) in flux, intr-un fisier CSV sau JSONL.
+
+    Fisierul este scris cu un tampon mare, intai cu extensia .tmp, si redenumit
+    la final, deci un export intrerupt nu lasa un raport incomplet.
+
+    Exemple:
+        scrie_raport(incarcare_salvare.itereaza_angajati(), "raport.jsonl", "jsonl")
+        scrie_raport(registru, "it.csv", coloane_alese=["cnp", "nume", "net"], filtru=FiltruRaport(departament="IT"))
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii (registrul sau un flux).
+        cale (str): Fisierul de iesire.
+        format_iesire (str): "csv" sau "jsonl".
+        coloane_alese (Sequence[str] | None): Coloanele raportului, din 'coloane'
+                                              (implicit toate, in ordinea din 'coloane').
+        filtru (FiltruRaport | None): Filtrele aplicate (implicit niciunul).
+
+    Returns:
+        dict[str, float]: "randuri" scrise, "octeti" scrisi si "secunde".
+
+    Raises:
+        ValueError: Daca formatul sau o coloana nu sunt cunoscute.
+    """
+    if format_iesire not in formate:
+        raise ValueError(f"format necunoscut: {format_iesire}")
+    coloane_alese = tuple(coloane_alese or coloane)
+    necunoscute: list[str] = [coloana for coloana in coloane_alese if coloana not in coloane]
+    if necunoscute:
+        raise ValueError(f"coloane necunoscute: {', '.join(necunoscute)}")
+
+    inceput: float = time.perf_counter()
+    randuri: int = 0
+
+    def numara(sursa: Iterable[tuple]) -> Iterator[tuple]:
+        nonlocal randuri
+        for rand in sursa:
+            randuri += 1
+            yield rand
+
+    cale_temporara: str = cale + ".tmp"
+    with open(cale_temporara, "w", encoding="utf-8", newline="", buffering=marime_tampon) as fisier:
+        for bloc in serializeaza(numara(calculeaza_randuri(filtreaza(angajati, filtru), coloane_alese)), coloane_alese, format_iesire):
+            fisier.write(bloc)
+    os.replace(cale_temporara, cale)
+    return {"randuri": randuri, "octeti": os.path.getsize(cale), "secunde": time.perf_counter() - inceput}
+
+
+def raport_companie(angajati: RegistruAngajati) -> None:
+    """
+    Exporta tabelul angajatilor impreuna cu salarizarea calculata intr-un fisier CSV sau JSONL.
+
+    Utilizatorul alege formatul, coloanele (din 'coloane') si filtrele
+    (departament, senioritate, interval de salariu, interval de varsta).
+    Raportul este scris in flux de scrie_raport (conducta de generatoare si
+    scriere bufferizata), deci memoria nu creste cu numarul de angajati.
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia scrie fisierul si afiseaza rezultatul in consola.
+
+    Note:
+        - Apasa 'enter' pentru valorile implicite (csv, toate coloanele, fara filtre)
+        - Intervalele se introduc ca minim-maxim (ex: 4000-8000, 4000- sau -8000)
+        - Fisierul se numeste raport_angajati.{format}
+    """
+    stil.titlu(" ---> Raport companie (CSV/JSONL)")
+
+    if not intrari.exista_angajati(angajati):
+        return
+
+    format_iesire: str = intrari.cere_optiune("Format", formate, "Format necunoscut", implicit="csv")
+
+    while True:
+        text: str = input(f"Coloane {stil.GALBEN}{coloane}{stil.RESET} separate prin virgula (implicit toate): ").strip().lower()
+        coloane_alese: list[str] = [coloana.strip() for coloana in text.split(",") if coloana.strip()] if text else list(coloane)
+        necunoscute: list[str] = [coloana for coloana in coloane_alese if coloana not in coloane]
+        if coloane_alese and not necunoscute:
+            break
+        stil.eroare(f"Coloane necunoscute -> {stil.evidentiaza(', '.join(necunoscute) or text)}")
+
+    departament: str = intrari.cere_optiune("Departament", angajati.departamente(), "Nu exista nici un departament cu numele", implicit="", majuscule=True)
+    senioritate: str = intrari.cere_optiune("Senioritate", validari.aceptare_nivel, "Senioritate necunoscuta", implicit="")
+
+    salar_minim, salar_maxim = intrari.cere_interval("Interval de salariu (RON)")
+    varsta_minima, varsta_maxima = intrari.cere_interval("Interval de varsta (ani)")
+    filtru: FiltruRaport = FiltruRaport(departament or None, senioritate or None, salar_minim, salar_maxim, varsta_minima, varsta_maxima)
+
+    cale: str = f"raport_angajati.{format_iesire}"
+    rezultat: dict[str, float] = scrie_raport(angajati, cale, format_iesire, coloane_alese, filtru)
+    stil.succes(f"Raportul cu {rezultat['randuri']} angajati a fost scris in {stil.evidentiaza(cale)}")
+    stil.info(f"Durata: {rezultat['secunde']:.2f} s | {rezultat['octeti'] / 1_000_000:.2f} MB")
@@ -0,0 +1,343 @@
+"""
+Modulul registru contine RegistruAngajati, colectia de angajati folosita de
+aplicatie in timpul rularii.
+
+Registrul pastreaza angajatii in ordinea adaugarii si tine sincronizate
+structurile derivate (indexul CNP -> angajat, indexurile secundare pe
+departament si senioritate, indexurile ordonate pe salar si varsta, indexul
+de nume, totalurile salariale pe companie si pe departament, tabelul columnar
+pentru rapoarte) la fiecare adaugare, modificare si stergere. Toate modificarile
+trebuie facute prin metodele adauga, actualizeaza si sterge.
+
+Varsta fiecarui angajat este recalculata din CNP (decodare_cnp) la intrarea in
+registru si la fiecare modificare, deci indexul pe varsta, filtrele si afisarile
+folosesc aceeasi varsta; campul 'varsta' salvat conteaza doar pentru CNP-urile
+vechi, care nu pot fi decodate.
+"""
+
+from typing import Callable, Iterable, Iterator
+import decodare_cnp
+from angajat import Angajat
+from tabel_angajati import TabelAngajati
+from agregate import AgregatSalarii
+from index_sortat import IndexSortat
+from index_nume import IndexNume
+
+
+class RegistruAngajati:
+    """
+    Colectia de angajati a companiei, cu structurile derivate sincronizate.
+
+    Se comporta ca o lista doar pentru citire (iterare, len, 'cnp in registru'),
+    iar modificarile se fac prin adauga / actualizeaza / sterge. Cautarea dupa
+    CNP foloseste un index (dictionar) si costa O(1), iar listarea unui
+    departament sau a unui nivel de senioritate costa cat numarul de membri.
+    Interogarile pe interval de salariu sau de varsta si completarea dupa
+    prefixul numelui costa O(log n + k).
+
+    Atribute:
+        tabel (TabelAngajati): Reprezentarea columnara folosita in calcule.
+        agregat_companie (AgregatSalarii): Totalurile salariale pe toata compania.
+    """
+
+    def __init__(self, angajati: Iterable[Angajat] = ()) -> None:
+        # id(angajat) -> angajat; dictionarul pastreaza ordinea adaugarii,
+        # iar stergerea este O(1)
+        self._angajati: dict[int, Angajat] = {}
+        self._dupa_cnp: dict[str, Angajat] = {}
+        # indexuri secundare: valoare -> {id(angajat): angajat}; un departament
+        # fara angajati este eliminat, deci cheile formeaza registrul de departamente
+        self._dupa_departament: dict[str, dict[int, Angajat]] = {}
+        self._dupa_senioritate: dict[str, dict[int, Angajat]] = {}
+        self._index_salar: IndexSortat = IndexSortat()
+        self._index_varsta: IndexSortat = IndexSortat()
+        self._index_nume: IndexNume = IndexNume()
+        self.tabel: TabelAngajati = TabelAngajati()
+        self.agregat_companie: AgregatSalarii = AgregatSalarii()
+        self._agregate_departament: dict[str, AgregatSalarii] = {}
+        self.adauga_lot(list(angajati))
+
+    def __iter__(self) -> Iterator[Angajat]:
+        return iter(self._angajati.values())
+
+    def __len__(self) -> int:
+        return len(self._angajati)
+
+    def __bool__(self) -> bool:
+        return bool(self._angajati)
+
+    def __contains__(self, cnp: str) -> bool:
+        return cnp in self._dupa_cnp
+
+    def cauta(self, cnp: str) -> Angajat | None:
+        """
+        Cauta un angajat dupa CNP folosind indexul registrului.
+
+        Args:
+            cnp (str): CNP-ul cautat.
+
+        Returns:
+            Angajat | None: Angajatul gasit sau None daca CNP-ul nu exista.
+        """
+        return self._dupa_cnp.get(cnp)
+
+    def departamente(self) -> set[str]:
+        """Returneaza departamentele care au cel putin un angajat."""
+        return set(self._dupa_departament)
+
+    def din_departament(self, departament: str) -> list[Angajat]:
+        """
+        Returneaza angajatii unui departament, in ordinea adaugarii.
+
+        Args:
+            departament (str): Numele departamentului.
+
+        Returns:
+            list[Angajat]: Membrii departamentului (lista goala daca nu exista).
+        """
+        return list(self._dupa_departament.get(departament, {}).values())
+
+    def cu_senioritate(self, senioritate: str) -> list[Angajat]:
+        """
+        Returneaza angajatii cu un anumit nivel de senioritate.
+
+        Args:
+            senioritate (str): Nivelul cautat (junior/mid/senior).
+
+        Returns:
+            list[Angajat]: Angajatii de pe acel nivel.
+        """
+        return list(self._dupa_senioritate.get(senioritate, {}).values())
+
+    def cu_salariu_intre(self, minim: float, maxim: float) -> list[Angajat]:
+        """
+        Returneaza angajatii cu salariul brut in [minim, maxim], crescator dupa salariu.
+
+        Args:
+            minim (float): Salariul minim (inclusiv).
+            maxim (float): Salariul maxim (inclusiv).
+
+        Returns:
+            list[Angajat]: Angajatii gasiti.
+        """
+        return [self._angajati[identificator] for identificator in self._index_salar.interval(minim, maxim)]
+
+    def cu_varsta_intre(self, minim: int, maxim: int, departament: str | None = None) -> list[Angajat]:
+        """
+        Returneaza angajatii cu varsta in [minim, maxim], optional dintr-un departament.
+
+        Args:
+            minim (int): Varsta minima (inclusiv).
+            maxim (int): Varsta maxima (inclusiv).
+            departament (str | None): Departamentul filtrat sau None pentru toti.
+
+        Returns:
+            list[Angajat]: Angajatii gasiti, crescator dupa varsta.
+        """
+        rezultat: list[Angajat] = [self._angajati[identificator] for identificator in self._index_varsta.interval(minim, maxim)]
+        if departament is not None:
+            rezultat = [angajat for angajat in rezultat if angajat.departament == departament]
+        return rezultat
+
+    def cu_nume_incepand(self, text: str, limita: int = 20) -> list[Angajat]:
+        """
+        Returneaza angajatii al caror nume complet incepe cu textul dat.
+
+        Se potrivesc atat "nume prenume", cat si "prenume nume"; literele mari
+        si diacriticele sunt ignorate.
+
+        Args:
+            text (str): Inceputul numelui ("pop", "popescu io", "ion").
+            limita (int): Numarul maxim de rezultate.
+
+        Returns:
+            list[Angajat]: Angajatii gasiti, in ordine alfabetica.
+        """
+        return [self._angajati[identificator] for identificator in self._index_nume.prefix(text, limita)]
+
+    def cu_nume_asemanator(self, text: str, limita: int = 10) -> list[Angajat]:
+        """
+        Returneaza angajatii cu numele cel mai asemanator textului (tolereaza greseli).
+
+        Args:
+            text (str): Numele cautat, eventual scris gresit ("popesku ion").
+            limita (int): Numarul maxim de rezultate.
+
+        Returns:
+            list[Angajat]: Angajatii gasiti, de la cel mai asemanator.
+        """
+        return [self._angajati[identificator] for identificator, _ in self._index_nume.aproximativ(text, limita)]
+
+    def agregat_departament(self, departament: str) -> AgregatSalarii:
+        """
+        Returneaza totalurile salariale ale unui departament (citire O(1)).
+
+        Args:
+            departament (str): Numele departamentului.
+
+        Returns:
+            AgregatSalarii: Agregatul departamentului (gol daca nu exista).
+        """
+        return self._agregate_departament.get(departament) or AgregatSalarii()
+
+    def verifica_agregate(self) -> dict[str, list[str]]:
+        """
+        Verifica agregatele incrementale fata de o recalculare completa.
+
+        Returns:
+            dict[str, list[str]]: Grup ("COMPANIE" sau departament) -> diferente
+                                  gasite; dictionar gol daca totul este corect.
+        """
+        rezultat: dict[str, list[str]] = {}
+        diferente: list[str] = self.agregat_companie.diferente(angajat.salar for angajat in self)
+        if diferente:
+            rezultat["COMPANIE"] = diferente
+        for departament in set(self._agregate_departament) | set(self._dupa_departament):
+            membri = self._dupa_departament.get(departament, {}).values()
+            diferente = self.agregat_departament(departament).diferente(angajat.salar for angajat in membri)
+            if diferente:
+                rezultat[departament] = diferente
+        return rezultat
+
+    def _agrega(self, departament: str, salar: float) -> None:
+        self.agregat_companie.adauga(salar)
+        self._agregate_departament.setdefault(departament, AgregatSalarii()).adauga(salar)
+
+    def _dezagrega(self, departament: str, salar: float) -> None:
+        self.agregat_companie.scoate(salar)
+        agregat: AgregatSalarii = self._agregate_departament[departament]
+        agregat.scoate(salar)
+        if not agregat.numar:
+            del self._agregate_departament[departament]
+
+    @staticmethod
+    def _indexeaza(index: dict[str, dict[int, Angajat]], cheie: str, angajat: Angajat) -> None:
+        index.setdefault(cheie, {})[id(angajat)] = angajat
+
+    @staticmethod
+    def _deindexeaza(index: dict[str, dict[int, Angajat]], cheie: str, angajat: Angajat) -> None:
+        membri: dict[int, Angajat] = index[cheie]
+        del membri[id(angajat)]
+        if not membri:
+            del index[cheie]
+
+    def adauga(self, angajat: Angajat) -> None:
+        """Adauga un angajat nou la sfarsitul registrului (cu varsta recalculata din CNP)."""
+        angajat.varsta = decodare_cnp.varsta_angajat(angajat)
+        self._angajati[id(angajat)] = angajat
+        self._dupa_cnp[angajat.cnp] = angajat
+        self._indexeaza(self._dupa_departament, angajat.departament, angajat)
+        self._indexeaza(self._dupa_senioritate, angajat.senioritate, angajat)
+        self._agrega(angajat.departament, angajat.salar)
+        self._index_salar.adauga(float(angajat.salar), id(angajat))
+        self._index_varsta.adauga(int(angajat.varsta), id(angajat))
+        self._index_nume.adauga(angajat.nume, angajat.prenume, id(angajat))
+        self.tabel.adauga(angajat)
+
+    def adauga_lot(self, angajati: list[Angajat]) -> None:
+        """
+        Adauga mai multi angajati noi deodata (incarcarea registrului, un import in masa).
+
+        Rezultatul este acelasi ca la apelarea lui adauga pentru fiecare angajat,
+        dar fiecare structura derivata este actualizata o singura data pentru tot
+        lotul: varstele sunt calculate intr-o trecere (decodare_cnp.varste),
+        indexurile ordonate sunt sortate o singura data, la prima interogare, iar
+        agregatele si coloanele tabelului sunt extinse pe grupuri.
+
+        Args:
+            angajati (list[Angajat]): Angajatii noi, in ordinea adaugarii.
+        """
+        for angajat, varsta in zip(angajati, decodare_cnp.varste(angajati)):
+            angajat.varsta = varsta
+        membri_departament: dict[str, list[Angajat]] = {}
+        for angajat in angajati:
+            self._angajati[id(angajat)] = angajat
+            self._dupa_cnp[angajat.cnp] = angajat
+            self._indexeaza(self._dupa_departament, angajat.departament, angajat)
+            self._indexeaza(self._dupa_senioritate, angajat.senioritate, angajat)
+            membri_departament.setdefault(angajat.departament, []).append(angajat)
+        self.agregat_companie.adauga_lot(angajat.salar for angajat in angajati)
+        for departament, membri in membri_departament.items():
+            self._agregate_departament.setdefault(departament, AgregatSalarii()).adauga_lot(angajat.salar for angajat in membri)
+        self._index_salar.adauga_lot((float(angajat.salar), id(angajat)) for angajat in angajati)
+        self._index_varsta.adauga_lot((int(angajat.varsta), id(angajat)) for angajat in angajati)
+        self._index_nume.adauga_lot((angajat.nume, angajat.prenume, id(angajat)) for angajat in angajati)
+        self.tabel.adauga_lot(angajati)
+
+    def actualizeaza(self, angajat: Angajat, vechi: Angajat) -> None:
+        """
+        Sincronizeaza structurile derivate dupa modificarea unui angajat.
+
+        Angajatul este modificat in-place de apelant; 'vechi' este o copie
+        facuta inainte de modificare (vezi Angajat.copie).
+
+        Args:
+            angajat (Angajat): Angajatul, dupa modificare.
+            vechi (Angajat): Copia datelor dinainte de modificare.
+        """
+        angajat.varsta = decodare_cnp.varsta_angajat(angajat)
+        if angajat.cnp != vechi.cnp:
+            del self._dupa_cnp[vechi.cnp]
+            self._dupa_cnp[angajat.cnp] = angajat
+        if angajat.departament != vechi.departament:
+            self._deindexeaza(self._dupa_departament, vechi.departament, angajat)
+            self._indexeaza(self._dupa_departament, angajat.departament, angajat)
+        if angajat.senioritate != vechi.senioritate:
+            self._deindexeaza(self._dupa_senioritate, vechi.senioritate, angajat)
+            self._indexeaza(self._dupa_senioritate, angajat.senioritate, angajat)
+        if angajat.departament != vechi.departament or angajat.salar != vechi.salar:
+            self._dezagrega(vechi.departament, vechi.salar)
+            self._agrega(angajat.departament, angajat.salar)
+        if angajat.salar != vechi.salar:
+            self._index_salar.scoate(float(vechi.salar), id(angajat))
+            self._index_salar.adauga(float(angajat.salar), id(angajat))
+        if angajat.varsta != vechi.varsta:
+            self._index_varsta.scoate(int(vechi.varsta), id(angajat))
+            self._index_varsta.adauga(int(angajat.varsta), id(angajat))
+        if angajat.nume != vechi.nume or angajat.prenume != vechi.prenume:
+            self._index_nume.scoate(id(angajat))
+            self._index_nume.adauga(angajat.nume, angajat.prenume, id(angajat))
+        self.tabel.actualizeaza(angajat)
+
+    def sterge(self, angajat: Angajat) -> None:
+        """Sterge un angajat din registru."""
+        del self._angajati[id(angajat)]
+        del self._dupa_cnp[angajat.cnp]
+        self._deindexeaza(self._dupa_departament, angajat.departament, angajat)
+        self._deindexeaza(self._dupa_senioritate, angajat.senioritate, angajat)
+        self._dezagrega(angajat.departament, angajat.salar)
+        self._index_salar.scoate(float(angajat.salar), id(angajat))
+        self._index_varsta.scoate(int(angajat.varsta), id(angajat))
+        self._index_nume.scoate(id(angajat))
+        self.tabel.sterge(angajat)
+
+
+class RegistruLenes(RegistruAngajati):
+    """
+    Registru populat abia la primul acces (folosit pentru instantaneul binar).
+
+    Pornirea aplicatiei doar retine functia de incarcare; angajatii sunt cititi
+    si indexurile construite la prima folosire a registrului (iterare, len,
+    cautare, adaugare etc.), deci costul incarcarii nu mai este platit inainte
+    de afisarea meniului, ci la prima optiune care are nevoie de angajati.
+
+    Exemple:
+        registru = RegistruLenes(lambda: incarcare_salvare.citeste_instantaneu(binar=True))
+        len(registru)   -> angajatii sunt incarcati acum
+
+    Note:
+        - Popularea este declansata de __getattr__: structurile registrului
+          (_angajati, tabel, agregat_companie etc.) lipsesc pana atunci
+    """
+
+    def __init__(self, incarca: Callable[[], Iterable[Angajat]]) -> None:
+        self._incarca: Callable[[], Iterable[Angajat]] | None = incarca
+
+    def __getattr__(self, nume: str):
+        # apelata doar pentru atributele care lipsesc, adica inainte de populare
+        incarca: Callable[[], Iterable[Angajat]] | None = self.__dict__.get("_incarca")
+        if incarca is None:
+            raise AttributeError(nume)
+        self._incarca = None
+        RegistruAngajati.__init__(self, incarca())
+        return getattr(self, nume)
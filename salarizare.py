@@ -0,0 +1,304 @@
+"""
+Modulul salarizare contine motorul unic de calcul al fluturasilor de salariu.
+
+Toate ecranele si exporturile calculeaza salariul net prin acest modul, pe
+baza unui tabel versionat de reguli (cote de contributii, salariul minim si
+politica de rotunjire). Contributiile sunt calculate conform legislatiei din
+Romania:
+- CAS (pensie): 25% din brut
+- CASS (sanatate): 10% din brut
+- Impozit: 10% din baza de calcul (brut - CAS - CASS)
+
+Versiunea de reguli folosita este aleasa cu variabila de mediu
+ANGAJATI_REGULI (implicit, sau daca versiunea ceruta nu exista, cea mai
+recenta versiune din tabel).
+
+Pe langa calculul pentru un singur salariu (calculeaza_fluturas), modulul
+ofera calculul pe loturi (calculeaza_lot): toate salariile sunt tinute pe
+coloane (array) si fiecare componenta este calculata intr-o singura trecere
+peste coloana, in locul unui calcul complet pentru fiecare persoana.
+
+Fluturasii calculati dupa regulile din tabel sunt memorati intr-un cache LRU
+marginit, cu cheia (salariu brut, versiune reguli): multi angajati au acelasi
+salariu brut, iar acelasi fluturas este cerut din nou la afisare, export sau
+simulari. Regulile se modifica doar prin inregistreaza_regula, care goleste
+cache-ul.
+"""
+
+import os
+import math
+import stil
+from array import array
+from functools import lru_cache
+from typing import Iterable
+
+
+class RegulaSalarizare:
+    """
+    O versiune a regulilor de salarizare.
+
+    Atribute:
+        versiune (str): Identificatorul versiunii (luna intrarii in vigoare, "AAAA-LL").
+        cota_cas (float): Cota CAS aplicata brutului.
+        cota_cass (float): Cota CASS aplicata brutului.
+        cota_impozit (float): Cota de impozit aplicata bazei de calcul.
+        salariu_minim (int): Salariul minim brut acceptat la validare.
+        zecimale (int): Politica de rotunjire: fiecare componenta (CAS, CASS,
+                        impozit) este rotunjita la acest numar de zecimale, iar
+                        netul este brutul minus componentele rotunjite.
+    """
+
+    __slots__ = ("versiune", "cota_cas", "cota_cass", "cota_impozit", "salariu_minim", "zecimale")
+
+    def __init__(self, versiune: str, cota_cas: float, cota_cass: float, cota_impozit: float, salariu_minim: int, zecimale: int = 2) -> None:
+        self.versiune: str = versiune
+        self.cota_cas: float = cota_cas
+        self.cota_cass: float = cota_cass
+        self.cota_impozit: float = cota_impozit
+        self.salariu_minim: int = salariu_minim
+        self.zecimale: int = zecimale
+
+    def __repr__(self) -> str:
+        return f"RegulaSalarizare({self.versiune!r}, CAS {self.cota_cas:.0%}, CASS {self.cota_cass:.0%}, impozit {self.cota_impozit:.0%}, minim {self.salariu_minim})"
+
+
+# tabelul versionat de reguli; o versiune noua se adauga aici, nu in cod
+reguli: dict[str, RegulaSalarizare] = {
+    "2024-07": RegulaSalarizare("2024-07", 0.25, 0.10, 0.10, 3700),
+    "2025-01": RegulaSalarizare("2025-01", 0.25, 0.10, 0.10, 4050),
+}
+
+versiune_curenta: str = os.environ.get("ANGAJATI_REGULI", max(reguli))
+if versiune_curenta not in reguli:
+    stil.atentionare(f"Versiunea de reguli ANGAJATI_REGULI={versiune_curenta} nu exista (disponibile: {', '.join(sorted(reguli))}), se foloseste {max(reguli)}")
+    versiune_curenta = max(reguli)
+marime_cache_fluturasi: int = 65536
+
+
+def regula_curenta() -> RegulaSalarizare:
+    """
+    Returneaza regulile de salarizare in vigoare (versiunea 'versiune_curenta').
+
+    Returns:
+        RegulaSalarizare: Regulile folosite implicit de toate calculele.
+    """
+    return reguli[versiune_curenta]
+
+
+def regula_pentru_luna(luna: str) -> RegulaSalarizare:
+    """
+    Returneaza regulile in vigoare intr-o luna (ultima versiune intrata in vigoare pana atunci).
+
+    Exemple:
+        regula_pentru_luna("2024-12").versiune -> "2024-07"
+
+    Args:
+        luna (str): Luna, in formatul "AAAA-LL".
+
+    Returns:
+        RegulaSalarizare: Regulile lunii; pentru o luna anterioara tuturor
+                          versiunilor este folosita cea mai veche versiune.
+    """
+    in_vigoare: list[str] = [versiune for versiune in reguli if versiune <= luna]
+    return reguli[max(in_vigoare) if in_vigoare else min(reguli)]
+
+
+class Fluturas:
+    """
+    Componentele unui fluturas de salariu, calculate dupa o versiune de reguli.
+
+    Atribute:
+        brut (float): Salariul brut.
+        cas (float): Contributia CAS.
+        cass (float): Contributia CASS.
+        impozit (float): Impozitul pe venit.
+        net (float): Salariul net (brut - CAS - CASS - impozit).
+        regula (RegulaSalarizare): Regulile folosite la calcul.
+    """
+
+    __slots__ = ("brut", "cas", "cass", "impozit", "net", "regula")
+
+    def __init__(self, brut: float, cas: float, cass: float, impozit: float, net: float, regula: RegulaSalarizare) -> None:
+        self.brut: float = brut
+        self.cas: float = cas
+        self.cass: float = cass
+        self.impozit: float = impozit
+        self.net: float = net
+        self.regula: RegulaSalarizare = regula
+
+    def in_dict(self) -> dict:
+        """
+        Returneaza componentele cu etichetele folosite pe fluturasi si in exporturi.
+
+        Exemple:
+            {"Salariu brut": 5000.0, "Cas (25%)": 1250.0, "Cass (10%)": 500.0,
+             "Impozit (10%)": 325.0, "Salariu net": 2925.0}
+
+        Returns:
+            dict: Eticheta -> valoare, in ordinea de pe fluturas.
+        """
+        return {
+            "Salariu brut": self.brut,
+            f"Cas ({self.regula.cota_cas:.0%})": self.cas,
+            f"Cass ({self.regula.cota_cass:.0%})": self.cass,
+            f"Impozit ({self.regula.cota_impozit:.0%})": self.impozit,
+            "Salariu net": self.net,
+        }
+
+    def __repr__(self) -> str:
+        return f"Fluturas(brut={self.brut}, cas={self.cas}, cass={self.cass}, impozit={self.impozit}, net={self.net}, versiune={self.regula.versiune!r})"
+
+
+def _calculeaza(brut: float, regula: RegulaSalarizare) -> Fluturas:
+    cas: float = round(brut * regula.cota_cas, regula.zecimale)
+    cass: float = round(brut * regula.cota_cass, regula.zecimale)
+    impozit: float = round((brut - cas - cass) * regula.cota_impozit, regula.zecimale)
+    net: float = round(brut - cas - cass - impozit, regula.zecimale)
+    return Fluturas(brut, cas, cass, impozit, net, regula)
+
+
+@lru_cache(maxsize=marime_cache_fluturasi)
+def _fluturas_memorat(brut: float, versiune: str) -> Fluturas:
+    return _calculeaza(brut, reguli[versiune])
+
+
+def calculeaza_fluturas(brut: float, regula: RegulaSalarizare | None = None) -> Fluturas:
+    """
+    Calculeaza fluturasul de salariu pornind de la salariul brut.
+
+    Pentru regulile din tabelul 'reguli' rezultatul este luat din cache-ul
+    LRU (cheia este salariul brut si versiunea regulilor); o regula care nu
+    este in tabel (ex: o simulare) este calculata direct, fara cache.
+
+    Exemple:
+        calculeaza_fluturas(5000).net -> 2925.0
+
+    Args:
+        brut (float): Salariul brut lunar.
+        regula (RegulaSalarizare | None): Regulile folosite (implicit regula_curenta()).
+
+    Returns:
+        Fluturas: Componentele salariului, rotunjite dupa politica regulilor.
+
+    Note:
+        Fluturasul returnat poate fi partajat prin cache si nu trebuie modificat.
+    """
+    regula = regula or regula_curenta()
+    brut = float(brut)
+    if reguli.get(regula.versiune) is regula:
+        return _fluturas_memorat(brut, regula.versiune)
+    return _calculeaza(brut, regula)
+
+
+def inregistreaza_regula(regula: RegulaSalarizare) -> None:
+    """
+    Adauga sau inlocuieste o versiune in tabelul de reguli si goleste cache-ul de fluturasi.
+
+    Args:
+        regula (RegulaSalarizare): Regulile noi (versiunea existenta este inlocuita).
+    """
+    reguli[regula.versiune] = regula
+    _fluturas_memorat.cache_clear()
+
+
+def statistici_cache() -> dict[str, int]:
+    """
+    Returneaza statisticile cache-ului de fluturasi.
+
+    Returns:
+        dict[str, int]: "reusite" (hits), "ratari" (misses), "marime" (fluturasi
+                        memorati) si "capacitate" (marimea maxima a cache-ului).
+    """
+    informatii = _fluturas_memorat.cache_info()
+    return {"reusite": informatii.hits, "ratari": informatii.misses, "marime": informatii.currsize, "capacitate": informatii.maxsize}
+
+
+def salariu_net(brut: float) -> float:
+    """
+    Calculeaza salariul net pornind de la salariul brut, dupa regulile in vigoare.
+
+    Exemple:
+        5000 -> 2925.0
+
+    Args:
+        brut (float): Salariul brut lunar.
+
+    Returns:
+        float: Salariul net (brut - CAS - CASS - impozit).
+    """
+    return calculeaza_fluturas(brut).net
+
+
+class LotFluturasi:
+    """
+    Fluturasii unui lot de salarii, tinuti pe coloane (cate un array pe componenta).
+
+    Randul i corespunde salariului i din lotul primit de calculeaza_lot.
+
+    Atribute:
+        brut, cas, cass, impozit, net (array): Coloanele componentelor ('d').
+        regula (RegulaSalarizare): Regulile folosite la calcul.
+    """
+
+    __slots__ = ("brut", "cas", "cass", "impozit", "net", "regula")
+
+    def __init__(self, brut: array, cas: array, cass: array, impozit: array, net: array, regula: RegulaSalarizare) -> None:
+        self.brut: array = brut
+        self.cas: array = cas
+        self.cass: array = cass
+        self.impozit: array = impozit
+        self.net: array = net
+        self.regula: RegulaSalarizare = regula
+
+    def __len__(self) -> int:
+        return len(self.brut)
+
+    def __getitem__(self, pozitie: int) -> Fluturas:
+        return Fluturas(self.brut[pozitie], self.cas[pozitie], self.cass[pozitie], self.impozit[pozitie], self.net[pozitie], self.regula)
+
+    def totaluri(self) -> dict[str, float]:
+        """
+        Returneaza suma fiecarei componente pe tot lotul (math.fsum pe coloane).
+
+        Returns:
+            dict[str, float]: Componenta ("brut", "cas", ...) -> total.
+        """
+        return {camp: math.fsum(getattr(self, camp)) for camp in ("brut", "cas", "cass", "impozit", "net")}
+
+
+def calculeaza_lot(salarii: Iterable[float], regula: RegulaSalarizare | None = None) -> LotFluturasi:
+    """
+    Calculeaza fluturasii pentru un lot intreg de salarii brute.
+
+    Pentru regulile din tabel, fiecare salariu distinct este calculat o singura
+    data (prin cache-ul de fluturasi), iar coloanele sunt completate din
+    fluturasii distincti. Pentru alte reguli, fiecare componenta este calculata
+    printr-o singura trecere peste coloana anterioara (brut -> CAS, CASS ->
+    impozit -> net), cu aceleasi formule si aceeasi rotunjire ca in
+    calculeaza_fluturas.
+
+    Exemple:
+        lot = calculeaza_lot(registru.tabel.salarii)
+        lot.totaluri()["net"]
+
+    Args:
+        salarii (Iterable[float]): Salariile brute (lista, array, flux).
+        regula (RegulaSalarizare | None): Regulile folosite (implicit regula_curenta()).
+
+    Returns:
+        LotFluturasi: Fluturasii lotului, pe coloane.
+    """
+    regula = regula or regula_curenta()
+    brut: array = array("d", salarii)
+    if reguli.get(regula.versiune) is regula:
+        # fiecare salariu distinct este calculat (sau luat din cache) o singura data
+        fluturasi: dict[float, Fluturas] = {valoare: _fluturas_memorat(valoare, regula.versiune) for valoare in set(brut)}
+        coloane: list[array] = [array("d", [getattr(fluturasi[valoare], camp) for valoare in brut]) for camp in ("cas", "cass", "impozit", "net")]
+        return LotFluturasi(brut, *coloane, regula)
+
+    zecimale: int = regula.zecimale
+    cas: array = array("d", [round(valoare * regula.cota_cas, zecimale) for valoare in brut])
+    cass: array = array("d", [round(valoare * regula.cota_cass, zecimale) for valoare in brut])
+    impozit: array = array("d", [round((b - c - s) * regula.cota_impozit, zecimale) for b, c, s in zip(brut, cas, cass)])
+    net: array = array("d", [round(b - c - s - i, zecimale) for b, c, s, i in zip(brut, cas, cass, impozit)])
+    return LotFluturasi(brut, cas, cass, impozit, net, regula)
@@ -0,0 +1,239 @@
+"""
+Modulul schita_cuantile contine o schita KLL pentru percentile aproximative
+calculate in flux, cu memorie marginita.
+
+Schita pastreaza cateva niveluri de "compactoare": valorile noi intra pe
+nivelul 0, iar cand un nivel se umple, valorile lui sunt sortate si jumatate
+dintre ele (alese din doua in doua, cu un decalaj aleator) urca pe nivelul
+urmator cu greutate dubla. Numarul de valori pastrate creste doar logaritmic
+cu numarul de valori primite, iar eroarea de rang a unei percentile este de
+ordinul 1/k (k = capacitatea nivelului cel mai de sus).
+
+Doua schite se pot combina (merge) nivel cu nivel; de exemplu, schitele pe
+departamente se combina intr-o schita pentru toata compania, fara a reciti
+angajatii.
+"""
+
+import math
+import random
+from typing import Iterable
+import stil
+import intrari
+from angajat import Angajat
+from registru import RegistruAngajati
+
+
+class SchitaCuantile:
+    """
+    Schita KLL combinabila pentru estimarea percentilelor dintr-un flux de valori.
+
+    Exemple:
+        schita = SchitaCuantile(eroare=0.01)
+        for salar in salarii:
+            schita.adauga(salar)
+        schita.percentila(50)   -> mediana aproximativa
+
+    Atribute:
+        k (int): Capacitatea nivelului cel mai de sus (derivata din eroare).
+        numar (int): Numarul de valori primite.
+        minim (float | None): Cea mai mica valoare primita (exact).
+        maxim (float | None): Cea mai mare valoare primita (exact).
+    """
+
+    # raportul dintre capacitatile a doua niveluri consecutive
+    _factor: float = 2 / 3
+
+    def __init__(self, eroare: float = 0.01, seed: int | None = None) -> None:
+        """
+        Args:
+            eroare (float): Eroarea de rang tinta (ex: 0.01 = percentila estimata
+                            este la cel mult ~1% din angajati fata de cea exacta).
+            seed (int | None): Samanta generatorului aleator (pentru rezultate reproductibile).
+        """
+        self.k: int = max(8, math.ceil(2.7 / eroare))
+        self.numar: int = 0
+        self.minim: float | None = None
+        self.maxim: float | None = None
+        self._niveluri: list[list[float]] = [[]]
+        self._pastrate: int = 0
+        self._limita: int = self._capacitate_totala()
+        self._aleator: random.Random = random.Random(seed)
+
+    def __len__(self) -> int:
+        """Numarul de valori pastrate efectiv in schita (memoria folosita)."""
+        return self._pastrate
+
+    def _capacitate(self, nivel: int) -> int:
+        inaltime: int = len(self._niveluri) - nivel - 1
+        return max(2, math.ceil(self.k * self._factor ** inaltime))
+
+    def _capacitate_totala(self) -> int:
+        return sum(self._capacitate(nivel) for nivel in range(len(self._niveluri)))
+
+    def _adauga_nivel(self) -> None:
+        self._niveluri.append([])
+        self._limita = self._capacitate_totala()
+
+    def adauga(self, valoare: float) -> None:
+        """Adauga o valoare in schita."""
+        valoare = float(valoare)
+        self.numar += 1
+        if self.minim is None or valoare < self.minim:
+            self.minim = valoare
+        if self.maxim is None or valoare > self.maxim:
+            self.maxim = valoare
+        self._niveluri[0].append(valoare)
+        self._pastrate += 1
+        if self._pastrate >= self._limita:
+            self._compacteaza()
+
+    def adauga_toate(self, valori: Iterable[float]) -> None:
+        """Adauga toate valorile unui flux in schita."""
+        for valoare in valori:
+            self.adauga(valoare)
+
+    def _compacteaza(self) -> None:
+        for nivel in range(len(self._niveluri)):
+            valori: list[float] = self._niveluri[nivel]
+            if len(valori) < self._capacitate(nivel):
+                continue
+            if nivel + 1 == len(self._niveluri):
+                self._adauga_nivel()
+            valori.sort()
+            # la un numar impar de valori, ultima ramane pe nivel
+            ramasa: list[float] = [valori.pop()] if len(valori) % 2 else []
+            self._niveluri[nivel + 1].extend(valori[self._aleator.randrange(2)::2])
+            self._niveluri[nivel] = ramasa
+            self._pastrate = sum(map(len, self._niveluri))
+            if self._pastrate < self._limita:
+                return
+
+    def combina(self, alta: "SchitaCuantile") -> None:
+        """
+        Adauga in aceasta schita toate valorile rezumate de alta schita.
+
+        Args:
+            alta (SchitaCuantile): Schita combinata (nu este modificata).
+        """
+        while len(self._niveluri) < len(alta._niveluri):
+            self._adauga_nivel()
+        for nivel, valori in enumerate(alta._niveluri):
+            self._niveluri[nivel].extend(valori)
+        self.numar += alta.numar
+        for extrem in (alta.minim, alta.maxim):
+            if extrem is not None:
+                self.minim = extrem if self.minim is None else min(self.minim, extrem)
+                self.maxim = extrem if self.maxim is None else max(self.maxim, extrem)
+        self._pastrate = sum(map(len, self._niveluri))
+        while self._pastrate >= self._limita:
+            self._compacteaza()
+
+    def percentila(self, procent: float) -> float | None:
+        """
+        Estimeaza o percentila a valorilor primite.
+
+        Args:
+            procent (float): Percentila dorita (0-100); 0 si 100 sunt minimul si
+                             maximul exacte.
+
+        Returns:
+            float | None: Valoarea estimata sau None daca schita este goala.
+        """
+        if not self.numar:
+            return None
+        if procent <= 0:
+            return self.minim
+        if procent >= 100:
+            return self.maxim
+        ponderate: list[tuple[float, int]] = sorted((valoare, 1 << nivel) for nivel, valori in enumerate(self._niveluri) for valoare in valori)
+        tinta: float = procent / 100 * sum(greutate for _, greutate in ponderate)
+        cumulat: int = 0
+        for valoare, greutate in ponderate:
+            cumulat += greutate
+            if cumulat >= tinta:
+                return valoare
+        return self.maxim
+
+
+def schite_pe_departamente(angajati: Iterable[Angajat], eroare: float = 0.01) -> dict[str, SchitaCuantile]:
+    """
+    Construieste cate o schita a salariilor brute pentru fiecare departament, intr-o singura trecere.
+
+    Exemple:
+        schite = schite_pe_departamente(incarcare_salvare.itereaza_angajati())
+        companie = combina_schite(schite.values())
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii (registru sau flux).
+        eroare (float): Eroarea de rang tinta a fiecarei schite.
+
+    Returns:
+        dict[str, SchitaCuantile]: Departament -> schita salariilor brute.
+    """
+    schite: dict[str, SchitaCuantile] = {}
+    for angajat in angajati:
+        schita: SchitaCuantile | None = schite.get(angajat.departament)
+        if schita is None:
+            schita = schite[angajat.departament] = SchitaCuantile(eroare)
+        schita.adauga(angajat.salar)
+    return schite
+
+
+def combina_schite(schite: Iterable[SchitaCuantile], eroare: float = 0.01) -> SchitaCuantile:
+    """
+    Combina mai multe schite intr-una noua (ex: departamentele -> compania).
+
+    Args:
+        schite (Iterable[SchitaCuantile]): Schitele combinate (nu sunt modificate).
+        eroare (float): Eroarea de rang tinta a schitei rezultate.
+
+    Returns:
+        SchitaCuantile: Schita tuturor valorilor.
+    """
+    rezultat: SchitaCuantile = SchitaCuantile(eroare)
+    for schita in schite:
+        rezultat.combina(schita)
+    return rezultat
+
+
+def percentile_aproximative(angajati: RegistruAngajati) -> None:
+    """
+    Afiseaza percentile aproximative ale salariului brut, pe departamente si pe companie.
+
+    Percentilele sunt estimate cu schite KLL (SchitaCuantile) construite
+    intr-o singura trecere peste angajati, cu memorie marginita indiferent de
+    numarul lor. Percentilele companiei sunt obtinute combinand schitele
+    departamentelor, fara o noua parcurgere a angajatilor.
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia afiseaza rezultatele direct in consola.
+
+    Note:
+        - Eroarea tinta este exprimata ca fractie din numarul de angajati (ex: 0.01 = 1%)
+        - Apasa 'enter' pentru valorile implicite (percentilele 25,50,75,90 si eroarea 0.01)
+    """
+    stil.titlu(" ---> Percentile aproximative ale salariilor")
+
+    if not intrari.exista_angajati(angajati):
+        return
+
+    percentile: list[float] = intrari.cere_percentile((25, 50, 75, 90))
+
+    while True:
+        text: str = input(f"Eroarea tinta (implicit {stil.GALBEN}0.01{stil.RESET}): ").strip() or "0.01"
+        try:
+            eroare: float = float(text)
+            if 0 < eroare < 1:
+                break
+        except ValueError:
+            pass
+        stil.eroare(f"Eroarea trebuie sa fie un numar intre 0 si 1, ai introdus -> {stil.evidentiaza(text)}")
+
+    schite: dict[str, SchitaCuantile] = schite_pe_departamente(angajati, eroare)
+    companie: SchitaCuantile = combina_schite(schite.values(), eroare)
+    for nume, schita in [*sorted(schite.items()), ("COMPANIE", companie)]:
+        valori: str = " | ".join(f"p{procent:g}: {schita.percentila(procent):.2f}" for procent in percentile)
+        stil.info(f"{nume:<14} ({schita.numar} angajati, {len(schita)} valori pastrate) {valori}")
@@ -0,0 +1,255 @@
+"""
+Modulul simulare raspunde la intrebari de tipul "cat costa o marire de 7%
+pentru toti seniorii din IT?" sau "ce se intampla daca salariul minim
+creste la 4500 RON?", fara a modifica datele.
+
+Simularea lucreaza pe coloanele tabelului columnar al registrului
+(TabelAngajati): coloana de salarii simulate este la inceput chiar coloana
+reala si este copiata abia la prima regula care schimba ceva (copy-on-write).
+Fiecare regula este aplicata printr-o singura trecere peste coloane, iar
+costul inainte/dupa este calculat pe loturi cu salarizare.calculeaza_lot.
+Nimic nu este scris in registru sau in fisierele de stocare.
+"""
+
+from array import array
+from itertools import compress
+import stil
+import intrari
+import validari
+import salarizare
+from tabel_angajati import TabelAngajati
+from registru import RegistruAngajati
+
+
+class RegulaSimulare:
+    """
+    O ajustare procentuala a salariilor pentru angajatii care respecta toate filtrele date.
+
+    Exemple:
+        RegulaSimulare(7, departament="IT", senioritate="senior")
+        RegulaSimulare(5, salar_minim=4050, salar_maxim=6000)
+
+    Atribute:
+        procent (float): Ajustarea, in procente (negativ pentru scadere).
+        departament (str | None): Doar angajatii acestui departament (None = toti).
+        senioritate (str | None): Doar angajatii cu aceasta senioritate (None = toti).
+        salar_minim (float | None): Doar salariile (curente in simulare) >= aceasta valoare.
+        salar_maxim (float | None): Doar salariile (curente in simulare) <= aceasta valoare.
+    """
+
+    __slots__ = ("procent", "departament", "senioritate", "salar_minim", "salar_maxim")
+
+    def __init__(self, procent: float, departament: str | None = None, senioritate: str | None = None, salar_minim: float | None = None, salar_maxim: float | None = None) -> None:
+        self.procent: float = procent
+        self.departament: str | None = departament
+        self.senioritate: str | None = senioritate
+        self.salar_minim: float | None = salar_minim
+        self.salar_maxim: float | None = salar_maxim
+
+    def __repr__(self) -> str:
+        filtre: list[str] = [f"{camp}={getattr(self, camp)!r}" for camp in self.__slots__[1:] if getattr(self, camp) is not None]
+        return f"RegulaSimulare({self.procent:+g}%{', ' if filtre else ''}{', '.join(filtre)})"
+
+
+class VedereSimulare:
+    """
+    Vedere copy-on-write peste salariile unui tabel columnar.
+
+    Coloana 'salarii' este coloana reala a tabelului pana la prima modificare,
+    cand este copiata; tabelul original nu este modificat niciodata.
+
+    Atribute:
+        tabel (TabelAngajati): Tabelul de baza (doar citit).
+        salarii (array): Salariile simulate ('d'), cate unul pe rand al tabelului.
+    """
+
+    def __init__(self, tabel: TabelAngajati) -> None:
+        self.tabel: TabelAngajati = tabel
+        self.salarii: array = tabel.salarii
+        self._copiat: bool = False
+
+    def _scrie(self, salarii_noi: list[float]) -> None:
+        if not self._copiat:
+            self.salarii = array("d", salarii_noi)
+            self._copiat = True
+        else:
+            self.salarii[:] = array("d", salarii_noi)
+
+    def _masca(self, coduri: array, categorii: list[str], valoare: str | None) -> list[bool] | None:
+        if valoare is None:
+            return None
+        cod: int = categorii.index(valoare) if valoare in categorii else -1
+        return [cod_rand == cod for cod_rand in coduri]
+
+    def aplica(self, regula: RegulaSimulare) -> int:
+        """
+        Aplica o regula de ajustare peste salariile simulate.
+
+        Args:
+            regula (RegulaSimulare): Regula aplicata.
+
+        Returns:
+            int: Numarul de angajati carora li s-a aplicat regula.
+        """
+        masca: list[bool] = [True] * len(self.salarii)
+        for filtru in (self._masca(self.tabel.coduri_departament, self.tabel.departamente, regula.departament),
+                       self._masca(self.tabel.coduri_senioritate, self.tabel.senioritati, regula.senioritate)):
+            if filtru is not None:
+                masca = [a and b for a, b in zip(masca, filtru)]
+        if regula.salar_minim is not None:
+            masca = [a and salar >= regula.salar_minim for a, salar in zip(masca, self.salarii)]
+        if regula.salar_maxim is not None:
+            masca = [a and salar <= regula.salar_maxim for a, salar in zip(masca, self.salarii)]
+
+        afectati: int = sum(masca)
+        if afectati and regula.procent:
+            factor: float = 1 + regula.procent / 100
+            self._scrie([round(salar * factor, 2) if potrivit else salar for salar, potrivit in zip(self.salarii, masca)])
+        return afectati
+
+    def aplica_salariu_minim(self, salariu_minim: float) -> int:
+        """
+        Ridica la 'salariu_minim' toate salariile simulate mai mici.
+
+        Args:
+            salariu_minim (float): Noul salariu minim.
+
+        Returns:
+            int: Numarul de angajati ridicati la minim.
+        """
+        afectati: int = sum(1 for salar in self.salarii if salar < salariu_minim)
+        if afectati:
+            self._scrie([salar if salar >= salariu_minim else float(salariu_minim) for salar in self.salarii])
+        return afectati
+
+
+class RezultatSimulare:
+    """
+    Costul inainte si dupa simulare, pe companie si pe departamente.
+
+    Atribute:
+        inainte (dict[str, float]): Totalurile lotului real ("brut", "cas", "cass", "impozit", "net").
+        dupa (dict[str, float]): Totalurile lotului simulat.
+        modificati (int): Numarul de angajati al caror salariu s-a schimbat.
+        pe_departamente (dict[str, tuple[float, float]]): Departament -> (diferenta brut, diferenta net).
+    """
+
+    __slots__ = ("inainte", "dupa", "modificati", "pe_departamente")
+
+    def __init__(self, inainte: dict[str, float], dupa: dict[str, float], modificati: int, pe_departamente: dict[str, tuple[float, float]]) -> None:
+        self.inainte: dict[str, float] = inainte
+        self.dupa: dict[str, float] = dupa
+        self.modificati: int = modificati
+        self.pe_departamente: dict[str, tuple[float, float]] = pe_departamente
+
+    def diferenta(self, componenta: str) -> float:
+        """Returneaza diferenta dupa - inainte pentru o componenta ("brut", "net", ...)."""
+        return self.dupa[componenta] - self.inainte[componenta]
+
+
+def simuleaza(tabel: TabelAngajati, reguli: list[RegulaSimulare], salariu_minim: float | None = None) -> RezultatSimulare:
+    """
+    Aplica regulile de simulare pe o vedere copy-on-write si calculeaza costul inainte/dupa.
+
+    Regulile sunt aplicate in ordine (o regula vede salariile deja ajustate
+    de regulile anterioare), iar salariul minim simulat este aplicat la final.
+
+    Exemple:
+        rezultat = simuleaza(registru.tabel, [RegulaSimulare(7, "IT", "senior")])
+        rezultat.diferenta("brut")
+
+    Args:
+        tabel (TabelAngajati): Tabelul columnar al registrului (nu este modificat).
+        reguli (list[RegulaSimulare]): Ajustarile simulate.
+        salariu_minim (float | None): Salariul minim simulat (None = fara schimbare).
+
+    Returns:
+        RezultatSimulare: Totalurile inainte/dupa si diferentele pe departamente.
+    """
+    vedere: VedereSimulare = VedereSimulare(tabel)
+    for regula in reguli:
+        vedere.aplica(regula)
+    if salariu_minim is not None:
+        vedere.aplica_salariu_minim(salariu_minim)
+
+    inainte: salarizare.LotFluturasi = salarizare.calculeaza_lot(tabel.salarii)
+    dupa: salarizare.LotFluturasi = salarizare.calculeaza_lot(vedere.salarii) if vedere.salarii is not tabel.salarii else inainte
+    schimbati: list[bool] = [vechi != nou for vechi, nou in zip(tabel.salarii, vedere.salarii)]
+
+    # o singura trecere peste randurile schimbate, grupate dupa codul departamentului
+    diferente: dict[int, list[float]] = {}
+    for cod, brut_vechi, brut_nou, net_vechi, net_nou in compress(zip(tabel.coduri_departament, inainte.brut, dupa.brut, inainte.net, dupa.net), schimbati):
+        suma: list[float] = diferente.setdefault(cod, [0.0, 0.0])
+        suma[0] += brut_nou - brut_vechi
+        suma[1] += net_nou - net_vechi
+    pe_departamente: dict[str, tuple[float, float]] = {tabel.departamente[cod]: (round(brut, 2), round(net, 2)) for cod, (brut, net) in diferente.items()}
+
+    return RezultatSimulare(inainte.totaluri(), dupa.totaluri(), sum(schimbati), pe_departamente)
+
+
+def simulare_salarii(angajati: RegistruAngajati) -> None:
+    """
+    Simuleaza ajustari salariale si afiseaza costul inainte/dupa, fara a modifica datele.
+
+    Utilizatorul adauga una sau mai multe reguli (procent de ajustare, filtrate
+    dupa departament, senioritate si interval de salariu) si, optional, un
+    salariu minim nou. Simularea este facuta de simuleaza pe o copie
+    (copy-on-write) a coloanei de salarii; registrul si fisierele de stocare
+    raman neschimbate.
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia afiseaza rezultatele direct in consola.
+
+    Note:
+        - Apasa 'enter' la un filtru pentru a nu filtra dupa el
+        - Regulile sunt aplicate in ordinea introducerii
+        - Intervalul de salariu poate avea un capat deschis (ex: 4000- sau -8000)
+        - Utilizatorul poate introduce '0' la procent pentru a reveni la meniu
+    """
+    stil.titlu(" ---> Simulare salarii (fara modificarea datelor)")
+
+    if not intrari.exista_angajati(angajati):
+        return
+
+    reguli: list[RegulaSimulare] = []
+    while True:
+        text: str = input(f"Ajustare in procente (ex: {stil.GALBEN}7{stil.RESET} sau {stil.GALBEN}-3{stil.RESET}), 'enter' pentru a termina regulile sau {stil.GALBEN}'0'{stil.RESET} pentru meniu: ").strip()
+        if text == "0":
+            return
+        if not text:
+            break
+        try:
+            procent: float = float(text)
+        except ValueError:
+            stil.eroare(f"Procentul trebuie sa fie un numar, ai introdus -> {stil.evidentiaza(text)}")
+            continue
+
+        departament: str = intrari.cere_optiune("Departament", angajati.departamente(), "Nu exista nici un departament cu numele", implicit="", majuscule=True)
+        senioritate: str = intrari.cere_optiune("Senioritate", validari.aceptare_nivel, "Senioritate necunoscuta", implicit="")
+        salar_minim, salar_maxim = intrari.cere_interval("Interval de salariu (RON)")
+
+        regula: RegulaSimulare = RegulaSimulare(procent, departament or None, senioritate or None, salar_minim, salar_maxim)
+        reguli.append(regula)
+        stil.succes(f"Regula adaugata: {regula}")
+
+    while True:
+        text = input(f"Salariu minim simulat (actual {stil.GALBEN}{validari.salariu_minim()}{stil.RESET} RON) sau 'enter' pentru a-l pastra: ").strip()
+        if not text or text.isdigit():
+            break
+        stil.eroare(f"Salariul minim trebuie sa fie un numar intreg, ai introdus -> {stil.evidentiaza(text)}")
+    salariu_minim: int | None = int(text) if text else None
+
+    if not reguli and salariu_minim is None:
+        stil.info("Nu a fost introdusa nici o regula de simulare")
+        return
+
+    rezultat: RezultatSimulare = simuleaza(angajati.tabel, reguli, salariu_minim)
+    stil.titlu(" ---> Rezultatul simularii")
+    stil.info(f"Angajati cu salariul modificat: {rezultat.modificati} din {len(angajati)}")
+    for componenta, eticheta in (("brut", "Cost total salarii (brut)"), ("net", "Total salarii nete")):
+        stil.info(f"{eticheta}: {rezultat.inainte[componenta]:.2f} RON -> {rezultat.dupa[componenta]:.2f} RON ({rezultat.diferenta(componenta):+.2f} RON)")
+    for departament, (brut, net) in sorted(rezultat.pe_departamente.items()):
+        stil.info(f" {departament}: brut {brut:+.2f} RON | net {net:+.2f} RON")
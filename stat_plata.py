@@ -0,0 +1,208 @@
+"""
+Modulul stat_plata calculeaza statul de plata pe o perioada de mai multe luni.
+
+Pentru fiecare angajat si fiecare luna din perioada se scrie un rand in
+registrul lunar (luna, CNP, nume, departament, brut, CAS, CASS, impozit, net),
+in format CSV sau JSONL. Randurile sunt scrise in flux, pe masura ce sunt
+calculate, deci memoria folosita nu creste cu numarul de luni-persoana.
+
+Calculul foloseste motorul de salarizare (salarizare.calculeaza_lot), acelasi
+ca fluturasul din calcul_fluturas_salariu, cu regulile in vigoare in fiecare
+luna. Angajatii sunt impartiti in bucati calculate in paralel de mai multe
+procese; cel mult cateva bucati sunt in lucru in acelasi timp, deci
+rezultatele nu se aduna in memorie daca scrierea este mai lenta.
+"""
+
+import io
+import os
+import csv
+import json
+import time
+import multiprocessing
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator
+import stil
+import intrari
+import salarizare
+from angajat import Angajat
+from registru import RegistruAngajati
+
+coloane: list[str] = ["luna", "cnp", "nume", "prenume", "departament", "brut", "cas", "cass", "impozit", "net", "versiune_reguli"]
+formate: tuple[str, ...] = ("csv", "jsonl")
+marime_bucata: int = 2048
+
+
+def luni_perioada(inceput: str, numar_luni: int) -> list[str]:
+    """
+    Returneaza lunile unei perioade, in formatul "AAAA-LL".
+
+    Exemple:
+        luni_perioada("2024-11", 3) -> ["2024-11", "2024-12", "2025-01"]
+
+    Args:
+        inceput (str): Prima luna ("AAAA-LL").
+        numar_luni (int): Numarul de luni.
+
+    Returns:
+        list[str]: Lunile, in ordine.
+
+    Raises:
+        ValueError: Daca luna de inceput nu are formatul "AAAA-LL".
+    """
+    an, luna = (int(parte) for parte in inceput.split("-"))
+    if not 1 <= luna <= 12:
+        raise ValueError(f"luna invalida: {inceput}")
+    index: int = an * 12 + luna - 1
+    return [f"{pozitie // 12:04d}-{pozitie % 12 + 1:02d}" for pozitie in range(index, index + numar_luni)]
+
+
+def _calculeaza_bucata(argumente: tuple[list[tuple], list[str], str]) -> tuple[str, int]:
+    """
+    Calculeaza randurile registrului pentru o bucata de angajati (ruleaza in procesele de lucru).
+
+    Args:
+        argumente (tuple): (angajati ca tupluri (cnp, nume, prenume, departament,
+                           salar), lunile perioadei, formatul de iesire).
+
+    Returns:
+        tuple[str, int]: Textul randurilor si numarul lor.
+    """
+    angajati, luni, format_iesire = argumente
+    salarii: list[float] = [angajat[4] for angajat in angajati]
+    tampon: io.StringIO = io.StringIO()
+    scriitor = csv.writer(tampon, lineterminator="\n") if format_iesire == "csv" else None
+    for luna in luni:
+        lot: salarizare.LotFluturasi = salarizare.calculeaza_lot(salarii, salarizare.regula_pentru_luna(luna))
+        versiune: str = lot.regula.versiune
+        for (cnp, nume, prenume, departament, _), brut, cas, cass, impozit, net in zip(angajati, lot.brut, lot.cas, lot.cass, lot.impozit, lot.net):
+            rand: list = [luna, cnp, nume, prenume, departament, brut, cas, cass, impozit, net, versiune]
+            if scriitor is not None:
+                scriitor.writerow(rand)
+            else:
+                tampon.write(json.dumps(dict(zip(coloane, rand)), ensure_ascii=False))
+                tampon.write("\n")
+    return tampon.getvalue(), len(angajati) * len(luni)
+
+
+def _bucati(angajati: Iterable[Angajat], luni: list[str], format_iesire: str) -> Iterator[tuple[list[tuple], list[str], str]]:
+    iterator: Iterator[Angajat] = iter(angajati)
+    while True:
+        bucata: list[tuple] = [(angajat.cnp, angajat.nume, angajat.prenume, angajat.departament, float(angajat.salar)) for angajat in islice(iterator, marime_bucata)]
+        if not bucata:
+            return
+        yield bucata, luni, format_iesire
+
+
+def ruleaza_stat_plata(angajati: Iterable[Angajat], inceput: str, numar_luni: int, cale: str, format_iesire: str = "csv", procese: int | None = None) -> dict[str, float]:
+    """
+    Calculeaza statul de plata pe o perioada si il scrie in flux intr-un fisier CSV sau JSONL.
+
+    Fisierul este scris intai cu extensia .tmp si redenumit la final, deci un
+    calcul intrerupt nu lasa un registru incomplet.
+
+    Exemple:
+        ruleaza_stat_plata(registru, "2025-01", 12, "stat_plata_2025.csv")
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii (registrul sau un flux).
+        inceput (str): Prima luna a perioadei ("AAAA-LL").
+        numar_luni (int): Numarul de luni.
+        cale (str): Fisierul de iesire.
+        format_iesire (str): "csv" sau "jsonl".
+        procese (int | None): Numarul de procese de lucru (implicit numarul de
+                              nuclee); 1 calculeaza totul in procesul curent.
+
+    Returns:
+        dict[str, float]: "inregistrari" (luni-persoana scrise), "secunde" si
+                          "pe_secunda" (debitul calculului).
+
+    Raises:
+        ValueError: Daca formatul sau luna de inceput nu sunt valide.
+    """
+    if format_iesire not in formate:
+        raise ValueError(f"format necunoscut: {format_iesire}")
+    luni: list[str] = luni_perioada(inceput, numar_luni)
+    procese = procese or os.cpu_count() or 1
+    inceput_calcul: float = time.perf_counter()
+    inregistrari: int = 0
+    cale_temporara: str = cale + ".tmp"
+
+    with open(cale_temporara, "w", encoding="utf-8", newline="") as fisier:
+        if format_iesire == "csv":
+            csv.writer(fisier, lineterminator="\n").writerow(coloane)
+
+        if procese == 1:
+            for argumente in _bucati(angajati, luni, format_iesire):
+                text, numar = _calculeaza_bucata(argumente)
+                fisier.write(text)
+                inregistrari += numar
+        else:
+            with multiprocessing.Pool(procese) as grup:
+                # fereastra de bucati in lucru: se trimite o bucata noua doar dupa
+                # ce a fost scrisa cea mai veche, iar ordinea angajatilor se pastreaza
+                in_lucru: deque = deque()
+                for argumente in _bucati(angajati, luni, format_iesire):
+                    in_lucru.append(grup.apply_async(_calculeaza_bucata, (argumente,)))
+                    if len(in_lucru) >= 2 * procese:
+                        text, numar = in_lucru.popleft().get()
+                        fisier.write(text)
+                        inregistrari += numar
+                while in_lucru:
+                    text, numar = in_lucru.popleft().get()
+                    fisier.write(text)
+                    inregistrari += numar
+
+    os.replace(cale_temporara, cale)
+    secunde: float = time.perf_counter() - inceput_calcul
+    return {"inregistrari": inregistrari, "secunde": secunde, "pe_secunda": inregistrari / secunde if secunde else 0.0}
+
+
+def calcul_stat_plata(angajati: RegistruAngajati) -> None:
+    """
+    Calculeaza statul de plata pe mai multe luni pentru toti angajatii si il scrie intr-un fisier.
+
+    Utilizatorul alege prima luna, numarul de luni si formatul (CSV sau JSONL).
+    Registrul lunar (brut, CAS, CASS, impozit, net pentru fiecare angajat si
+    fiecare luna) este calculat in paralel si scris in flux de modulul
+    stat_plata, apoi se afiseaza debitul calculului.
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia scrie fisierul si afiseaza rezultatul in consola.
+
+    Note:
+        - Apasa 'enter' pentru valorile implicite (luna curenta, 12 luni, csv)
+        - Utilizatorul poate introduce '0' pentru a reveni la meniu
+        - Fisierul se numeste stat_plata_{luna}_{numar}luni.{format}
+    """
+    stil.titlu(" ---> Stat de plata pe mai multe luni")
+
+    if not intrari.exista_angajati(angajati):
+        return
+
+    while True:
+        inceput: str = input(f"Prima luna {stil.GALBEN}(AAAA-LL){stil.RESET}, 'enter' pentru luna curenta sau {stil.GALBEN}'0'{stil.RESET} pentru meniu: ").strip() or time.strftime("%Y-%m")
+        if inceput == "0":
+            return
+        try:
+            luni_perioada(inceput, 1)
+            break
+        except ValueError:
+            stil.eroare(f"Luna trebuie sa fie de forma AAAA-LL, ai introdus -> {stil.evidentiaza(inceput)}")
+
+    while True:
+        text: str = input(f"Numarul de luni (implicit {stil.GALBEN}12{stil.RESET}): ").strip() or "12"
+        if text.isdigit() and 1 <= int(text) <= 120:
+            numar_luni: int = int(text)
+            break
+        stil.eroare(f"Numarul de luni trebuie sa fie intre 1 si 120, ai introdus -> {stil.evidentiaza(text)}")
+
+    format_iesire: str = intrari.cere_optiune("Format", formate, "Format necunoscut", implicit="csv")
+
+    cale: str = f"stat_plata_{inceput}_{numar_luni}luni.{format_iesire}"
+    rezultat: dict[str, float] = ruleaza_stat_plata(angajati, inceput, numar_luni, cale, format_iesire)
+    stil.succes(f"Statul de plata a fost scris in {stil.evidentiaza(cale)}")
+    stil.info(f"Inregistrari (luni-persoana): {rezultat['inregistrari']} in {rezultat['secunde']:.2f} s ({rezultat['pe_secunda']:.0f} / s)")
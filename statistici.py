@@ -0,0 +1,218 @@
+"""
+Modulul statistici calculeaza statistici salariale grupate (group-by) dupa
+oricare combinatie de departament, senioritate si banda de varsta.
+
+Toate grupurile sunt construite intr-o singura trecere peste angajati (lista,
+registru sau flux): fiecare angajat este adaugat in grupul lui, cu salariul
+brut si salariul net calculat de motorul de salarizare. Pentru fiecare grup
+se calculeaza apoi numarul, suma, media, mediana, minimul, maximul si
+percentilele cerute, pentru brut si pentru net.
+"""
+
+import json
+import math
+from array import array
+from typing import Iterable, Sequence
+import stil
+import intrari
+import salarizare
+import decodare_cnp
+from datetime import date
+from angajat import Angajat
+from registru import RegistruAngajati
+
+criterii: tuple[str, ...] = ("departament", "senioritate", "varsta")
+percentile_implicite: tuple[float, ...] = (25, 75, 90)
+
+
+def banda_varsta(varsta: int, latime: int = 10) -> str:
+    """
+    Returneaza banda de varsta a unui angajat.
+
+    Exemple:
+        banda_varsta(34)     -> "30-39"
+        banda_varsta(34, 5)  -> "30-34"
+
+    Args:
+        varsta (int): Varsta.
+        latime (int): Latimea benzii, in ani.
+
+    Returns:
+        str: Banda, de forma "minim-maxim".
+    """
+    inceput: int = int(varsta) // latime * latime
+    return f"{inceput}-{inceput + latime - 1}"
+
+
+def percentila(sortate: Sequence[float], procent: float) -> float:
+    """
+    Calculeaza o percentila prin interpolare liniara intre valorile vecine.
+
+    Exemple:
+        percentila([1, 2, 3, 4], 50) -> 2.5
+
+    Args:
+        sortate (Sequence[float]): Valorile, sortate crescator (cel putin una).
+        procent (float): Percentila dorita (0-100).
+
+    Returns:
+        float: Valoarea percentilei.
+    """
+    pozitie: float = (len(sortate) - 1) * procent / 100
+    jos: int = math.floor(pozitie)
+    sus: int = min(jos + 1, len(sortate) - 1)
+    return sortate[jos] + (sortate[sus] - sortate[jos]) * (pozitie - jos)
+
+
+def descrie(valori: Iterable[float], percentile: Sequence[float] = percentile_implicite) -> dict[str, float]:
+    """
+    Returneaza statisticile descriptive ale unei serii de valori.
+
+    Args:
+        valori (Iterable[float]): Valorile (cel putin una).
+        percentile (Sequence[float]): Percentilele cerute (0-100).
+
+    Returns:
+        dict[str, float]: "numar", "suma", "medie", "mediana", "minim", "maxim"
+                          si cate o cheie "p{procent}" pentru fiecare percentila.
+    """
+    sortate: list[float] = sorted(valori)
+    suma: float = math.fsum(sortate)
+    rezultat: dict[str, float] = {
+        "numar": len(sortate),
+        "suma": round(suma, 2),
+        "medie": round(suma / len(sortate), 2),
+        "mediana": round(percentila(sortate, 50), 2),
+        "minim": sortate[0],
+        "maxim": sortate[-1],
+    }
+    for procent in percentile:
+        rezultat[f"p{procent:g}"] = round(percentila(sortate, procent), 2)
+    return rezultat
+
+
+def grupeaza(angajati: Iterable[Angajat], dupa: Sequence[str], percentile: Sequence[float] = percentile_implicite, latime_banda: int = 10) -> dict[tuple[str, ...], dict[str, dict[str, float]]]:
+    """
+    Calculeaza statisticile salariale pentru fiecare grup, intr-o singura trecere peste angajati.
+
+    Exemple:
+        grupeaza(registru, ["departament", "senioritate"])
+        -> {("IT", "senior"): {"brut": {"numar": 3, "medie": ..., ...}, "net": {...}}, ...}
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii (lista, registru sau flux).
+        dupa (Sequence[str]): Criteriile de grupare, din 'criterii' ("varsta"
+                              inseamna banda de varsta, cu varsta calculata azi
+                              din CNP); lista goala = un singur grup cu toata compania.
+        percentile (Sequence[float]): Percentilele cerute (0-100).
+        latime_banda (int): Latimea benzilor de varsta, in ani.
+
+    Returns:
+        dict: Cheia grupului (tuplu cu valorile criteriilor) -> {"brut": statistici,
+              "net": statistici}, ordonat dupa cheie.
+
+    Raises:
+        ValueError: Daca un criteriu nu este in 'criterii'.
+    """
+    for criteriu in dupa:
+        if criteriu not in criterii:
+            raise ValueError(f"criteriu de grupare necunoscut: {criteriu}")
+
+    azi: date = date.today()
+
+    def cheie(angajat: Angajat) -> tuple[str, ...]:
+        return tuple(banda_varsta(decodare_cnp.varsta_angajat(angajat, azi), latime_banda) if criteriu == "varsta" else getattr(angajat, criteriu) for criteriu in dupa)
+
+    grupuri: dict[tuple[str, ...], tuple[array, array]] = {}
+    for angajat in angajati:
+        grup: tuple[str, ...] = cheie(angajat)
+        coloane: tuple[array, array] | None = grupuri.get(grup)
+        if coloane is None:
+            coloane = grupuri[grup] = (array("d"), array("d"))
+        fluturas: salarizare.Fluturas = salarizare.calculeaza_fluturas(angajat.salar)
+        coloane[0].append(fluturas.brut)
+        coloane[1].append(fluturas.net)
+
+    return {grup: {"brut": descrie(brut, percentile), "net": descrie(net, percentile)} for grup, (brut, net) in sorted(grupuri.items())}
+
+
+def in_json(rezultat: dict[tuple[str, ...], dict[str, dict[str, float]]], dupa: Sequence[str]) -> list[dict]:
+    """
+    Transforma rezultatul lui grupeaza intr-o lista de dictionare serializabile JSON.
+
+    Args:
+        rezultat (dict): Rezultatul functiei grupeaza.
+        dupa (Sequence[str]): Criteriile folosite la grupare.
+
+    Returns:
+        list[dict]: Cate un dictionar pe grup: criteriile, "brut" si "net".
+    """
+    return [{**dict(zip(dupa, grup)), **statistici} for grup, statistici in rezultat.items()]
+
+
+def salveaza_json(rezultat: dict[tuple[str, ...], dict[str, dict[str, float]]], dupa: Sequence[str], cale: str) -> None:
+    """
+    Scrie statisticile grupate intr-un fisier JSON.
+
+    Args:
+        rezultat (dict): Rezultatul functiei grupeaza.
+        dupa (Sequence[str]): Criteriile folosite la grupare.
+        cale (str): Fisierul de iesire.
+    """
+    with open(cale, "w", encoding="utf-8") as fisier:
+        json.dump(in_json(rezultat, dupa), fisier, indent=4, ensure_ascii=False)
+
+
+def statistici_grupate(angajati: RegistruAngajati) -> None:
+    """
+    Afiseaza statistici salariale grupate dupa departament, senioritate si/sau banda de varsta.
+
+    Pentru fiecare grup se afiseaza numarul de angajati, media, mediana,
+    minimul, maximul si percentilele salariului brut, plus media si mediana
+    salariului net. Toate grupurile sunt calculate intr-o singura trecere
+    (grupeaza), deci un singur raport inlocuieste rularea optiunii 7
+    pentru fiecare departament. Rezultatul poate fi salvat si in format JSON.
+
+    Args:
+        angajati (RegistruAngajati): Registrul de angajati.
+
+    Returns:
+        None: Functia afiseaza tabelul si optional scrie fisierul JSON.
+
+    Note:
+        - Criteriile se scriu separate prin virgula (ex: departament,varsta)
+        - Apasa 'enter' pentru valorile implicite (departament,senioritate si percentilele 25,75,90)
+        - Fisierul JSON se numeste statistici_{criterii}.json
+    """
+    stil.titlu(" ---> Statistici salariale grupate")
+
+    if not intrari.exista_angajati(angajati):
+        return
+
+    while True:
+        text: str = input(f"Grupare dupa {stil.GALBEN}{criterii}{stil.RESET} separate prin virgula (implicit departament,senioritate): ").strip().lower() or "departament,senioritate"
+        dupa: list[str] = [criteriu.strip() for criteriu in text.split(",") if criteriu.strip()]
+        necunoscute: list[str] = [criteriu for criteriu in dupa if criteriu not in criterii]
+        if not necunoscute:
+            break
+        stil.eroare(f"Criterii necunoscute -> {stil.evidentiaza(', '.join(necunoscute))}")
+
+    percentile: list[float] = intrari.cere_percentile(percentile_implicite)
+
+    rezultat: dict = grupeaza(angajati, dupa, percentile)
+    coloane_percentile: list[str] = [f"p{procent:g}" for procent in percentile]
+    stil.info(" | ".join([f"{'/'.join(dupa) or 'COMPANIE':<24}", f"{'numar':>6}", f"{'medie':>10}", f"{'mediana':>10}", f"{'minim':>10}", f"{'maxim':>10}", *(f"{coloana:>10}" for coloana in coloane_percentile), f"{'net medie':>10}", f"{'net median':>10}"]))
+    for grup, valori in rezultat.items():
+        brut: dict = valori["brut"]
+        stil.info(" | ".join([f"{'/'.join(grup) or 'COMPANIE':<24}", f"{brut['numar']:>6}", *(f"{brut[camp]:>10.2f}" for camp in ("medie", "mediana", "minim", "maxim", *coloane_percentile)), f"{valori['net']['medie']:>10.2f}", f"{valori['net']['mediana']:>10.2f}"]))
+
+    while True:
+        raspuns: str = input(f"\nDoriti sa salvati statisticile in format JSON {stil.GALBEN}(da/nu){stil.RESET}: ").strip().lower()
+        if raspuns == "da":
+            cale: str = f"statistici_{'_'.join(dupa) or 'companie'}.json"
+            salveaza_json(rezultat, dupa, cale)
+            stil.succes(f"Statisticile au fost salvate in {stil.evidentiaza(cale)}")
+            return
+        if raspuns == "nu":
+            return
+        stil.atentionare("Te rugam sa introduci doar (da/nu)")
@@ -0,0 +1,425 @@
+"""
+Modulul stocare_sqlite implementeaza motorul de stocare SQLite pentru angajati.
+
+Este folosit de incarcare_salvare cand 'mod_stocare' este "sqlite". Angajatii
+sunt pastrati intr-o baza de date locala (angajati.db) cu coloane indexate
+pentru cnp, departament, senioritate, salar si varsta; fiecare modificare
+actualizeaza un singur rand, in locul rescrierii intregului fisier.
+
+Aplicatia foloseste in acest mod RegistruSqlite: tabela nu este incarcata in
+memorie, iar cautarile dupa CNP, listarile pe departament/senioritate,
+intervalele de salariu/varsta si totalurile sunt interogari indexate.
+
+Modulul poate fi rulat direct pentru migrarea o singura data din instantaneul
+scris ultimul (angajati.json sau angajati.bin, cu jurnalul lui reaplicat):
+    python stocare_sqlite.py
+"""
+
+import os
+import sqlite3
+import stil
+import decodare_cnp
+from angajat import Angajat
+from agregate import AgregatSalarii
+from index_nume import IndexNume
+from registru import RegistruAngajati
+from tabel_angajati import TabelAngajati
+from typing import Iterable, Iterator
+
+nume_baza_date = "angajati.db"
+
+_conexiune: sqlite3.Connection | None = None
+
+_coloane: tuple[str, ...] = ("cnp", "nume", "prenume", "varsta", "salar", "departament", "senioritate")
+
+_schema: str = """
+CREATE TABLE IF NOT EXISTS angajati (
+    pozitie     INTEGER PRIMARY KEY AUTOINCREMENT,
+    cnp         TEXT NOT NULL UNIQUE,
+    nume        TEXT NOT NULL,
+    prenume     TEXT NOT NULL,
+    varsta      INTEGER NOT NULL,
+    salar       REAL NOT NULL,
+    departament TEXT NOT NULL,
+    senioritate TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_angajati_departament ON angajati (departament);
+CREATE INDEX IF NOT EXISTS idx_angajati_senioritate ON angajati (senioritate);
+CREATE INDEX IF NOT EXISTS idx_angajati_salar ON angajati (salar);
+CREATE INDEX IF NOT EXISTS idx_angajati_varsta ON angajati (varsta);
+"""
+
+
+def conexiune() -> sqlite3.Connection:
+    """
+    Returneaza conexiunea la baza de date, creand-o (si schema) la primul apel.
+
+    Coloana 'pozitie' pastreaza ordinea de adaugare, pentru ca lista incarcata
+    sa aiba aceeasi ordine ca in fisierul JSON. Indexul pe cnp este dat de
+    constrangerea UNIQUE.
+
+    Returns:
+        sqlite3.Connection: Conexiunea partajata a modulului.
+    """
+    global _conexiune
+    if _conexiune is None:
+        _conexiune = sqlite3.connect(nume_baza_date)
+        _conexiune.row_factory = sqlite3.Row
+        _conexiune.executescript(_schema)
+    return _conexiune
+
+
+def _rand_in_angajat(rand: sqlite3.Row) -> Angajat:
+    """Converteste un rand din baza de date intr-un obiect Angajat."""
+    return Angajat(*rand)
+
+
+def incarca_angajati() -> list[Angajat]:
+    """
+    Citeste toti angajatii din baza de date, in ordinea adaugarii.
+
+    Returns:
+        list[Angajat]: Lista de angajati.
+    """
+    randuri = conexiune().execute(f"SELECT {', '.join(_coloane)} FROM angajati ORDER BY pozitie")
+    return [_rand_in_angajat(rand) for rand in randuri]
+
+
+def salveaza_angajati(angajati: Iterable[Angajat]) -> None:
+    """
+    Inlocuieste continutul tabelei cu lista data, intr-o singura tranzactie.
+
+    Args:
+        angajati (Iterable[Angajat]): Lista completa de angajati.
+    """
+    with conexiune() as baza:
+        baza.execute("DELETE FROM angajati")
+        baza.executemany(
+            f"INSERT INTO angajati ({', '.join(_coloane)}) VALUES ({', '.join('?' * len(_coloane))})",
+            ([getattr(persoana, coloana) for coloana in _coloane] for persoana in angajati),
+        )
+
+
+def adauga_angajati(angajati: Iterable[Angajat]) -> None:
+    """
+    Adauga mai multi angajati noi, intr-o singura tranzactie.
+
+    Daca un rand nu poate fi inserat (ex: CNP duplicat), tranzactia este
+    anulata si niciun angajat nu este adaugat.
+
+    Args:
+        angajati (Iterable[Angajat]): Angajatii noi.
+    """
+    with conexiune() as baza:
+        baza.executemany(
+            f"INSERT INTO angajati ({', '.join(_coloane)}) VALUES ({', '.join('?' * len(_coloane))})",
+            ([getattr(persoana, coloana) for coloana in _coloane] for persoana in angajati),
+        )
+
+
+def aplica_modificare(operatie: str, angajat: Angajat, cnp_vechi: str | None = None) -> None:
+    """
+    Aplica o singura modificare (adaugare, modificare, stergere) pe un rand.
+
+    Args:
+        operatie (str): Una din "adaugare", "modificare", "stergere".
+        angajat (Angajat): Angajatul afectat (starea noua).
+        cnp_vechi (str | None): CNP-ul inainte de modificare.
+    """
+    cnp: str = cnp_vechi or angajat.cnp
+    with conexiune() as baza:
+        if operatie == "adaugare":
+            baza.execute(
+                f"INSERT INTO angajati ({', '.join(_coloane)}) VALUES ({', '.join('?' * len(_coloane))})",
+                [getattr(angajat, coloana) for coloana in _coloane],
+            )
+        elif operatie == "modificare":
+            baza.execute(
+                f"UPDATE angajati SET {', '.join(f'{coloana} = ?' for coloana in _coloane)} WHERE cnp = ?",
+                [getattr(angajat, coloana) for coloana in _coloane] + [cnp],
+            )
+        elif operatie == "stergere":
+            baza.execute("DELETE FROM angajati WHERE cnp = ?", (cnp,))
+
+
+def cauta_dupa_cnp(cnp: str) -> Angajat | None:
+    """
+    Cauta un angajat dupa CNP folosind indexul unic.
+
+    Args:
+        cnp (str): CNP-ul cautat.
+
+    Returns:
+        Angajat | None: Angajatul gasit sau None.
+    """
+    rand = conexiune().execute(f"SELECT {', '.join(_coloane)} FROM angajati WHERE cnp = ?", (cnp,)).fetchone()
+    return _rand_in_angajat(rand) if rand is not None else None
+
+
+def angajati_din_departament(departament: str) -> list[Angajat]:
+    """
+    Returneaza angajatii unui departament folosind indexul pe departament.
+
+    Args:
+        departament (str): Numele departamentului (uppercase).
+
+    Returns:
+        list[Angajat]: Angajatii din departament, in ordinea adaugarii.
+    """
+    randuri = conexiune().execute(
+        f"SELECT {', '.join(_coloane)} FROM angajati WHERE departament = ? ORDER BY pozitie", (departament,)
+    )
+    return [_rand_in_angajat(rand) for rand in randuri]
+
+
+def angajati_cu_senioritate(senioritate: str) -> list[Angajat]:
+    """
+    Returneaza angajatii cu un nivel de senioritate folosind indexul pe senioritate.
+
+    Args:
+        senioritate (str): Nivelul cautat (junior/mid/senior).
+
+    Returns:
+        list[Angajat]: Angajatii gasiti, in ordinea adaugarii.
+    """
+    randuri = conexiune().execute(
+        f"SELECT {', '.join(_coloane)} FROM angajati WHERE senioritate = ? ORDER BY pozitie", (senioritate,)
+    )
+    return [_rand_in_angajat(rand) for rand in randuri]
+
+
+def angajati_in_interval(coloana: str, minim: float, maxim: float, departament: str | None = None) -> list[Angajat]:
+    """
+    Returneaza angajatii cu 'salar' sau 'varsta' in [minim, maxim], folosind indexul coloanei.
+
+    Args:
+        coloana (str): "salar" sau "varsta".
+        minim (float): Capatul de jos (inclusiv; -inf = fara limita).
+        maxim (float): Capatul de sus (inclusiv; inf = fara limita).
+        departament (str | None): Departamentul filtrat sau None pentru toti.
+
+    Returns:
+        list[Angajat]: Angajatii gasiti, crescator dupa coloana.
+
+    Raises:
+        ValueError: Daca coloana nu are index de interval.
+    """
+    if coloana not in ("salar", "varsta"):
+        raise ValueError(f"coloana fara index de interval: {coloana}")
+    conditie: str = f"{coloana} BETWEEN ? AND ?"
+    parametri: list = [minim, maxim]
+    if departament is not None:
+        conditie += " AND departament = ?"
+        parametri.append(departament)
+    randuri = conexiune().execute(
+        f"SELECT {', '.join(_coloane)} FROM angajati WHERE {conditie} ORDER BY {coloana}, pozitie", parametri
+    )
+    return [_rand_in_angajat(rand) for rand in randuri]
+
+
+def departamente() -> set[str]:
+    """Returneaza multimea departamentelor existente (citita din index)."""
+    return {rand[0] for rand in conexiune().execute("SELECT DISTINCT departament FROM angajati")}
+
+
+def frecvente_salarii(departament: str | None = None) -> list[tuple[float, int]]:
+    """
+    Returneaza salariile distincte si numarul de angajati pentru fiecare (GROUP BY pe indexul de salar).
+
+    Args:
+        departament (str | None): Departamentul filtrat sau None pentru toata compania.
+
+    Returns:
+        list[tuple[float, int]]: Perechi (salariu brut, numar de angajati).
+    """
+    if departament is None:
+        randuri = conexiune().execute("SELECT salar, COUNT(*) FROM angajati GROUP BY salar")
+    else:
+        randuri = conexiune().execute("SELECT salar, COUNT(*) FROM angajati WHERE departament = ? GROUP BY salar", (departament,))
+    return [(rand[0], rand[1]) for rand in randuri]
+
+
+def actualizeaza_varste() -> int:
+    """
+    Recalculeaza din CNP coloana 'varsta' (varsta salvata imbatraneste odata cu datele).
+
+    Se citesc doar coloanele cnp si varsta; randurile schimbate sunt
+    actualizate intr-o singura tranzactie, deci interogarile pe interval de
+    varsta folosesc varsta de azi.
+
+    Returns:
+        int: Numarul de randuri actualizate.
+    """
+    baza: sqlite3.Connection = conexiune()
+    schimbate: list[tuple[int, str]] = []
+    for cnp, varsta in baza.execute("SELECT cnp, varsta FROM angajati"):
+        decodat = decodare_cnp.decodeaza(cnp)
+        if decodat is not None and decodat.varsta() != varsta:
+            schimbate.append((decodat.varsta(), cnp))
+    if schimbate:
+        with baza:
+            baza.executemany("UPDATE angajati SET varsta = ? WHERE cnp = ?", schimbate)
+    return len(schimbate)
+
+
+class RegistruSqlite(RegistruAngajati):
+    """
+    Registrul de angajati al modului "sqlite", citit direct din angajati.db.
+
+    Are aceeasi interfata ca RegistruAngajati, dar nu pastreaza angajatii in
+    memorie: cautarea dupa CNP, listarile pe departament si senioritate,
+    intervalele de salariu si varsta si totalurile sunt interogari indexate,
+    iar iterarea citeste tabela in flux, in ordinea adaugarii.
+
+    Metodele adauga / actualizeaza / sterge doar recalculeaza varsta din CNP;
+    randul este scris de incarcare_salvare (inregistreaza_modificare,
+    inregistreaza_adaugari), ca in celelalte moduri de stocare.
+
+    Exemple:
+        registru = RegistruSqlite()
+        registru.cauta("1800101400016"), registru.agregat_departament("IT").total_brut
+
+    Note:
+        - Obiectele Angajat sunt create la fiecare interogare; o modificare se
+          face pe obiectul primit de la cauta si se salveaza prin incarcare_salvare
+        - Indexul de nume (completare si cautare aproximativa) este construit la
+          prima cautare dupa nume si refacut dupa o modificare
+    """
+
+    def __init__(self) -> None:
+        actualizeaza_varste()
+        self._index_nume: IndexNume | None = None
+
+    def __iter__(self) -> Iterator[Angajat]:
+        randuri = conexiune().execute(f"SELECT {', '.join(_coloane)} FROM angajati ORDER BY pozitie")
+        return map(_rand_in_angajat, randuri)
+
+    def __len__(self) -> int:
+        return conexiune().execute("SELECT COUNT(*) FROM angajati").fetchone()[0]
+
+    def __bool__(self) -> bool:
+        return conexiune().execute("SELECT EXISTS (SELECT 1 FROM angajati)").fetchone()[0] == 1
+
+    def __contains__(self, cnp: str) -> bool:
+        return conexiune().execute("SELECT 1 FROM angajati WHERE cnp = ?", (cnp,)).fetchone() is not None
+
+    @property
+    def tabel(self) -> TabelAngajati:
+        """Tabelul columnar, construit la cerere dintr-o citire a tabelei."""
+        return TabelAngajati(self)
+
+    @property
+    def agregat_companie(self) -> AgregatSalarii:
+        """Totalurile salariale ale companiei (GROUP BY salar)."""
+        return AgregatSalarii.din_frecvente(frecvente_salarii())
+
+    def cauta(self, cnp: str) -> Angajat | None:
+        return cauta_dupa_cnp(cnp)
+
+    def departamente(self) -> set[str]:
+        return departamente()
+
+    def din_departament(self, departament: str) -> list[Angajat]:
+        return angajati_din_departament(departament)
+
+    def cu_senioritate(self, senioritate: str) -> list[Angajat]:
+        return angajati_cu_senioritate(senioritate)
+
+    def cu_salariu_intre(self, minim: float, maxim: float) -> list[Angajat]:
+        return angajati_in_interval("salar", minim, maxim)
+
+    def cu_varsta_intre(self, minim: int, maxim: int, departament: str | None = None) -> list[Angajat]:
+        return angajati_in_interval("varsta", minim, maxim, departament)
+
+    def _nume(self) -> IndexNume:
+        if self._index_nume is None:
+            self._index_nume = IndexNume()
+            for pozitie, nume, prenume in conexiune().execute("SELECT pozitie, nume, prenume FROM angajati"):
+                self._index_nume.adauga(nume, prenume, pozitie)
+        return self._index_nume
+
+    def _dupa_pozitii(self, pozitii: list[int]) -> list[Angajat]:
+        randuri = conexiune().execute(
+            f"SELECT pozitie, {', '.join(_coloane)} FROM angajati WHERE pozitie IN ({', '.join('?' * len(pozitii))})", pozitii
+        )
+        gasiti: dict[int, Angajat] = {rand[0]: _rand_in_angajat(rand[1:]) for rand in randuri}
+        return [gasiti[pozitie] for pozitie in pozitii if pozitie in gasiti]
+
+    def cu_nume_incepand(self, text: str, limita: int = 20) -> list[Angajat]:
+        return self._dupa_pozitii(self._nume().prefix(text, limita))
+
+    def cu_nume_asemanator(self, text: str, limita: int = 10) -> list[Angajat]:
+        return self._dupa_pozitii([pozitie for pozitie, _ in self._nume().aproximativ(text, limita)])
+
+    def agregat_departament(self, departament: str) -> AgregatSalarii:
+        return AgregatSalarii.din_frecvente(frecvente_salarii(departament))
+
+    def verifica_agregate(self) -> dict[str, list[str]]:
+        """Totalurile sunt calculate de interogari la fiecare citire, deci nu exista agregate de verificat."""
+        return {}
+
+    def adauga(self, angajat: Angajat) -> None:
+        angajat.varsta = decodare_cnp.varsta_angajat(angajat)
+        self._index_nume = None
+
+    def adauga_lot(self, angajati: list[Angajat]) -> None:
+        for angajat, varsta in zip(angajati, decodare_cnp.varste(angajati)):
+            angajat.varsta = varsta
+        self._index_nume = None
+
+    def actualizeaza(self, angajat: Angajat, vechi: Angajat) -> None:
+        angajat.varsta = decodare_cnp.varsta_angajat(angajat)
+        self._index_nume = None
+
+    def sterge(self, angajat: Angajat) -> None:
+        self._index_nume = None
+
+
+def inchide() -> None:
+    """Inchide conexiunea partajata (urmatorul apel al functiei conexiune o redeschide)."""
+    global _conexiune
+    if _conexiune is not None:
+        _conexiune.close()
+        _conexiune = None
+
+
+def migreaza(angajati: list[Angajat]) -> int:
+    """
+    Migreaza o singura data angajatii dati (instantaneul JSON cu jurnalul reaplicat) in baza de date.
+
+    Daca tabela contine deja angajati, migrarea nu se mai face. Daca migrarea
+    esueaza (ex: CNP duplicat in fisierul JSON), baza de date noua este stearsa,
+    ca sa fie reincercata dupa corectarea datelor.
+
+    Args:
+        angajati (list[Angajat]): Angajatii de migrat.
+
+    Returns:
+        int: Numarul de angajati migrati.
+
+    Raises:
+        sqlite3.Error: Daca angajatii nu pot fi scrisi (ex: sqlite3.IntegrityError la un CNP duplicat).
+    """
+    baza_noua: bool = not os.path.exists(nume_baza_date)
+    if not baza_noua and conexiune().execute("SELECT COUNT(*) FROM angajati").fetchone()[0]:
+        return 0
+    try:
+        salveaza_angajati(angajati)
+    except sqlite3.Error:
+        if baza_noua:
+            inchide()
+            os.remove(nume_baza_date)
+        raise
+    return len(angajati)
+
+
+if __name__ == "__main__":
+    import incarcare_salvare
+    try:
+        numar: int = migreaza(incarcare_salvare.citeste_date_salvate())
+        if numar:
+            stil.succes(f"Au fost migrati {numar} angajati in {nume_baza_date}")
+        else:
+            stil.atentionare(f"{nume_baza_date} contine deja angajati, migrarea nu a mai fost facuta")
+    except sqlite3.Error as eroare_migrare:
+        stil.eroare(f"Migrarea nu a putut fi facuta : {eroare_migrare}")
@@ -0,0 +1,111 @@
+"""
+Modulul tabel_angajati contine reprezentarea pe coloane (columnara) a
+angajatilor, folosita pentru calculele pe toata coloana de salarii.
+
+Coloanele numerice (salar, varsta) sunt pastrate in buffere array, iar
+departamentul si senioritatea sunt coduri intregi intr-o tabela mica de
+categorii. Fluturasii pe lot (salarizare.calculeaza_lot) si simularile
+(simulare) parcurg direct coloanele, fara cautari in dictionare pentru
+fiecare angajat. Totalurile pe companie si pe departament nu se calculeaza
+aici, ci sunt tinute la zi de RegistruAngajati (agregate).
+"""
+
+from array import array
+from typing import Iterable
+from angajat import Angajat
+
+
+class TabelAngajati:
+    """
+    Tabel columnar al angajatilor, sincronizat la adaugare, modificare si stergere.
+
+    Fiecare angajat ocupa un rand; la stergere, ultimul rand este mutat in
+    locul celui sters, deci coloanele raman compacte si stergerea este O(1).
+
+    Atribute:
+        salarii (array): Coloana salariilor brute ('d').
+        varste (array): Coloana varstelor ('l').
+        coduri_departament (array): Codul departamentului pentru fiecare rand ('L').
+        coduri_senioritate (array): Codul senioritatii pentru fiecare rand ('B').
+        departamente (list[str]): Tabela de categorii cod -> departament.
+        senioritati (list[str]): Tabela de categorii cod -> senioritate.
+    """
+
+    def __init__(self, angajati: Iterable[Angajat] = ()) -> None:
+        self.salarii: array = array("d")
+        self.varste: array = array("l")
+        self.coduri_departament: array = array("L")
+        self.coduri_senioritate: array = array("B")
+        self.departamente: list[str] = []
+        self.senioritati: list[str] = []
+        self._cod_departament: dict[str, int] = {}
+        self._cod_senioritate: dict[str, int] = {}
+        self._angajati: list[Angajat] = []
+        # id(angajat) -> rand; cheia nu depinde de CNP, deci o schimbare de CNP nu muta randul
+        self._rand: dict[int, int] = {}
+        for angajat in angajati:
+            self.adauga(angajat)
+
+    def __len__(self) -> int:
+        return len(self._angajati)
+
+    def cod_departament(self, departament: str) -> int:
+        """Returneaza codul departamentului, adaugandu-l in tabela daca este nou."""
+        cod: int | None = self._cod_departament.get(departament)
+        if cod is None:
+            cod = self._cod_departament[departament] = len(self.departamente)
+            self.departamente.append(departament)
+        return cod
+
+    def cod_senioritate(self, senioritate: str) -> int:
+        """Returneaza codul senioritatii, adaugand-o in tabela daca este noua."""
+        cod: int | None = self._cod_senioritate.get(senioritate)
+        if cod is None:
+            cod = self._cod_senioritate[senioritate] = len(self.senioritati)
+            self.senioritati.append(senioritate)
+        return cod
+
+    def adauga(self, angajat: Angajat) -> None:
+        """Adauga un rand nou la sfarsitul tabelului."""
+        self._rand[id(angajat)] = len(self._angajati)
+        self._angajati.append(angajat)
+        self.salarii.append(float(angajat.salar))
+        self.varste.append(int(angajat.varsta))
+        self.coduri_departament.append(self.cod_departament(angajat.departament))
+        self.coduri_senioritate.append(self.cod_senioritate(angajat.senioritate))
+
+    def adauga_lot(self, angajati: list[Angajat]) -> None:
+        """Adauga mai multe randuri la sfarsitul tabelului (fiecare coloana este extinsa o singura data)."""
+        inceput: int = len(self._angajati)
+        self._rand.update((id(angajat), inceput + pozitie) for pozitie, angajat in enumerate(angajati))
+        self._angajati.extend(angajati)
+        self.salarii.extend([float(angajat.salar) for angajat in angajati])
+        self.varste.extend([int(angajat.varsta) for angajat in angajati])
+        self.coduri_departament.extend([self.cod_departament(angajat.departament) for angajat in angajati])
+        self.coduri_senioritate.extend([self.cod_senioritate(angajat.senioritate) for angajat in angajati])
+
+    def actualizeaza(self, angajat: Angajat) -> None:
+        """Rescrie randul unui angajat dupa modificare (angajatul modificat in-place)."""
+        rand: int = self._rand[id(angajat)]
+        self.salarii[rand] = float(angajat.salar)
+        self.varste[rand] = int(angajat.varsta)
+        self.coduri_departament[rand] = self.cod_departament(angajat.departament)
+        self.coduri_senioritate[rand] = self.cod_senioritate(angajat.senioritate)
+
+    def sterge(self, angajat: Angajat) -> None:
+        """Sterge randul unui angajat, mutand ultimul rand in locul lui."""
+        rand: int = self._rand.pop(id(angajat))
+        ultimul: int = len(self._angajati) - 1
+        if rand != ultimul:
+            mutat: Angajat = self._angajati[ultimul]
+            self._angajati[rand] = mutat
+            self._rand[id(mutat)] = rand
+            self.salarii[rand] = self.salarii[ultimul]
+            self.varste[rand] = self.varste[ultimul]
+            self.coduri_departament[rand] = self.coduri_departament[ultimul]
+            self.coduri_senioritate[rand] = self.coduri_senioritate[ultimul]
+        self._angajati.pop()
+        self.salarii.pop()
+        self.varste.pop()
+        self.coduri_departament.pop()
+        self.coduri_senioritate.pop()
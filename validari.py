@@ -3,26 +3,273 @@
 Modulul validari contine toate functiile necesare pentru validarea datelor introduse de utilizator.
 Aceste functii asigură ca datele introduse (CNP, nume, varsta, salariu, etc.) respecta formatul corect
 inainte de a fi procesate sau salvate in sistem.
+
+Validarile au doua niveluri:
+- verificarile silentioase (verifica_cnp, verifica_nume, ...) nu afiseaza nimic
+  si returneaza None sau o EroareValidare cu un cod stabil (ex: "cnp_lungime");
+  valideaza_coloane verifica dintr-o data coloane intregi de valori (ex: la un
+  import in masa)
+- functiile interactive (cnp_validare, validare_nume, ...) folosesc verificarile
+  silentioase si afiseaza mesajul erorii prin stil, ca inainte
 """
+from array import array
+from typing import Sequence
 import stil
-salariu_minim: int = 4050
+import salarizare
+import decodare_cnp
 aceptare_nivel: list[str] = ["junior","mid","senior"]
+lungime_cnp: int = 13
+varsta_minima: int = 18
+
+
+def salariu_minim() -> int:
+    """Returneaza salariul minim din regulile de salarizare in vigoare acum (citit la fiecare apel)."""
+    return salarizare.regula_curenta().salariu_minim
+
+# cod eroare -> (nivel afisare, mesaj); {valoare} este valoarea gresita, {minim} limita incalcata
+sabloane_erori: dict[str, tuple[str, str]] = {
+    "cnp_caractere": ("eroare", "CNP-ul contine caractere nepermise (litere/simboluri)."),
+    "cnp_lungime": ("eroare", "Lungime incorecta. Trebuie {minim} cifre, ai introdus -> {valoare}"),
+    "cnp_sex": ("eroare", "Prima cifra a CNP-ului (sex/secol) nu poate fi 0, ai introdus -> {valoare}"),
+    "cnp_data": ("eroare", "CNP-ul nu contine o data de nastere valida, ai introdus -> {valoare}"),
+    "cnp_judet": ("eroare", "Codul de judet din CNP (cifrele 8-9) nu exista, ai introdus -> {valoare}"),
+    "cnp_control": ("eroare", "Cifra de control a CNP-ului este gresita, ai introdus -> {valoare}"),
+    "nume_caractere": ("eroare", "Textul contine carcatere nepermise (cifre sau simboluri) , ai introdus -> {valoare}"),
+    "nume_scurt": ("atentionare", "Textul este prea scurt ( minim {minim} litere), ai introdus ->  {valoare}"),
+    "varsta_numar": ("eroare", "Varsta trebuie sa fie un numar valid , detalii -> {valoare}"),
+    "varsta_minima": ("atentionare", "Varsta trebuie sa fie peste {minim} ani , ai introdus -> {valoare} ani"),
+    "salariu_numar": ("eroare", " Salariu trebuie sa fie un numar valid! Detalii: {valoare})"),
+    "salariu_minim": ("eroare", " Salariul trebuie sa fie mai mare de {minim} RON! ai introdus -> {valoare} RON "),
+    "departament_scurt": ("atentionare", " Numele departamentului este prea scurt tu ai introdus {valoare}{galben}{bold} caracter {reset} "),
+    "departament_caractere": ("eroare", " Departamentul nu poate contine caractere speciale , poate sa contina doar litere/cifre"),
+    "senioritate_necunoscuta": ("eroare", "Senioritatea trebuie sa fie una din cele disponibile {minim}."),
+}
 
-def cnp_validare(cnp: str) -> bool:
+
+class EroareValidare:
     """
-    Verifica daca un CNP introdus are formatul corect si afiseaza erori specifice.
+    Rezultatul unei verificari esuate: un cod stabil, plus datele necesare mesajului.
+
+    Exemple:
+        verifica_cnp("123")  -> EroareValidare("cnp_lungime", 3, 13)
+        eroare.text()        -> "Lungime incorecta. Trebuie 13 cifre, ai introdus -> 3"
+        eroare.afiseaza()    -> acelasi mesaj, colorat, prin stil.eroare
+
+    Atribute:
+        cod (str): Codul erorii, cheie in 'sabloane_erori'.
+        valoare: Valoarea gresita (sau detaliul ei, ex: lungimea CNP-ului).
+        minim: Limita incalcata (ex: salariul minim), daca exista.
+    """
+
+    __slots__ = ("cod", "valoare", "minim")
+
+    def __init__(self, cod: str, valoare=None, minim=None) -> None:
+        self.cod: str = cod
+        self.valoare = valoare
+        self.minim = minim
+
+    def __repr__(self) -> str:
+        return f"EroareValidare({self.cod!r}, {self.valoare!r}, {self.minim!r})"
+
+    def __eq__(self, alta: object) -> bool:
+        return isinstance(alta, EroareValidare) and (self.cod, self.valoare, self.minim) == (alta.cod, alta.valoare, alta.minim)
+
+    def text(self, colorat: bool = False) -> str:
+        """Returneaza mesajul erorii (fara culori, daca 'colorat' este False)."""
+        sablon: str = sabloane_erori[self.cod][1]
+        if colorat:
+            return sablon.format(valoare=stil.evidentiaza(self.valoare), minim=self.minim, galben=stil.GALBEN, bold=stil.BOLD, reset=stil.RESET)
+        return " ".join(sablon.format(valoare=self.valoare, minim=self.minim, galben="", bold="", reset="").split())
+
+    def afiseaza(self) -> None:
+        """Afiseaza mesajul erorii prin stil (eroare sau atentionare, dupa cod)."""
+        if sabloane_erori[self.cod][0] == "atentionare":
+            stil.atentionare(self.text(colorat=True))
+        else:
+            stil.eroare(self.text(colorat=True))
+
+
+def verifica_cnp(cnp: str, strict: bool = False) -> EroareValidare | None:
+    """
+    Verifica formatul unui CNP (doar cifre, 13 caractere), fara a afisa nimic.
+
+    Cu 'strict' se verifica si continutul (modulul decodare_cnp): cifra de
+    sex/secol, data nasterii, codul judetului si cifra de control. Verificarea
+    stricta se aplica doar CNP-urilor noi; cautarile dupa CNP accepta si
+    CNP-urile vechi, salvate inainte de aceasta verificare.
     """
     if not cnp.isdigit():
-        stil.eroare("CNP-ul contine caractere nepermise (litere/simboluri).")
-        return False
-    
-    if len(cnp) != 13:
-        stil.eroare(f"Lungime incorecta. Trebuie 13 cifre, ai introdus -> {stil.evidentiaza(len(cnp))}")
-        return False
-    
-    return True
+        return EroareValidare("cnp_caractere", cnp)
+    if len(cnp) != lungime_cnp:
+        return EroareValidare("cnp_lungime", len(cnp), lungime_cnp)
+    if strict:
+        cod: str | None = decodare_cnp.analizeaza(cnp)[1]
+        if cod is not None:
+            return EroareValidare(cod, cnp)
+    return None
+
+
+def verifica_nume(text: str) -> EroareValidare | None:
+    """Verifica un nume sau prenume (litere, spatii, cratime; minim 3 caractere), fara a afisa nimic."""
+    text = text.strip().title()
+    for caractere in text:
+        if not (caractere.isalpha() or caractere == " " or caractere == "-"):
+            return EroareValidare("nume_caractere", text)
+    if len(text) < 3:
+        return EroareValidare("nume_scurt", len(text), 3)
+    return None
+
+
+def verifica_varsta(varsta: str) -> EroareValidare | None:
+    """Verifica daca varsta este un numar intreg de cel putin 18, fara a afisa nimic."""
+    try:
+        valoare: int = int(varsta)
+    except ValueError as erroare:
+        return EroareValidare("varsta_numar", str(erroare))
+    if valoare < varsta_minima:
+        return EroareValidare("varsta_minima", valoare, varsta_minima)
+    return None
+
+
+def verifica_salariu(salar: str, minim: int | None = None) -> EroareValidare | None:
+    """Verifica daca salariul este un numar intreg de cel putin 'minim' (implicit salariu_minim()), fara a afisa nimic."""
+    minim = salariu_minim() if minim is None else minim
+    try:
+        valoare: int = int(salar)
+    except ValueError as erroare:
+        return EroareValidare("salariu_numar", str(erroare))
+    if valoare < minim:
+        return EroareValidare("salariu_minim", valoare, minim)
+    return None
+
 
-def cere_cnp_valid() -> str:
+def verifica_departament(departament: str) -> EroareValidare | None:
+    """Verifica numele unui departament (litere/cifre, minim 2 caractere), fara a afisa nimic."""
+    if len(departament) < 2:
+        return EroareValidare("departament_scurt", len(departament), 2)
+    if not departament.isalnum():
+        return EroareValidare("departament_caractere", departament)
+    return None
+
+
+def verifica_senioritate(senioritate: str) -> EroareValidare | None:
+    """Verifica daca senioritatea este una din 'aceptare_nivel' (fara diferenta intre litere mari/mici)."""
+    if senioritate.lower() in aceptare_nivel:
+        return None
+    return EroareValidare("senioritate_necunoscuta", senioritate, aceptare_nivel)
+
+
+def verifica_cnp_uri(cnp_uri: Sequence[str], strict: bool = False) -> list[EroareValidare | None]:
+    """
+    Verifica formatul unei coloane intregi de CNP-uri.
+
+    Cazul obisnuit (toate CNP-urile corecte) este verificat dintr-o data, cu
+    operatii pe tot textul coloanei (o singura concatenare, isdigit si lungimi);
+    doar daca exista greseli se verifica fiecare CNP in parte. Cu 'strict',
+    coloana este apoi decodata intr-o singura trecere (decodare_cnp, cu cache).
+
+    Args:
+        cnp_uri (Sequence[str]): CNP-urile de verificat.
+        strict (bool): Verifica si cifra de control, data nasterii, judetul si sexul.
+
+    Returns:
+        list[EroareValidare | None]: Cate un rezultat pentru fiecare CNP, in ordine.
+    """
+    text: str = "".join(cnp_uri)
+    if not (text.isdigit() and len(text) == lungime_cnp * len(cnp_uri) and all(lungime == lungime_cnp for lungime in map(len, cnp_uri))):
+        return [verifica_cnp(cnp, strict) for cnp in cnp_uri]
+    if not strict:
+        return [None] * len(cnp_uri)
+    return [None if cod is None else EroareValidare(cod, cnp) for cnp, (_, cod) in zip(cnp_uri, map(decodare_cnp.analizeaza, cnp_uri))]
+
+
+def verifica_salarii(salarii: Sequence[str] | array, minim: int | None = None) -> list[EroareValidare | None]:
+    """
+    Verifica o coloana intreaga de salarii fata de salariul minim.
+
+    Textele sunt convertite dintr-o data (map(int, ...)); un array numeric
+    (ex: array('d') din tabel_angajati) este comparat direct. Daca o valoare
+    nu este un numar, se revine la verificarea fiecarei valori.
+
+    Args:
+        salarii (Sequence[str] | array): Salariile de verificat.
+        minim (int | None): Salariul minim (implicit salariu_minim()).
+
+    Returns:
+        list[EroareValidare | None]: Cate un rezultat pentru fiecare salariu, in ordine.
+    """
+    minim = salariu_minim() if minim is None else minim
+    if isinstance(salarii, array):
+        valori: Sequence = salarii
+    else:
+        try:
+            valori = list(map(int, salarii))
+        except ValueError:
+            return [verifica_salariu(str(salar), minim) for salar in salarii]
+    return [None if valoare >= minim else EroareValidare("salariu_minim", valoare, minim) for valoare in valori]
+
+
+# camp -> verificarea unei coloane intregi de valori
+verificari_coloane: dict = {
+    "cnp": verifica_cnp_uri,
+    "nume": lambda valori: list(map(verifica_nume, valori)),
+    "prenume": lambda valori: list(map(verifica_nume, valori)),
+    "varsta": lambda valori: list(map(verifica_varsta, valori)),
+    "salar": verifica_salarii,
+    "departament": lambda valori: list(map(verifica_departament, valori)),
+    "senioritate": lambda valori: list(map(verifica_senioritate, valori)),
+}
+
+
+def valideaza_coloane(coloane: dict[str, Sequence], cnp_strict: bool = False) -> dict[int, list[tuple[str, EroareValidare]]]:
+    """
+    Valideaza mai multe inregistrari dintr-o data, camp cu camp (pe coloane), fara a afisa nimic.
+
+    Exemple:
+        valideaza_coloane({"cnp": ["1234567890123", "12"], "salar": ["5000", "100"]})
+        -> {1: [("cnp", EroareValidare("cnp_lungime", 2, 13)),
+                ("salar", EroareValidare("salariu_minim", 100, 4050))]}
+
+    Args:
+        coloane (dict[str, Sequence]): Camp -> valorile campului pentru toate
+                                       inregistrarile (aceeasi lungime, aceeasi ordine).
+                                       Campurile fara verificare sunt ignorate.
+        cnp_strict (bool): Verifica si continutul CNP-urilor (vezi verifica_cnp), pentru CNP-uri noi.
+
+    Returns:
+        dict[int, list[tuple[str, EroareValidare]]]: Pozitia inregistrarii -> erorile
+            ei (camp, eroare); inregistrarile valide lipsesc din dictionar.
+    """
+    erori: dict[int, list[tuple[str, EroareValidare]]] = {}
+    for camp, valori in coloane.items():
+        verificare = verificari_coloane.get(camp)
+        if verificare is None:
+            continue
+        rezultate: list[EroareValidare | None] = verifica_cnp_uri(valori, cnp_strict) if camp == "cnp" else verificare(valori)
+        for pozitie, eroare in enumerate(rezultate):
+            if eroare is not None:
+                erori.setdefault(pozitie, []).append((camp, eroare))
+    return erori
+
+
+def _afiseaza_daca_exista(eroare: EroareValidare | None) -> bool:
+    """Afiseaza eroarea (daca exista) si returneaza True daca valoarea este valida."""
+    if eroare is None:
+        return True
+    eroare.afiseaza()
+    return False
+
+
+def cnp_validare(cnp: str, strict: bool = False) -> bool:
+    """
+    Verifica daca un CNP introdus are formatul corect si afiseaza erori specifice.
+
+    Cu 'strict' (CNP-uri noi) se verifica si cifra de control, data nasterii,
+    judetul si cifra de sex/secol.
+    """
+    return _afiseaza_daca_exista(verifica_cnp(cnp, strict))
+
+def cere_cnp_valid(strict: bool = False) -> str:
     """
     Cere utilizatorului sa introduca un CNP valid si continua sa il intrebe pana cand
     acesta introduce un CNP corect sau alege sa revina la meniu.
@@ -33,6 +280,10 @@ def cere_cnp_valid() -> str:
     
     Utilizatorul poate introduce '0' in orice moment pentru a reveni la meniul principal.
     
+    Args:
+        strict (bool): Pentru un CNP nou, verifica si cifra de control, data
+                       nasterii, judetul si cifra de sex/secol.
+    
     Returns:
         str: CNP-ul validat (13 cifre) sau '0' daca utilizatorul doreste sa revina la meniu.
         
@@ -46,7 +297,7 @@ def cere_cnp_valid() -> str:
         if cnp == "0":
             return "0"
         
-        if cnp_validare(cnp):
+        if cnp_validare(cnp, strict):
             return cnp
 
 
@@ -78,18 +329,7 @@ def validare_nume(text: str) -> bool:
         Functia afiseaza mesaje de eroare descriptive pentru a ajuta utilizatorul
         sa inteleaga de ce numele introdus nu este acceptat.
     """
-    text = text.strip().title()
-   
-    for caractere in text:
-        if not (caractere.isalpha() or caractere == " " or caractere == "-"):
-            stil.eroare(f"Textul contine carcatere nepermise (cifre sau simboluri) , ai introdus -> {stil.evidentiaza(text)}")
-            return False
-        
-    if len(text) < 3:
-        stil.atentionare(f"Textul este prea scurt ( minim 3 litere), ai introdus ->  {stil.evidentiaza(len(text))}")
-        return False
-    
-    return True
+    return _afiseaza_daca_exista(verifica_nume(text))
 
 def varsta_validare(varsta: str) -> bool:
     """
@@ -114,23 +354,15 @@ def varsta_validare(varsta: str) -> bool:
         Functia gestioneaza exceptiile ValueError pentru cazurile cand utilizatorul
         introduce text in loc de numere.
     """
-    try:
-        varsta: int = int(varsta)
-        if varsta >= 18:
-            return True
-        else:
-            stil.atentionare(f"Varsta trebuie sa fie peste 18 ani , ai introdus -> {stil.evidentiaza(varsta)} ani")
-    except ValueError as erroare:
-        stil.eroare(f"Varsta trebuie sa fie un numar valid , detalii -> {stil.evidentiaza(erroare)}")
-        return False
-    
+    return _afiseaza_daca_exista(verifica_varsta(varsta))
 
 
 def salariu_validare(salar: str) -> bool:
     """
     Verifica daca salariul introdus este un numar valid si respecta salariul minim legal.
     
-    Salariul minim este definit in constanta 'salariu_minim' (implicit 4050 RON).
+    Salariul minim este citit la fiecare verificare din regulile de
+    salarizare in vigoare (salariu_minim(), adica salarizare.regula_curenta()).
     Functia verifica:
     - Daca input-ul poate fi convertit la numar intreg
     - Daca valoarea este mai mare sau egala cu salariul minim
@@ -144,23 +376,14 @@ def salariu_validare(salar: str) -> bool:
         salar (str): Salariul introdus de utilizator ca sir de caractere.
         
     Returns:
-        bool: True daca salariul este valid (>= salariu_minim), False in caz de eroare.
+        bool: True daca salariul este valid (>= salariu_minim()), False in caz de eroare.
         
     Note:
         Mesajele de eroare includ valoarea salariului minim curent pentru a ghida
         utilizatorul catre o valoare acceptabila.
     """
-    try:
-        valoare: int = int(salar)
-        if valoare >= salariu_minim:
-            return True
-        else:
-            stil.eroare(f" Salariul trebuie sa fie mai mare de {salariu_minim} RON! ai introdus -> {stil.evidentiaza(valoare)} RON ")
-            return False 
-    except ValueError as erroare:
-        stil.eroare(f" Salariu trebuie sa fie un numar valid! Detalii: {stil.evidentiaza(erroare)})")
-        return False
-    
+    return _afiseaza_daca_exista(verifica_salariu(salar))
+
 def departament_validare(departament: str) -> bool:
     """
     Verifica daca numele departamentului introdus este valid.
@@ -184,14 +407,7 @@ def departament_validare(departament: str) -> bool:
     Note:
         Departamentele sunt stocate in format uppercase pentru consistenta.
     """
-    if len(departament) < 2:
-        stil.atentionare(f" Numele departamentului este prea scurt tu ai introdus {stil.evidentiaza(len(departament))}{stil.GALBEN}{stil.BOLD} caracter {stil.RESET} ")
-        return False    
-    if not departament.isalnum():
-        stil.eroare(f" Departamentul nu poate contine caractere speciale , poate sa contina doar litere/cifre")
-        return False
-
-    return True
+    return _afiseaza_daca_exista(verifica_departament(departament))
 
 def senior_validare(senioritate: str) -> bool:
     """
@@ -218,5 +434,6 @@ def senior_validare(senioritate: str) -> bool:
     Note:
         Functia converteste input-ul la lowercase inainte de comparatie pentru
         a permite utilizatorului sa scrie cu majuscule sau minuscule.
+        Nu afiseaza nimic; apelantii isi afiseaza propriul mesaj.
     """
-    return senioritate.lower() in aceptare_nivel
+    return verifica_senioritate(senioritate) is None